@@ -0,0 +1,102 @@
+"""Shared A1 cell- and range-reference parsing for adapters.
+
+Every adapter resolves ``"B7"``-style references on the per-cell hot path,
+and ``"A1:C3"`` ranges for merges, conditional formats and bulk reads.
+References are parsed with a single forward scan (no regex) and memoized,
+since benchmark loops touch the same small set of addresses repeatedly.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1 << 16)
+def cell_to_coord(cell: str) -> tuple[int, int]:
+    """Parse a cell reference like 'A1' to (row_1based, col_1based).
+
+    Only the leading ``[A-Z]+[0-9]+`` prefix is consumed (case-insensitive);
+    anything after it is ignored, matching the historical regex behaviour.
+    ``$`` anchors (``$A$1``) are accepted and ignored.
+    """
+    # One pass over the ASCII bytes: fold a-z to A-Z with ``& 0xDF`` and
+    # accumulate column and row as integers (no upper(), slicing or int()).
+    ref = cell.encode("ascii", "replace")
+    n = len(ref)
+    i = 1 if n and ref[0] == 36 else 0  # "$"
+    start = i
+    col = 0
+    while i < n and 65 <= (ref[i] & 0xDF) <= 90:
+        col = col * 26 + (ref[i] & 0xDF) - 64
+        i += 1
+    if i == start:
+        raise ValueError(f"Invalid cell reference: {cell}")
+    if i < n and ref[i] == 36:
+        i += 1
+    j = i
+    row = 0
+    while j < n and 48 <= ref[j] <= 57:
+        row = row * 10 + ref[j] - 48
+        j += 1
+    if j == i:
+        raise ValueError(f"Invalid cell reference: {cell}")
+    return row, col
+
+
+@lru_cache(maxsize=1 << 16)
+def parse_cell_ref(cell: str) -> tuple[int, int]:
+    """Parse a cell reference like 'A1' to (row_0based, col_0based)."""
+    row, col = cell_to_coord(cell)
+    return row - 1, col - 1
+
+
+@lru_cache(maxsize=1 << 14)
+def column_letter(col: int) -> str:
+    """Format a 0-based column index as letters (e.g. 27 -> 'AB')."""
+    n = col + 1
+    letters = ""
+    while n:
+        n, rem = divmod(n - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+@lru_cache(maxsize=1 << 14)
+def column_index(letters: str) -> int:
+    """Parse column letters to a 0-based index (e.g. 'AB' -> 27); inverse of column_letter."""
+    col = 0
+    for b in letters.encode("ascii", "replace"):
+        b &= 0xDF
+        if not 65 <= b <= 90:
+            raise ValueError(f"Invalid column letters: {letters}")
+        col = col * 26 + b - 64
+    if not col:
+        raise ValueError(f"Invalid column letters: {letters}")
+    return col - 1
+
+
+@lru_cache(maxsize=1 << 16)
+def coord_to_a1(row: int, col: int) -> str:
+    """Format 0-based (row, col) as an A1 reference (e.g. (0, 27) -> 'AB1')."""
+    return f"{column_letter(col)}{row + 1}"
+
+
+@lru_cache(maxsize=4096)
+def range_bounds(cell_range: str) -> tuple[int, int, int, int]:
+    """Parse 'A1:C3' (or a single cell) to 0-based inclusive (r0, c0, r1, c1).
+
+    ``$`` anchors are ignored and reversed corners are normalized, so the
+    result always satisfies ``r0 <= r1`` and ``c0 <= c1``.
+    """
+    a, _, b = cell_range.replace("$", "").partition(":")
+    r0, c0 = parse_cell_ref(a)
+    if not b:
+        return r0, c0, r0, c0
+    r1, c1 = parse_cell_ref(b)
+    return min(r0, r1), min(c0, c1), max(r0, r1), max(c0, c1)
+
+
+@lru_cache(maxsize=4096)
+def format_range(r0: int, c0: int, r1: int, c1: int) -> str:
+    """Format 0-based inclusive bounds as an A1 range (e.g. (0, 0, 2, 1) -> 'A1:B3')."""
+    return f"{coord_to_a1(r0, c0)}:{coord_to_a1(r1, c1)}"
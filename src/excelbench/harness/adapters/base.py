@@ -1,9 +1,27 @@
 """Base adapter protocol for Excel libraries."""
 
+import asyncio
+import os
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-
+from typing import Any, BinaryIO, ClassVar, NoReturn
+
+from excelbench.harness.adapters.a1 import column_letter, coord_to_a1, range_bounds
+from excelbench.harness.adapters.soa import (
+    SoABlock,
+    StringPool,
+    cells_to_soa,
+    range_origin,
+    soa_mismatch_indices,
+)
+from excelbench.harness.adapters.streaming import STREAM_WRITE, StreamWriter
 from excelbench.models import (
     BorderInfo,
     CellFormat,
@@ -12,29 +30,89 @@ from excelbench.models import (
     DiagnosticCategory,
     DiagnosticLocation,
     DiagnosticSeverity,
+    LazyMessage,
     LibraryInfo,
+    OpenOptions,
     OperationType,
 )
 
 JSONDict = dict[str, Any]
 
+_MISMATCH_PROBABLE_CAUSE = "Adapter returned a value that differs from benchmark expectations."
+
+# Enum members resolved once at import; the diagnostic helpers below run per
+# failure and would otherwise repeat the class attribute lookup every time.
+_PARSE = DiagnosticCategory.PARSE
+_FILE_IO = DiagnosticCategory.FILE_IO
+_INVALID_INPUT = DiagnosticCategory.INVALID_INPUT
+_UNSUPPORTED = DiagnosticCategory.UNSUPPORTED_FEATURE
+_INTERNAL = DiagnosticCategory.INTERNAL
+_DATA_MISMATCH = DiagnosticCategory.DATA_MISMATCH
+_ERROR = DiagnosticSeverity.ERROR
+_WARNING = DiagnosticSeverity.WARNING
+
+# Severity depends only on the category, so resolve it once per category
+# instead of re-deriving it on every diagnostic.
+_SEVERITY_BY_CATEGORY: dict[DiagnosticCategory, DiagnosticSeverity] = {
+    category: _WARNING if category is _UNSUPPORTED else _ERROR for category in DiagnosticCategory
+}
+
+
+# Leading bytes of each input container, used by ExcelAdapter.quick_probe().
+_ZIP_MAGIC = b"PK\x03\x04"
+_OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+_MAGIC_BY_SUFFIX: dict[str, bytes] = {
+    ".xlsx": _ZIP_MAGIC,
+    ".xlsm": _ZIP_MAGIC,
+    ".xlsb": _ZIP_MAGIC,
+    ".ods": _ZIP_MAGIC,
+    ".xls": _OLE_MAGIC,
+}
+
+
+@lru_cache(maxsize=4096)
+def _suffix_of(path: str) -> str:
+    """Lowercased file extension (with dot) of *path*, memoized per path string."""
+    return os.path.splitext(path)[1].lower()
+
+
+def _cache_info(fget: Callable[[Any], LibraryInfo]) -> property:
+    """Wrap an ``info`` getter so it is built once and shared by all instances.
+
+    Every adapter's info is static for the life of the process (library
+    version and capabilities), but ``name``/``capabilities``/``can_*`` read
+    it on every call. The result is shared, so treat it as read-only.
+    """
+    cached: list[LibraryInfo] = []
+
+    def info(self: Any) -> LibraryInfo:
+        if not cached:
+            cached.append(fget(self))
+        return cached[0]
+
+    info.__doc__ = fget.__doc__
+    return property(info)
+
 
 def _infer_diagnostic_category(exc: Exception) -> DiagnosticCategory:
-    name = type(exc).__name__.lower()
-    message = str(exc).lower()
-    if isinstance(exc, (FileNotFoundError, PermissionError, IsADirectoryError, OSError)):
+    # Type checks first: str(exc) can be costly for library exceptions, so the
+    # message is only rendered for branches that actually inspect it.
+    # (FileNotFoundError, PermissionError and IsADirectoryError are OSErrors.)
+    if isinstance(exc, OSError):
+        message = str(exc).lower()
         if "format" in message or "zip" in message or "corrupt" in message:
-            return DiagnosticCategory.PARSE
-        return DiagnosticCategory.FILE_IO
+            return _PARSE
+        return _FILE_IO
     if isinstance(exc, (ValueError, TypeError, KeyError)):
-        return DiagnosticCategory.INVALID_INPUT
+        return _INVALID_INPUT
     if isinstance(exc, NotImplementedError):
-        return DiagnosticCategory.UNSUPPORTED_FEATURE
+        return _UNSUPPORTED
+    message = str(exc).lower()
     if "not supported" in message or "unsupported" in message:
-        return DiagnosticCategory.UNSUPPORTED_FEATURE
-    if "parse" in name or "parse" in message:
-        return DiagnosticCategory.PARSE
-    return DiagnosticCategory.INTERNAL
+        return _UNSUPPORTED
+    if "parse" in message or "parse" in type(exc).__name__.lower():
+        return _PARSE
+    return _INTERNAL
 
 
 class ExcelAdapter(ABC):
@@ -42,12 +120,23 @@ class ExcelAdapter(ABC):
 
     Each adapter wraps a specific Excel library and provides a
     unified interface for reading and writing cell data.
+
+    Adapters are slotted: subclasses should declare ``__slots__`` (empty,
+    or naming their instance state) or they silently regain a ``__dict__``.
     """
 
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        prop = cls.__dict__.get("info")
+        if isinstance(prop, property) and prop.fget and not prop.__isabstractmethod__:
+            setattr(cls, "info", _cache_info(prop.fget))
+
     @property
     @abstractmethod
     def info(self) -> LibraryInfo:
-        """Get information about this library."""
+        """Get information about this library (computed once per adapter class)."""
         ...
 
     @property
@@ -68,21 +157,59 @@ class ExcelAdapter(ABC):
         """Check if this adapter supports writing."""
         return "write" in self.capabilities
 
+    def can_stream_write(self) -> bool:
+        """Check if this adapter provides begin_streaming_write()."""
+        return STREAM_WRITE in self.capabilities
+
     @property
     def output_extension(self) -> str:
         """File extension for written output (default '.xlsx')."""
         return ".xlsx"
 
-    @property
-    def supported_read_extensions(self) -> set[str]:
-        """File extensions this adapter can consume as benchmark inputs."""
-        return {".xlsx"}
+    # File extensions (lowercase, with dot) this adapter can consume as benchmark inputs.
+    supported_read_extensions: ClassVar[frozenset[str]] = frozenset({".xlsx"})
+
+    # When a fixture exists in several formats, read the earliest listed one
+    # this adapter supports. Binary XLSB skips XML parsing entirely.
+    preferred_read_extensions: ClassVar[tuple[str, ...]] = (".xlsb", ".xlsx")
 
-    def supports_read_path(self, path: Path) -> bool:
+    def supports_read_path(self, path: Path | str) -> bool:
         """Return whether this adapter supports reading the given file path."""
-        suffix = path.suffix.lower()
-        return suffix in self.supported_read_extensions
+        return _suffix_of(os.fspath(path)) in self.supported_read_extensions
 
+    def pick_read_path(self, path: Path) -> Path:
+        """Return a preferred same-stem sibling of *path*, or *path* itself.
+
+        Only formats ranked ahead of *path*'s own extension in
+        preferred_read_extensions are considered, and only if this adapter
+        supports them and the sibling file exists.
+        """
+        suffix = _suffix_of(os.fspath(path))
+        for ext in self.preferred_read_extensions:
+            if ext == suffix:
+                break
+            if ext in self.supported_read_extensions:
+                candidate = path.with_suffix(ext)
+                if candidate.is_file():
+                    return candidate
+        return path
+
+    @classmethod
+    def quick_probe(cls, path: Path | str) -> bool:
+        """Cheaply check that a file starts with the container signature its suffix implies.
+
+        Reads only the first few bytes (ZIP for .xlsx/.xlsm, OLE2 for .xls), so
+        obviously corrupt or mislabelled inputs can be rejected without a full
+        open. Unknown suffixes are not rejected.
+        """
+        magic = _MAGIC_BY_SUFFIX.get(_suffix_of(os.fspath(path)))
+        if magic is None:
+            return True
+        try:
+            with open(path, "rb") as fh:
+                return fh.read(len(magic)) == magic
+        except OSError:
+            return False
 
     def map_error_to_diagnostic(
         self,
@@ -97,14 +224,9 @@ class ExcelAdapter(ABC):
     ) -> Diagnostic:
         """Normalize adapter/runtime exceptions into a typed diagnostic."""
         category = _infer_diagnostic_category(exc)
-        severity = (
-            DiagnosticSeverity.WARNING
-            if category == DiagnosticCategory.UNSUPPORTED_FEATURE
-            else DiagnosticSeverity.ERROR
-        )
         return Diagnostic(
             category=category,
-            severity=severity,
+            severity=_SEVERITY_BY_CATEGORY[category],
             location=DiagnosticLocation(
                 feature=feature,
                 operation=operation,
@@ -129,8 +251,8 @@ class ExcelAdapter(ABC):
     ) -> Diagnostic:
         """Create a normalized diagnostic for failed expected-vs-actual comparisons."""
         return Diagnostic(
-            category=DiagnosticCategory.DATA_MISMATCH,
-            severity=DiagnosticSeverity.ERROR,
+            category=_DATA_MISMATCH,
+            severity=_ERROR,
             location=DiagnosticLocation(
                 feature=feature,
                 operation=operation,
@@ -138,23 +260,58 @@ class ExcelAdapter(ABC):
                 sheet=sheet,
                 cell=cell,
             ),
-            adapter_message=(
-                "Expected values did not match actual values: "
-                f"expected={expected}, actual={actual}"
+            adapter_message=LazyMessage(
+                lambda: (
+                    "Expected values did not match actual values: "
+                    f"expected={expected}, actual={actual}"
+                )
             ),
-            probable_cause="Adapter returned a value that differs from benchmark expectations.",
+            probable_cause=_MISMATCH_PROBABLE_CAUSE,
         )
 
+    def build_soa_mismatch_diagnostics(
+        self,
+        *,
+        feature: str,
+        operation: OperationType,
+        test_case_id: str,
+        expected: SoABlock,
+        actual: SoABlock,
+        sheet: str | None = None,
+    ) -> list[Diagnostic]:
+        """Diff two SoA blocks (see ``read_sheet_cells_soa``) in one vectorized pass.
+
+        Returns one mismatch diagnostic per differing cell.
+        """
+        diagnostics: list[Diagnostic] = []
+        rows, cols = expected["row"], expected["col"]
+        for idx in soa_mismatch_indices(expected, actual).tolist():
+            diagnostics.append(
+                self.build_mismatch_diagnostic(
+                    feature=feature,
+                    operation=operation,
+                    test_case_id=test_case_id,
+                    expected={
+                        key: expected[key][idx] for key in ("dtype", "num", "str", "formula")
+                    },
+                    actual={key: actual[key][idx] for key in ("dtype", "num", "str", "formula")},
+                    sheet=sheet,
+                    cell=coord_to_a1(int(rows[idx]), int(cols[idx])),
+                )
+            )
+        return diagnostics
+
     # =========================================================================
     # Read Operations
     # =========================================================================
 
     @abstractmethod
-    def open_workbook(self, path: Path) -> Any:
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
         """Open a workbook for reading.
 
         Args:
             path: Path to the Excel file.
+            opts: Selective-loading hints; unsupported options are ignored.
 
         Returns:
             Library-specific workbook object.
@@ -170,6 +327,73 @@ class ExcelAdapter(ABC):
         """
         ...
 
+    def open_workbook_from_stream(self, stream: BinaryIO, opts: OpenOptions = OpenOptions()) -> Any:
+        """Open a workbook from a readable binary stream.
+
+        Default spills the stream to a temporary file and opens that; the
+        file is unlinked straight away where the OS allows it. Adapters whose
+        library reads file objects should override.
+        """
+        fd, name = tempfile.mkstemp(suffix=".xlsx")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                shutil.copyfileobj(stream, fh)
+            return self.open_workbook(Path(name), opts)
+        finally:
+            try:
+                os.unlink(name)
+            except OSError:
+                pass  # Still held open by the library (Windows).
+
+    @contextmanager
+    def open_workbook_ctx(self, path: Path, opts: OpenOptions = OpenOptions()) -> Iterator[Any]:
+        """Open a workbook for the duration of a ``with`` block.
+
+        close_workbook() runs on exit even if the body raises, so the
+        library's file handles and parsed XML are released promptly rather
+        than whenever the garbage collector gets to them.
+        """
+        workbook = self.open_workbook(path, opts)
+        try:
+            yield workbook
+        finally:
+            self.close_workbook(workbook)
+
+    async def aopen_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
+        """Open a workbook on a worker thread; returns the same object as open_workbook().
+
+        Opening is dominated by zip reads and XML parsing, much of which
+        releases the GIL, so several files can be opened concurrently.
+        """
+        return await asyncio.to_thread(self.open_workbook, path, opts)
+
+    async def aopen_workbooks(
+        self,
+        paths: Iterable[Path],
+        opts: OpenOptions = OpenOptions(),
+        max_concurrency: int = 4,
+    ) -> list[Any]:
+        """Open *paths* concurrently (at most *max_concurrency* at a time), in order.
+
+        The caller owns every returned handle and must close_workbook() each.
+        If any open fails, the handles that did open are closed and the first
+        error is raised.
+        """
+        gate = asyncio.Semaphore(max_concurrency)
+
+        async def _open(path: Path) -> Any:
+            async with gate:
+                return await self.aopen_workbook(path, opts)
+
+        results = await asyncio.gather(*(_open(p) for p in paths), return_exceptions=True)
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            for handle in results:
+                if not isinstance(handle, BaseException):
+                    self.close_workbook(handle)
+            raise errors[0]
+        return results
+
     @abstractmethod
     def get_sheet_names(self, workbook: Any) -> list[str]:
         """Get list of sheet names in a workbook.
@@ -182,6 +406,21 @@ class ExcelAdapter(ABC):
         """
         ...
 
+    def bind_readers(
+        self,
+    ) -> tuple[
+        Callable[[Any, str, str], CellValue],
+        Callable[[Any, str, str], CellFormat],
+        Callable[[Any, str, str], BorderInfo],
+    ]:
+        """Return the bound (read_cell_value, read_cell_format, read_cell_border) methods.
+
+        Per-cell loops should bind these once, outside the loop, and call the
+        locals instead of re-resolving the methods on every iteration. The
+        callables stay valid for the adapter's lifetime.
+        """
+        return self.read_cell_value, self.read_cell_format, self.read_cell_border
+
     @abstractmethod
     def read_cell_value(
         self,
@@ -259,6 +498,37 @@ class ExcelAdapter(ABC):
         """Read the width of a column by letter (e.g., "A")."""
         ...
 
+    # =========================================================================
+    # Integer-Coordinate Access (optional override)
+    # =========================================================================
+    # Rows and columns are 0-based. The defaults format an A1 reference and
+    # call the string method; adapters whose library indexes by number should
+    # override these to skip the round-trip.
+
+    def read_cell_value_rc(self, workbook: Any, sheet: str, row: int, col: int) -> CellValue:
+        """Read the value of the cell at 0-based (row, col)."""
+        return self.read_cell_value(workbook, sheet, coord_to_a1(row, col))
+
+    def read_cell_format_rc(self, workbook: Any, sheet: str, row: int, col: int) -> CellFormat:
+        """Read the formatting of the cell at 0-based (row, col)."""
+        return self.read_cell_format(workbook, sheet, coord_to_a1(row, col))
+
+    def read_cell_border_rc(self, workbook: Any, sheet: str, row: int, col: int) -> BorderInfo:
+        """Read the border of the cell at 0-based (row, col)."""
+        return self.read_cell_border(workbook, sheet, coord_to_a1(row, col))
+
+    def read_cells(
+        self, workbook: Any, sheet: str, coords: Sequence[tuple[int, int]]
+    ) -> list[CellValue]:
+        """Read the values at 0-based (row, col) *coords*, in the given order.
+
+        Meant for sparse samples of a large sheet. Adapters whose per-cell
+        read has to scan or re-parse the sheet should override this to
+        collect every requested cell in a single pass.
+        """
+        read = self.read_cell_value_rc
+        return [read(workbook, sheet, row, col) for row, col in coords]
+
     # =========================================================================
     # Tier 2 Read Operations
     # =========================================================================
@@ -328,6 +598,131 @@ class ExcelAdapter(ABC):
             raise NotImplementedError(f"{self.name} does not support bulk reads")
         return fn(workbook, sheet, cell_range)
 
+    def read_sheet_cells_soa(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+        pool: StringPool | None = None,
+    ) -> SoABlock:
+        """Bulk read into parallel numpy columns (see ``excelbench.harness.adapters.soa``).
+
+        Default encodes the output of read_sheet_values(); adapters with a
+        columnar native representation can override to skip CellValue wrapping.
+        Strings are deduplicated through *pool* (shared across calls if given).
+        """
+        fn = getattr(self, "read_sheet_values", None)
+        if fn is None:
+            raise NotImplementedError(f"{self.name} does not support bulk reads")
+        return cells_to_soa(fn(workbook, sheet, cell_range), range_origin(cell_range), pool)
+
+    # =========================================================================
+    # Batch Range Reads (optional override)
+    # =========================================================================
+
+    def read_range_values(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str,
+    ) -> list[list[CellValue]]:
+        """Read a rectangular range of values as a row-major grid.
+
+        Default uses read_sheet_values() when the adapter provides it and
+        otherwise falls back to one read_cell_value() call per cell.
+        """
+        fn = getattr(self, "read_sheet_values", None)
+        if fn is not None:
+            rows: list[list[CellValue]] = fn(workbook, sheet, cell_range)
+            return rows
+        return self._read_range_per_cell(self.read_cell_value_rc, workbook, sheet, cell_range)
+
+    def read_range_formats(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str,
+    ) -> list[list[CellFormat]]:
+        """Read a rectangular range of formats as a row-major grid.
+
+        Default falls back to one read_cell_format() call per cell.
+        """
+        return self._read_range_per_cell(self.read_cell_format_rc, workbook, sheet, cell_range)
+
+    def read_used_range(
+        self,
+        workbook: Any,
+        sheet: str,
+    ) -> tuple[list[list[CellValue]], tuple[int, int, int, int]]:
+        """Read every value in the sheet's used range in one call.
+
+        Returns the row-major grid and its 0-based inclusive bounds
+        ``(min_row, min_col, max_row, max_col)``. An empty sheet yields an
+        empty grid with ``max_row < min_row``.
+
+        Default delegates to read_sheet_values() with no range, which adapters
+        return anchored at A1. Override when the library exposes tighter bounds.
+        """
+        fn = getattr(self, "read_sheet_values", None)
+        if fn is None:
+            raise NotImplementedError(f"{self.name} does not support bulk reads")
+        rows: list[list[CellValue]] = fn(workbook, sheet, None)
+        width = max((len(r) for r in rows), default=0)
+        return rows, (0, 0, len(rows) - 1, width - 1)
+
+    def read_all_sheets(
+        self,
+        workbook: Any,
+    ) -> dict[str, tuple[list[list[CellValue]], tuple[int, int, int, int]]]:
+        """Read the used range of every sheet, keyed by sheet name.
+
+        Each entry has the shape returned by read_used_range(). Sheets are
+        read one after another: workbook handles such as calamine's cannot
+        be entered from several threads at once, so parallel reads need one
+        handle per thread or process (see aopen_workbooks() and
+        read_sheets_in_processes()).
+        """
+        read = self.read_used_range
+        return {name: read(workbook, name) for name in self.get_sheet_names(workbook)}
+
+    def read_sheets_in_processes(
+        self,
+        path: Path,
+        method: str = "read_used_range",
+        opts: OpenOptions = OpenOptions(),
+        max_workers: int | None = None,
+    ) -> dict[str, Any]:
+        """Call ``method(workbook, sheet)`` for every sheet of *path*, keyed by sheet name.
+
+        Sheets are spread over worker processes, each opening its own handle
+        limited to its sheet, so CPU-bound parsing scales past the GIL and
+        handles that cannot be shared never are. Results must be picklable.
+        Only worth it when per-sheet work outweighs a process start plus a
+        re-open of the file; single-sheet files are read in-process.
+        """
+        read = getattr(self, method)
+        with self.open_workbook_ctx(path, opts) as workbook:
+            names = self.get_sheet_names(workbook)
+            workers = min(len(names), max_workers or os.cpu_count() or 1)
+            if workers <= 1:
+                return {name: read(workbook, name) for name in names}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_read_sheet_job, self, path, opts, method, name) for name in names
+            ]
+            return {name: future.result() for name, future in zip(names, futures, strict=True)}
+
+    @staticmethod
+    def _read_range_per_cell(
+        read: Callable[[Any, str, int, int], Any],
+        workbook: Any,
+        sheet: str,
+        cell_range: str,
+    ) -> list[list[Any]]:
+        r0, c0, r1, c1 = range_bounds(cell_range)
+        cols = range(c0, c1 + 1)
+        return [[read(workbook, sheet, r, c) for c in cols] for r in range(r0, r1 + 1)]
+
     def read_named_ranges(self, workbook: Any, sheet: str) -> list[JSONDict]:
         """Read named ranges.
 
@@ -393,6 +788,19 @@ class ExcelAdapter(ABC):
         """
         ...
 
+    def bind_writers(
+        self,
+    ) -> tuple[
+        Callable[[Any, str, str, CellValue], None],
+        Callable[[Any, str, str, CellFormat], None],
+        Callable[[Any, str, str, BorderInfo], None],
+    ]:
+        """Return the bound (write_cell_value, write_cell_format, write_cell_border) methods.
+
+        The write-side counterpart of bind_readers(), for per-cell write loops.
+        """
+        return self.write_cell_value, self.write_cell_format, self.write_cell_border
+
     @abstractmethod
     def write_cell_value(
         self,
@@ -447,6 +855,63 @@ class ExcelAdapter(ABC):
         """
         ...
 
+    def write_cells_bulk(
+        self,
+        workbook: Any,
+        sheet: str,
+        cells: Sequence[str],
+        values: Sequence[CellValue],
+        formats: Sequence[CellFormat | None] | None = None,
+        borders: Sequence[BorderInfo | None] | None = None,
+    ) -> None:
+        """Write many cells on one sheet in a single call.
+
+        ``values``, ``formats`` and ``borders`` are parallel to ``cells``;
+        ``None`` entries in ``formats``/``borders`` are skipped. The default
+        loops over the per-cell write methods; adapters whose library has a
+        batched write path can override this.
+        """
+        n = len(cells)
+        if (
+            len(values) != n
+            or (formats is not None and len(formats) != n)
+            or (borders is not None and len(borders) != n)
+        ):
+            raise ValueError("write_cells_bulk inputs must all have the same length")
+        for i, cell in enumerate(cells):
+            self.write_cell_value(workbook, sheet, cell, values[i])
+            if formats is not None and (fmt := formats[i]) is not None:
+                self.write_cell_format(workbook, sheet, cell, fmt)
+            if borders is not None and (border := borders[i]) is not None:
+                self.write_cell_border(workbook, sheet, cell, border)
+
+    def write_cell_value_rc(
+        self, workbook: Any, sheet: str, row: int, col: int, value: CellValue
+    ) -> None:
+        """Write a value to the cell at 0-based (row, col).
+
+        Default delegates to write_cell_value(); override to skip A1 formatting.
+        """
+        self.write_cell_value(workbook, sheet, coord_to_a1(row, col), value)
+
+    def write_rows(
+        self,
+        workbook: Any,
+        sheet: str,
+        row0: int,
+        col0: int,
+        rows: Iterable[Sequence[CellValue]],
+    ) -> None:
+        """Write a block of rows whose top-left cell is at 0-based (row0, col0).
+
+        Default calls write_cell_value_rc() per cell; adapters with a native
+        row writer should override it.
+        """
+        write = self.write_cell_value_rc
+        for r, row in enumerate(rows, row0):
+            for c, value in enumerate(row, col0):
+                write(workbook, sheet, r, c, value)
+
     @abstractmethod
     def set_row_height(
         self,
@@ -469,6 +934,22 @@ class ExcelAdapter(ABC):
         """Set the width of a column by letter (e.g., "A")."""
         ...
 
+    def write_column_widths(self, workbook: Any, sheet: str, widths: Mapping[int, float]) -> None:
+        """Set several column widths, keyed by 0-based column index.
+
+        Default calls set_column_width() per column.
+        """
+        for col, width in widths.items():
+            self.set_column_width(workbook, sheet, column_letter(col), width)
+
+    def register_shared_strings(self, workbook: Any, strings: Iterable[str]) -> None:
+        """Declare strings that will be written, possibly across several sheets.
+
+        A hint for libraries with a workbook-wide shared string table: they
+        may intern these up front instead of discovering them cell by cell.
+        Only pass strings that are actually written. Default: ignored.
+        """
+
     # =========================================================================
     # Tier 2 Write Operations
     # =========================================================================
@@ -523,169 +1004,94 @@ class ExcelAdapter(ABC):
         """
         ...
 
+    def save_workbook_to_stream(self, workbook: Any, stream: BinaryIO) -> None:
+        """Serialize a workbook into a writable binary stream (e.g. ``io.BytesIO``).
 
-class ReadOnlyAdapter(ExcelAdapter):
-    """Base class for read-only adapters.
-
-    Provides default implementations that raise NotImplementedError
-    for all write operations.
-    """
-
-    def create_workbook(self) -> Any:
-        raise NotImplementedError(f"{self.name} is read-only")
-
-    def add_sheet(self, workbook: Any, name: str) -> None:
-        raise NotImplementedError(f"{self.name} is read-only")
-
-    def write_cell_value(
-        self,
-        workbook: Any,
-        sheet: str,
-        cell: str,
-        value: CellValue,
-    ) -> None:
-        raise NotImplementedError(f"{self.name} is read-only")
-
-    def write_cell_format(
-        self,
-        workbook: Any,
-        sheet: str,
-        cell: str,
-        format: CellFormat,
-    ) -> None:
-        raise NotImplementedError(f"{self.name} is read-only")
+        Default saves to a temporary file and copies it into *stream*;
+        adapters whose library can write to file objects should override.
+        """
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / f"workbook{self.output_extension}"
+            self.save_workbook(workbook, path)
+            with open(path, "rb") as fh:
+                shutil.copyfileobj(fh, stream)
 
-    def write_cell_border(
-        self,
-        workbook: Any,
-        sheet: str,
-        cell: str,
-        border: BorderInfo,
-    ) -> None:
-        raise NotImplementedError(f"{self.name} is read-only")
+    def begin_streaming_write(self, path: Path) -> StreamWriter:
+        """Open *path* for constant-memory, row-at-a-time writing.
 
-    def save_workbook(self, workbook: Any, path: Path) -> None:
-        raise NotImplementedError(f"{self.name} is read-only")
+        Only available when can_stream_write() is true; see
+        ``excelbench.harness.adapters.streaming`` for the writer contract.
+        """
+        raise NotImplementedError(f"{self.name} does not support streaming writes")
 
-    def set_row_height(
-        self,
-        workbook: Any,
-        sheet: str,
-        row: int,
-        height: float,
-    ) -> None:
-        raise NotImplementedError(f"{self.name} is read-only")
 
-    def set_column_width(
-        self,
-        workbook: Any,
-        sheet: str,
-        column: str,
-        width: float,
-    ) -> None:
-        raise NotImplementedError(f"{self.name} is read-only")
+def _read_sheet_job(
+    adapter: ExcelAdapter, path: Path, opts: OpenOptions, method: str, sheet: str
+) -> Any:
+    """Worker for read_sheets_in_processes(): open *path* for one sheet and read it."""
+    with adapter.open_workbook_ctx(path, replace(opts, sheets=frozenset({sheet}))) as workbook:
+        return getattr(adapter, method)(workbook, sheet)
 
-    def merge_cells(self, workbook: Any, sheet: str, cell_range: str) -> None:
-        raise NotImplementedError(f"{self.name} is read-only")
 
-    def add_conditional_format(self, workbook: Any, sheet: str, rule: JSONDict) -> None:
-        raise NotImplementedError(f"{self.name} is read-only")
+def _read_only(self: ExcelAdapter, *args: Any, **kwargs: Any) -> NoReturn:
+    raise NotImplementedError(f"{self.name} is read-only")
 
-    def add_data_validation(self, workbook: Any, sheet: str, validation: JSONDict) -> None:
-        raise NotImplementedError(f"{self.name} is read-only")
 
-    def add_hyperlink(self, workbook: Any, sheet: str, link: JSONDict) -> None:
-        raise NotImplementedError(f"{self.name} is read-only")
+def _write_only(self: ExcelAdapter, *args: Any, **kwargs: Any) -> NoReturn:
+    raise NotImplementedError(f"{self.name} is write-only")
 
-    def add_image(self, workbook: Any, sheet: str, image: JSONDict) -> None:
-        raise NotImplementedError(f"{self.name} is read-only")
 
-    def add_pivot_table(self, workbook: Any, sheet: str, pivot: JSONDict) -> None:
-        raise NotImplementedError(f"{self.name} is read-only")
+class ReadOnlyAdapter(ExcelAdapter):
+    """Base class for read-only adapters.
 
-    def add_comment(self, workbook: Any, sheet: str, comment: JSONDict) -> None:
-        raise NotImplementedError(f"{self.name} is read-only")
+    Provides default implementations that raise NotImplementedError
+    for all write operations. Every stub is the same shared function.
+    """
 
-    def set_freeze_panes(self, workbook: Any, sheet: str, settings: JSONDict) -> None:
-        raise NotImplementedError(f"{self.name} is read-only")
+    __slots__ = ()
+
+    create_workbook = _read_only
+    add_sheet = _read_only
+    write_cell_value = _read_only
+    write_cell_format = _read_only
+    write_cell_border = _read_only
+    save_workbook = _read_only
+    set_row_height = _read_only
+    set_column_width = _read_only
+    merge_cells = _read_only
+    add_conditional_format = _read_only
+    add_data_validation = _read_only
+    add_hyperlink = _read_only
+    add_image = _read_only
+    add_pivot_table = _read_only
+    add_comment = _read_only
+    set_freeze_panes = _read_only
 
 
 class WriteOnlyAdapter(ExcelAdapter):
     """Base class for write-only adapters.
 
     Provides default implementations that raise NotImplementedError
-    for all read operations.
+    for all read operations. Every stub is the same shared function.
     """
 
-    def open_workbook(self, path: Path) -> Any:
-        raise NotImplementedError(f"{self.name} is write-only")
+    __slots__ = ()
+
+    open_workbook = _write_only
+    get_sheet_names = _write_only
+    read_cell_value = _write_only
+    read_cell_format = _write_only
+    read_cell_border = _write_only
+    read_row_height = _write_only
+    read_column_width = _write_only
+    read_merged_ranges = _write_only
+    read_conditional_formats = _write_only
+    read_data_validations = _write_only
+    read_hyperlinks = _write_only
+    read_images = _write_only
+    read_pivot_tables = _write_only
+    read_comments = _write_only
+    read_freeze_panes = _write_only
 
     def close_workbook(self, workbook: Any) -> None:
         pass  # Nothing to close for write-only
-
-    def get_sheet_names(self, workbook: Any) -> list[str]:
-        raise NotImplementedError(f"{self.name} is write-only")
-
-    def read_cell_value(
-        self,
-        workbook: Any,
-        sheet: str,
-        cell: str,
-    ) -> CellValue:
-        raise NotImplementedError(f"{self.name} is write-only")
-
-    def read_cell_format(
-        self,
-        workbook: Any,
-        sheet: str,
-        cell: str,
-    ) -> CellFormat:
-        raise NotImplementedError(f"{self.name} is write-only")
-
-    def read_cell_border(
-        self,
-        workbook: Any,
-        sheet: str,
-        cell: str,
-    ) -> BorderInfo:
-        raise NotImplementedError(f"{self.name} is write-only")
-
-    def read_row_height(
-        self,
-        workbook: Any,
-        sheet: str,
-        row: int,
-    ) -> float | None:
-        raise NotImplementedError(f"{self.name} is write-only")
-
-    def read_column_width(
-        self,
-        workbook: Any,
-        sheet: str,
-        column: str,
-    ) -> float | None:
-        raise NotImplementedError(f"{self.name} is write-only")
-
-    def read_merged_ranges(self, workbook: Any, sheet: str) -> list[str]:
-        raise NotImplementedError(f"{self.name} is write-only")
-
-    def read_conditional_formats(self, workbook: Any, sheet: str) -> list[JSONDict]:
-        raise NotImplementedError(f"{self.name} is write-only")
-
-    def read_data_validations(self, workbook: Any, sheet: str) -> list[JSONDict]:
-        raise NotImplementedError(f"{self.name} is write-only")
-
-    def read_hyperlinks(self, workbook: Any, sheet: str) -> list[JSONDict]:
-        raise NotImplementedError(f"{self.name} is write-only")
-
-    def read_images(self, workbook: Any, sheet: str) -> list[JSONDict]:
-        raise NotImplementedError(f"{self.name} is write-only")
-
-    def read_pivot_tables(self, workbook: Any, sheet: str) -> list[JSONDict]:
-        raise NotImplementedError(f"{self.name} is write-only")
-
-    def read_comments(self, workbook: Any, sheet: str) -> list[JSONDict]:
-        raise NotImplementedError(f"{self.name} is write-only")
-
-    def read_freeze_panes(self, workbook: Any, sheet: str) -> JSONDict:
-        raise NotImplementedError(f"{self.name} is write-only")
@@ -1,26 +1,56 @@
 """Adapter for python-calamine library (read-only, Rust-backed)."""
 
-import re
+from collections.abc import Callable, Sequence
 from datetime import date, datetime, time
+from functools import cache, partial
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from python_calamine import CalamineWorkbook
 
+from excelbench.harness.adapters.a1 import parse_cell_ref, range_bounds
 from excelbench.harness.adapters.base import ReadOnlyAdapter
+from excelbench.harness.adapters.error_values import ERROR_LITERALS
+from excelbench.harness.adapters.soa import SoABlock, StringPool, range_origin, raw_to_soa
 from excelbench.models import (
     BorderInfo,
     CellFormat,
     CellType,
     CellValue,
     LibraryInfo,
+    OpenOptions,
 )
 
 JSONDict = dict[str, Any]
 
+_SheetEntry = tuple[CalamineWorkbook, list[list[Any]], tuple[int, int] | None]
 
+_parse_cell_ref = parse_cell_ref
+
+# Shared constant results.  Callers treat returned models as read-only, so the
+# blank/no-format paths hand back one instance instead of allocating per cell.
+_BLANK = CellValue(type=CellType.BLANK)
+_EMPTY_FMT = CellFormat()
+_EMPTY_BORDER = BorderInfo()
+
+# Hot-path constructors pass CellValue fields positionally with the enum
+# members bound here: keyword arguments and CellType.X attribute lookups
+# each cost more than building the slotted instance itself.
+_BOOLEAN = CellType.BOOLEAN
+_NUMBER = CellType.NUMBER
+_DATE = CellType.DATE
+_DATETIME = CellType.DATETIME
+_ERROR = CellType.ERROR
+_FORMULA = CellType.FORMULA
+_STRING = CellType.STRING
+
+# One C-level time() == comparison instead of four attribute reads.
+_MIDNIGHT = time()
+
+
+@cache
 def _get_version() -> str:
-    """Get python-calamine version."""
+    """Get python-calamine version (metadata lookup runs once per process)."""
     try:
         from importlib.metadata import version
 
@@ -29,67 +59,113 @@ def _get_version() -> str:
         return "unknown"
 
 
-def _parse_cell_ref(cell: str) -> tuple[int, int]:
-    """Parse a cell reference like 'A1' to (row_0based, col_0based)."""
-    match = re.match(r"([A-Z]+)(\d+)", cell.upper())
-    if not match:
-        raise ValueError(f"Invalid cell reference: {cell}")
-    col_str, row_str = match.groups()
-    row = int(row_str) - 1
-    col = 0
-    for char in col_str:
-        col = col * 26 + (ord(char) - ord("A") + 1)
-    col -= 1
-    return row, col
+def _h_bool(value: bool) -> CellValue:
+    return CellValue(_BOOLEAN, value)
 
 
-def _convert_value(value: Any) -> CellValue:
-    """Convert a raw calamine Python value to a CellValue."""
-    if value is None or value == "":
-        return CellValue(type=CellType.BLANK)
+def _h_num(value: float) -> CellValue:
+    return CellValue(_NUMBER, value)
 
-    # Check bool BEFORE int (bool is subclass of int in Python)
-    if isinstance(value, bool):
-        return CellValue(type=CellType.BOOLEAN, value=value)
 
-    if isinstance(value, (int, float)):
-        return CellValue(type=CellType.NUMBER, value=value)
+def _h_datetime(value: datetime) -> CellValue:
+    if value.time() == _MIDNIGHT:
+        return CellValue(_DATE, value.date())
+    return CellValue(_DATETIME, value)
 
-    # Check date before datetime (date is not a subclass of datetime,
-    # but calamine may return either)
-    if isinstance(value, datetime):
-        is_midnight = (
-            value.hour == 0
-            and value.minute == 0
-            and value.second == 0
-            and value.microsecond == 0
-        )
-        if is_midnight:
-            return CellValue(type=CellType.DATE, value=value.date())
-        return CellValue(type=CellType.DATETIME, value=value)
 
-    if isinstance(value, date) and not isinstance(value, datetime):
-        return CellValue(type=CellType.DATE, value=value)
+def _h_date(value: date) -> CellValue:
+    return CellValue(_DATE, value)
 
-    if isinstance(value, time):
-        return CellValue(type=CellType.DATETIME, value=datetime.combine(date.today(), value))
 
-    if isinstance(value, str):
-        # Error values — includes #N/A (no trailing !)
-        if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
-            return CellValue(type=CellType.ERROR, value=value)
-        if value.startswith("#") and value.endswith("!"):
-            return CellValue(type=CellType.ERROR, value=value)
+def _h_time(value: time, today: date) -> CellValue:
+    return CellValue(_DATETIME, datetime.combine(today, value))
+
+
+def _h_str(value: str) -> CellValue:
+    if not value:
+        return _BLANK
+
+    # Error values — any "#...!" plus the codes without a trailing "!"
+    first = value[0]
+    if first == "#" and (value[-1] == "!" or value in ERROR_LITERALS):
+        return CellValue(_ERROR, value)
 
-        # Formulas — calamine generally evaluates formulas and returns
-        # computed values, but if a string starts with = it's a formula
-        if value.startswith("="):
-            return CellValue(type=CellType.FORMULA, value=value, formula=value)
+    # Formulas — calamine generally evaluates formulas and returns
+    # computed values, but if a string starts with = it's a formula
+    if first == "=":
+        return CellValue(_FORMULA, value, value)
 
-        return CellValue(type=CellType.STRING, value=value)
+    return CellValue(_STRING, value)
+
+
+# Exact-type dispatch: one dict lookup on the common path instead of walking
+# the isinstance chain (bool must not fall through to int, datetime not to date).
+# time is left to _convert_value(), which supplies the date to anchor it on.
+_HANDLERS: dict[type, Callable[[Any], CellValue]] = {
+    type(None): lambda _: _BLANK,
+    bool: _h_bool,
+    int: _h_num,
+    float: _h_num,
+    str: _h_str,
+    datetime: _h_datetime,
+    date: _h_date,
+}
+
+
+def _convert_value(value: Any, today: date | None = None) -> CellValue:
+    """Convert a raw calamine Python value to a CellValue.
+
+    Time-only values are combined with *today*; bulk callers read the date
+    once per pass (date.today() costs ~1.5 us) and pass it in.
+    """
+    handler = _HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(value)
+
+    # Subclasses of the builtin types take the ordered isinstance chain.
+    if value is None or value == "":
+        return _BLANK
+    # Check bool BEFORE int (bool is subclass of int in Python)
+    if isinstance(value, bool):
+        return _h_bool(value)
+    if isinstance(value, (int, float)):
+        return _h_num(value)
+    if isinstance(value, datetime):
+        return _h_datetime(value)
+    if isinstance(value, date):
+        return _h_date(value)
+    if isinstance(value, time):
+        return _h_time(value, today or date.today())
+    if isinstance(value, str):
+        return _h_str(value)
 
     # Fallback
-    return CellValue(type=CellType.STRING, value=str(value))
+    return CellValue(_STRING, str(value))
+
+
+def _convert_rows(rows: list[list[Any]]) -> list[list[CellValue]]:
+    """Convert a whole to_python() grid, inlining the blank and number paths.
+
+    Dense benchmark sheets are dominated by empty and numeric cells, so those
+    skip the handler call; everything else goes through _convert_value().
+    A nested comprehension (LIST_APPEND opcodes instead of a per-cell
+    ``append`` call) measured ~40% faster than an explicit or pre-sized loop.
+    """
+    convert = _convert_value
+    blank = _BLANK
+    number = _NUMBER
+    today = date.today()
+    return [
+        [
+            blank
+            if v is None
+            else CellValue(number, v)
+            if type(v) is float or type(v) is int
+            else convert(v, today)
+            for v in row
+        ]
+        for row in rows
+    ]
 
 
 class CalamineAdapter(ReadOnlyAdapter):
@@ -100,6 +176,13 @@ class CalamineAdapter(ReadOnlyAdapter):
     preserved. Formatting information is also not available.
     """
 
+    __slots__ = ("_sheets",)
+
+    def __init__(self) -> None:
+        # (id(workbook), sheet) -> (workbook, to_python() rows, sheet start).
+        # Holding the workbook keeps its id from being reused while cached.
+        self._sheets: dict[tuple[int, str], _SheetEntry] = {}
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
@@ -109,19 +192,66 @@ class CalamineAdapter(ReadOnlyAdapter):
             capabilities={"read"},
         )
 
-    @property
-    def supported_read_extensions(self) -> set[str]:
-        return {".xlsx", ".xls"}
+    supported_read_extensions: ClassVar[frozenset[str]] = frozenset(
+        {".xlsx", ".xlsb", ".xls", ".ods"}
+    )
 
     # =========================================================================
     # Read Operations
     # =========================================================================
 
-    def open_workbook(self, path: Path) -> CalamineWorkbook:
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> CalamineWorkbook:
         return CalamineWorkbook.from_path(str(path))
 
     def close_workbook(self, workbook: Any) -> None:
-        pass  # No close needed
+        wb_id = id(workbook)
+        for key in [k for k in self._sheets if k[0] == wb_id]:
+            del self._sheets[key]
+
+    def _sheet_rows(
+        self, workbook: CalamineWorkbook, sheet: str
+    ) -> tuple[list[list[Any]], tuple[int, int] | None]:
+        """Return the sheet's to_python() rows and start, converting it only once.
+
+        The rows are shared between calls and must not be mutated.
+        """
+        key = (id(workbook), sheet)
+        entry = self._sheets.get(key)
+        if entry is None:
+            sheet_data = workbook.get_sheet_by_name(sheet)
+            entry = (workbook, sheet_data.to_python(), sheet_data.start)
+            self._sheets[key] = entry
+        return entry[1], entry[2]
+
+    def _range_rows(
+        self, workbook: CalamineWorkbook, sheet: str, cell_range: str
+    ) -> list[list[Any]]:
+        """Slice *cell_range* out of the cached to_python() rows, padding with None.
+
+        The rows are anchored at the sheet's start, not A1, so the range is
+        shifted by it before slicing.
+        """
+        r0, c0, r1, c1 = range_bounds(cell_range)
+        rows, start = self._sheet_rows(workbook, sheet)
+        width = c1 - c0 + 1
+        height = r1 - r0 + 1
+        if start is None:
+            return [[None] * width for _ in range(height)]
+        sr, sc = start
+        r0, r1, c0, c1 = r0 - sr, r1 - sr, c0 - sc, c1 - sc
+        # Cells left of / above the start are blank; only those need explicit padding.
+        lead_cols = [None] * max(-c0, 0)
+        lead_rows = max(-r0, 0)
+        sliced: list[list[Any]] = [[None] * width for _ in range(lead_rows)]
+        for row in rows[max(r0, 0) : max(r1 + 1, 0)]:
+            chunk = row[max(c0, 0) : max(c1 + 1, 0)]  # C-level copy
+            if lead_cols:
+                chunk = lead_cols + chunk
+            if len(chunk) < width:
+                chunk += [None] * (width - len(chunk))
+            sliced.append(chunk)
+        sliced.extend([None] * width for _ in range(height - len(sliced)))
+        return sliced
 
     def get_sheet_names(self, workbook: CalamineWorkbook) -> list[str]:
         return workbook.sheet_names
@@ -133,29 +263,9 @@ class CalamineAdapter(ReadOnlyAdapter):
         cell_range: str | None = None,
     ) -> list[list[Any]]:
         """Return raw calamine to_python() output without _convert_value() wrapping."""
-        sheet_data = workbook.get_sheet_by_name(sheet)
-        rows = sheet_data.to_python()
         if cell_range:
-            clean = cell_range.replace("$", "").upper()
-            if ":" in clean:
-                a, b = clean.split(":", 1)
-            else:
-                a, b = clean, clean
-            r0, c0 = _parse_cell_ref(a)
-            r1, c1 = _parse_cell_ref(b)
-            if r1 < r0:
-                r0, r1 = r1, r0
-            if c1 < c0:
-                c0, c1 = c1, c0
-            sliced: list[list[Any]] = []
-            for rr in range(r0, r1 + 1):
-                source = rows[rr] if rr < len(rows) else []
-                padded = [
-                    source[cc] if cc < len(source) else None
-                    for cc in range(c0, c1 + 1)
-                ]
-                sliced.append(padded)
-            return sliced
+            return self._range_rows(workbook, sheet, cell_range)
+        rows, _ = self._sheet_rows(workbook, sheet)
         return rows
 
     def read_cell_value(
@@ -164,19 +274,44 @@ class CalamineAdapter(ReadOnlyAdapter):
         sheet: str,
         cell: str,
     ) -> CellValue:
-        sheet_data = workbook.get_sheet_by_name(sheet)
-        rows = sheet_data.to_python()
+        rows, start = self._sheet_rows(workbook, sheet)
+        if start is None:
+            return _BLANK
         row_idx, col_idx = _parse_cell_ref(cell)
+        # The grid is anchored at the sheet's start, not A1.
+        row_idx -= start[0]
+        col_idx -= start[1]
 
         # Out of bounds → blank
-        if row_idx >= len(rows):
-            return CellValue(type=CellType.BLANK)
+        if not 0 <= row_idx < len(rows):
+            return _BLANK
         row = rows[row_idx]
-        if col_idx >= len(row):
-            return CellValue(type=CellType.BLANK)
+        if not 0 <= col_idx < len(row):
+            return _BLANK
 
         return _convert_value(row[col_idx])
 
+    def read_cells(
+        self,
+        workbook: CalamineWorkbook,
+        sheet: str,
+        coords: Sequence[tuple[int, int]],
+    ) -> list[CellValue]:
+        """Read sparse cells from the sheet's single to_python() conversion."""
+        rows, start = self._sheet_rows(workbook, sheet)
+        if start is None:
+            return [_BLANK] * len(coords)
+        r0, c0 = start
+        today = date.today()
+        out: list[CellValue] = []
+        for row, col in coords:
+            rr, cc = row - r0, col - c0
+            if 0 <= rr < len(rows) and 0 <= cc < len(rows[rr]):
+                out.append(_convert_value(rows[rr][cc], today))
+            else:
+                out.append(_BLANK)
+        return out
+
     def read_sheet_values(
         self,
         workbook: CalamineWorkbook,
@@ -186,35 +321,51 @@ class CalamineAdapter(ReadOnlyAdapter):
         """Bulk read all values from a sheet (or a rectangular sub-range).
 
         Optional helper used by performance workloads.  Calls to_python()
-        once and converts the entire grid, avoiding the per-cell overhead
-        of read_cell_value().
+        once and converts the entire grid in one batch, avoiding the
+        per-cell overhead of read_cell_value().
         """
-        sheet_data = workbook.get_sheet_by_name(sheet)
-        rows = sheet_data.to_python()
+        if cell_range:
+            return _convert_rows(self._range_rows(workbook, sheet, cell_range))
+        rows, _ = self._sheet_rows(workbook, sheet)
+        return _convert_rows(rows)
+
+    def read_sheet_cells_soa(
+        self,
+        workbook: CalamineWorkbook,
+        sheet: str,
+        cell_range: str | None = None,
+        pool: StringPool | None = None,
+    ) -> SoABlock:
+        """Encode the raw to_python() grid straight into SoA columns.
 
+        Blank and numeric cells skip CellValue wrapping entirely; the rest
+        use the same conversion as read_sheet_values().  A whole-sheet grid
+        begins at the sheet's start rather than A1.
+        """
+        convert = partial(_convert_value, today=date.today())
         if cell_range:
-            clean = cell_range.replace("$", "").upper()
-            if ":" in clean:
-                a, b = clean.split(":", 1)
-            else:
-                a, b = clean, clean
-            r0, c0 = _parse_cell_ref(a)
-            r1, c1 = _parse_cell_ref(b)
-            if r1 < r0:
-                r0, r1 = r1, r0
-            if c1 < c0:
-                c0, c1 = c1, c0
-            sliced: list[list[Any]] = []
-            for rr in range(r0, r1 + 1):
-                source = rows[rr] if rr < len(rows) else []
-                padded = [
-                    source[cc] if cc < len(source) else None
-                    for cc in range(c0, c1 + 1)
-                ]
-                sliced.append(padded)
-            rows = sliced
-
-        return [[_convert_value(v) for v in row] for row in rows]
+            rows = self._range_rows(workbook, sheet, cell_range)
+            return raw_to_soa(rows, convert, range_origin(cell_range), pool)
+        rows, start = self._sheet_rows(workbook, sheet)
+        return raw_to_soa(rows, convert, start or (0, 0), pool)
+
+    def read_used_range(
+        self,
+        workbook: CalamineWorkbook,
+        sheet: str,
+    ) -> tuple[list[list[CellValue]], tuple[int, int, int, int]]:
+        """Read the used range with one to_python() call.
+
+        to_python() trims leading empty rows/columns, so the grid is anchored
+        at ``sheet_data.start`` rather than A1.
+        """
+        raw, start = self._sheet_rows(workbook, sheet)
+        if start is None:
+            return [], (0, 0, -1, -1)
+        rows = _convert_rows(raw)
+        r0, c0 = start
+        width = max((len(r) for r in rows), default=0)
+        return rows, (r0, c0, r0 + len(rows) - 1, c0 + width - 1)
 
     def read_cell_format(
         self,
@@ -222,7 +373,7 @@ class CalamineAdapter(ReadOnlyAdapter):
         sheet: str,
         cell: str,
     ) -> CellFormat:
-        return CellFormat()  # No formatting support
+        return _EMPTY_FMT  # No formatting support
 
     def read_cell_border(
         self,
@@ -230,7 +381,7 @@ class CalamineAdapter(ReadOnlyAdapter):
         sheet: str,
         cell: str,
     ) -> BorderInfo:
-        return BorderInfo()  # No border support
+        return _EMPTY_BORDER  # No border support
 
     def read_row_height(
         self,
@@ -0,0 +1,20 @@
+"""Shared detection of Excel error values in string cells.
+
+Libraries without a native error type surface ``#REF!``-style codes as plain
+strings, so every value-reading adapter has to recognise them on the per-cell
+path.  The check is gated on the first character so ordinary strings pay one
+comparison.
+"""
+
+from __future__ import annotations
+
+# Codes that do not end in "!" (plus the common ones that do); any other
+# "#...!" string is treated as an error too.
+ERROR_LITERALS = frozenset(
+    {"#N/A", "#NULL!", "#NAME?", "#REF!", "#DIV/0!", "#VALUE!", "#NUM!", "#GETTING_DATA"}
+)
+
+
+def is_error_string(value: str) -> bool:
+    """Return True if *value* is an Excel error code such as ``#REF!`` or ``#N/A``."""
+    return value[:1] == "#" and (value[-1] == "!" or value in ERROR_LITERALS)
@@ -1,8 +1,12 @@
 """Adapter for openpyxl library."""
 
-from datetime import date, datetime
+from collections.abc import Callable, Iterable, Sequence
+from datetime import date, datetime, time
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, ClassVar
+from weakref import WeakKeyDictionary
 
 import openpyxl
 from openpyxl import Workbook
@@ -10,12 +14,17 @@ from openpyxl.cell import Cell
 from openpyxl.comments import Comment
 from openpyxl.drawing.image import Image
 from openpyxl.formatting.rule import ColorScaleRule, DataBarRule, FormulaRule
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.styles import Alignment, Border, Color, Font, PatternFill, Side
 from openpyxl.styles import colors as _openpyxl_colors
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.worksheet.hyperlink import Hyperlink
+from openpyxl.worksheet.worksheet import Worksheet
 
+from excelbench.harness.adapters.a1 import cell_to_coord, coord_to_a1, range_bounds
 from excelbench.harness.adapters.base import ExcelAdapter
+from excelbench.harness.adapters.error_values import is_error_string
+from excelbench.harness.adapters.soa import SoABlock, StringPool, range_origin, raw_to_soa
+from excelbench.harness.adapters.streaming import STREAM_WRITE, StreamWriter
 from excelbench.models import (
     BorderEdge,
     BorderInfo,
@@ -25,11 +34,25 @@ from excelbench.models import (
     CellValue,
     Diagnostic,
     LibraryInfo,
+    OpenOptions,
     OperationType,
 )
 
 JSONDict = dict[str, Any]
 
+# Hot-path CellValues are built positionally with pre-bound enum members
+# (keyword arguments and CellType.X lookups cost more than the slotted
+# instance itself); blanks share one instance, which callers never mutate.
+_BLANK = CellValue(type=CellType.BLANK)
+_BOOLEAN = CellType.BOOLEAN
+_NUMBER = CellType.NUMBER
+_DATE = CellType.DATE
+_DATETIME = CellType.DATETIME
+_ERROR = CellType.ERROR
+_FORMULA = CellType.FORMULA
+_STRING = CellType.STRING
+_MIDNIGHT = time()
+
 # Formulas that produce known error values (openpyxl returns formula, not error)
 ERROR_FORMULA_MAP = {
     "=1/0": "#DIV/0!",
@@ -38,13 +61,36 @@ ERROR_FORMULA_MAP = {
 }
 
 
+# Excel and third-party libraries add font-metric padding to stored column
+# widths: 0.83203125 for Excel (Calibri 11pt default), 0.7109375 for xlsxwriter.
+_WIDTH_PADDINGS = (0.83203125, 0.7109375)
+
 _COLOR_INDEX = getattr(_openpyxl_colors, "COLOR_INDEX", None)
+# Indexed palette pre-rendered as "#RRGGBB" so indexed colors are one lookup.
+_INDEXED_HEX = {
+    i: f"#{argb[2:]}"
+    for i, argb in enumerate(_COLOR_INDEX or ())
+    if isinstance(argb, str) and len(argb) == 8
+}
 
 
 def _openpyxl_color_to_hex(color: Any) -> str | None:
     if not color:
         return None
 
+    # openpyxl's own Color says which of rgb/indexed/theme/auto it holds, so
+    # the common case needs no getattr probing.
+    if type(color) is Color:
+        kind = color.type
+        if kind == "rgb":
+            rgb = color.rgb
+            if type(rgb) is str and len(rgb) >= 6:
+                return f"#{rgb[2:]}" if len(rgb) == 8 else f"#{rgb}"
+            return None
+        if kind == "indexed":
+            return _INDEXED_HEX.get(color.indexed)
+        return None
+
     rgb = getattr(color, "rgb", None)
     rgb_str: str | None = None
     if isinstance(rgb, str):
@@ -65,91 +111,400 @@ def _openpyxl_color_to_hex(color: Any) -> str | None:
         return f"#{rgb_str}"
 
     indexed = getattr(color, "indexed", None)
-    if isinstance(indexed, int) and _COLOR_INDEX is not None:
-        try:
-            argb = _COLOR_INDEX[indexed]
-            if isinstance(argb, str) and len(argb) == 8:
-                return f"#{argb[2:]}"
-        except Exception:
-            return None
+    if isinstance(indexed, int):
+        return _INDEXED_HEX.get(indexed)
 
     return None
 
 
-def _col_letter(index: int) -> str:
-    result = ""
-    while index > 0:
-        index, rem = divmod(index - 1, 26)
-        result = chr(65 + rem) + result
-    return result
-
-
 def _get_version() -> str:
     """Get openpyxl version."""
     return str(openpyxl.__version__)
 
 
+def _h_bool(c: Any, value: bool) -> CellValue:
+    return CellValue(_BOOLEAN, value)
+
+
+def _h_num(c: Any, value: float) -> CellValue:
+    return CellValue(_NUMBER, value)
+
+
+def _h_datetime(c: Any, value: datetime) -> CellValue:
+    # One time() compare beats four field reads, most of all for the
+    # midnight datetimes openpyxl returns for date cells.
+    if value.time() == _MIDNIGHT:
+        return CellValue(_DATE, value.date())
+    return CellValue(_DATETIME, value)
+
+
+def _h_date(c: Any, value: date) -> CellValue:
+    return CellValue(_DATE, value)
+
+
+def _h_str(c: Any, value: str) -> CellValue:
+    first = value[:1]
+    if first == "#" and is_error_string(value):
+        return CellValue(_ERROR, value)
+
+    if first == "=" or getattr(c, "data_type", None) == "f":
+        formula_str = f"={value}" if value and value[0] != "=" else value
+        if formula_str in ERROR_FORMULA_MAP:
+            return CellValue(_ERROR, ERROR_FORMULA_MAP[formula_str])
+        return CellValue(_FORMULA, value, formula_str)
+
+    return CellValue(_STRING, value)
+
+
+# Exact-type dispatch: openpyxl stores plain builtins, so one dict lookup
+# replaces the isinstance chain (kept in the fallback for subclasses).
+_HANDLERS: dict[type, Callable[[Any, Any], CellValue]] = {
+    bool: _h_bool,
+    int: _h_num,
+    float: _h_num,
+    str: _h_str,
+    datetime: _h_datetime,
+    date: _h_date,
+}
+
+
 def _cell_value_from_openpyxl_cell(c: Any) -> CellValue:
     """Convert an openpyxl Cell into a typed CellValue."""
     value = getattr(c, "value", None)
 
+    # Numbers are the bulk of most sheets: answer them before the table lookup.
+    t = type(value)
+    if t is float or t is int:
+        return CellValue(_NUMBER, value)
     if value is None:
-        return CellValue(type=CellType.BLANK)
+        return _BLANK
 
-    if isinstance(value, bool):
-        return CellValue(type=CellType.BOOLEAN, value=value)
+    handler = _HANDLERS.get(t)
+    if handler is not None:
+        return handler(c, value)
+    return _convert_subclassed(c, value)
 
-    if isinstance(value, (int, float)):
-        return CellValue(type=CellType.NUMBER, value=value)
 
-    # Check date BEFORE datetime since datetime is a subclass of date
-    if isinstance(value, date) and not isinstance(value, datetime):
-        return CellValue(type=CellType.DATE, value=value)
+def _cell_value_from_raw(value: Any) -> CellValue:
+    """Convert a ``values_only`` value; formulas are recognised by their "=" prefix."""
+    handler = _HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(None, value)
+    if value is None:
+        return _BLANK
+    return _convert_subclassed(None, value)
 
-    if isinstance(value, datetime):
-        if value.hour == 0 and value.minute == 0 and value.second == 0 and value.microsecond == 0:
-            return CellValue(type=CellType.DATE, value=value.date())
-        return CellValue(type=CellType.DATETIME, value=value)
 
+def _convert_subclassed(c: Any, value: Any) -> CellValue:
+    """Ordered isinstance fallback for values whose exact type has no handler."""
+    # bool before int, datetime before date: each is a subclass of the other.
+    if isinstance(value, bool):
+        return _h_bool(c, value)
+    if isinstance(value, (int, float)):
+        return _h_num(c, value)
+    if isinstance(value, datetime):
+        return _h_datetime(c, value)
+    if isinstance(value, date):
+        return _h_date(c, value)
     if isinstance(value, str):
-        if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
-            return CellValue(type=CellType.ERROR, value=value)
-        if value.startswith("#") and value.endswith("!"):
-            return CellValue(type=CellType.ERROR, value=value)
+        return _h_str(c, value)
+
+    return CellValue(_STRING, str(value))
+
+
+# Formulas that evaluate to each error value, used when writing ERROR cells.
+_ERROR_FORMULAS = {
+    "#DIV/0!": "=1/0",
+    "#N/A": "=NA()",
+    "#VALUE!": '="text"+1',
+    "#REF!": "=#REF!",
+    "#NAME?": "=_undefined_name_",
+    "#NUM!": "=SQRT(-1)",
+    "#NULL!": "=A1:A2 B1:B2",
+}
+
+
+# Workbook.__getitem__ rebuilds the sheet list and scans titles on every call,
+# which was ~40% of a per-cell read; resolved sheets are remembered per
+# workbook for as long as the workbook lives.
+_SHEETS: WeakKeyDictionary[Workbook, dict[str, Any]] = WeakKeyDictionary()
+
+
+def _worksheet(workbook: Workbook, sheet: str) -> Any:
+    """Return ``workbook[sheet]``, memoized per workbook."""
+    sheets = _SHEETS.get(workbook)
+    if sheets is None:
+        sheets = _SHEETS[workbook] = {}
+    ws = sheets.get(sheet)
+    # Drop entries for sheets renamed or removed since they were cached (a
+    # removed sheet may have been replaced by a new one with the same title).
+    if ws is None or ws.title != sheet or ws not in workbook._sheets:
+        ws = sheets[sheet] = workbook[sheet]
+    return ws
+
+
+def _iter_range(ws: Any, cell_range: str, values_only: bool = False) -> Any:
+    """Iterate *cell_range* row by row.
+
+    ``ws[cell_range]`` returns a bare Cell for a single-cell ref, so the
+    bounds are parsed and handed to ``iter_rows`` instead.
+    """
+    r0, c0, r1, c1 = range_bounds(cell_range)
+    return ws.iter_rows(
+        min_row=r0 + 1, max_row=r1 + 1, min_col=c0 + 1, max_col=c1 + 1, values_only=values_only
+    )
+
+
+def _cells_with(ws: Any, attr: str) -> list[Any]:
+    """Return the sheet's cells whose *attr* is set, in row-major order.
 
-        data_type = getattr(c, "data_type", None)
-        if data_type == "f" or (
-            hasattr(c, "value") and str(getattr(c, "value", "")).startswith("=")
-        ):
-            formula_str = str(getattr(c, "value", ""))
-            if formula_str and not formula_str.startswith("="):
-                formula_str = f"={formula_str}"
-            if not formula_str.startswith("=") and value:
-                formula_str = str(value)
-            if formula_str in ERROR_FORMULA_MAP:
-                return CellValue(type=CellType.ERROR, value=ERROR_FORMULA_MAP[formula_str])
-            return CellValue(type=CellType.FORMULA, value=value, formula=formula_str)
+    Walks only the cells openpyxl has stored rather than ``iter_rows()``,
+    which would materialize every empty cell of the used range.
+    """
+    found = [(key, cell) for key, cell in ws._cells.items() if getattr(cell, attr)]
+    found.sort(key=itemgetter(0))
+    return [cell for _, cell in found]
 
-        return CellValue(type=CellType.STRING, value=value)
 
-    return CellValue(type=CellType.STRING, value=str(value))
+def _openpyxl_raw_value(value: CellValue) -> Any:
+    """Return the Python value openpyxl should store for a CellValue."""
+    if value.type == CellType.BLANK:
+        return None
+    if value.type == CellType.FORMULA:
+        return value.formula or value.value
+    if value.type == CellType.ERROR:
+        # Write a formula that produces the error
+        return _ERROR_FORMULAS.get(value.value, value.value)
+    return value.value
+
+
+def _assign_openpyxl_value(c: Cell, value: CellValue) -> None:
+    """Store a CellValue on an openpyxl Cell."""
+    c.value = _openpyxl_raw_value(value)
+
+
+# Converted formats per workbook, keyed by the cell's (font, fill, numFmt,
+# alignment) style ids.  Those ids index append-only workbook collections, so
+# an entry stays valid for the workbook's lifetime; cells sharing a style
+# skip the StyleProxy attribute traversal entirely.
+_FORMATS: WeakKeyDictionary[Workbook, dict[tuple[int, int, int, int], CellFormat]] = (
+    WeakKeyDictionary()
+)
+
+
+def _cell_format_from_openpyxl_cell(c: Cell) -> CellFormat:
+    """Convert an openpyxl Cell's styling into a CellFormat."""
+    if type(c) is not Cell:
+        return _convert_cell_format(c)
+    style = c._style
+    # Unstyled cells may carry no StyleArray yet; that means all-default ids.
+    key = (style[0], style[1], style[3], style[5]) if style else (0, 0, 0, 0)
+    wb = c.parent.parent
+    formats = _FORMATS.get(wb)
+    if formats is None:
+        formats = _FORMATS[wb] = {}
+    fmt = formats.get(key)
+    if fmt is None:
+        fmt = formats[key] = _convert_cell_format(c)
+    return fmt
+
+
+def _convert_cell_format(c: Cell) -> CellFormat:
+    font = c.font
+
+    # Convert color to hex
+    font_color = _openpyxl_color_to_hex(getattr(font, "color", None))
+
+    # Get background color
+    bg_color = None
+    fill = c.fill
+    if fill and getattr(fill, "patternType", None) == "solid":
+        bg_color = _openpyxl_color_to_hex(getattr(fill, "fgColor", None))
+
+    # Map underline
+    underline = None
+    if font.underline:
+        underline_map = {
+            "single": "single",
+            "double": "double",
+            "singleAccounting": "singleAccounting",
+            "doubleAccounting": "doubleAccounting",
+        }
+        underline = underline_map.get(font.underline, font.underline)
+
+    alignment = c.alignment
+    h_align = alignment.horizontal if alignment and alignment.horizontal else None
+    v_align = alignment.vertical if alignment and alignment.vertical else None
+    wrap = alignment.wrap_text if alignment and alignment.wrap_text else None
+    rotation = (
+        alignment.text_rotation if alignment and alignment.text_rotation not in (0, None) else None
+    )
+    indent = alignment.indent if alignment and alignment.indent else None
+
+    return CellFormat(
+        bold=font.bold if font.bold else None,
+        italic=font.italic if font.italic else None,
+        underline=underline,
+        strikethrough=font.strike if font.strike else None,
+        font_name=font.name if font.name else None,
+        font_size=font.size if font.size else None,
+        font_color=font_color,
+        bg_color=bg_color,
+        number_format=c.number_format if c.number_format else None,
+        h_align=h_align,
+        v_align=v_align,
+        wrap=wrap,
+        rotation=rotation,
+        indent=indent,
+    )
+
+
+def _border_info_from_openpyxl_cell(c: Cell) -> BorderInfo:
+    """Convert an openpyxl Cell's border into a BorderInfo."""
+    border = c.border
+
+    def parse_side(side: Side | None) -> BorderEdge | None:
+        if side is None or side.style is None:
+            return None
+
+        # Map openpyxl style to our style
+        style_map = {
+            "thin": BorderStyle.THIN,
+            "medium": BorderStyle.MEDIUM,
+            "thick": BorderStyle.THICK,
+            "double": BorderStyle.DOUBLE,
+            "dashed": BorderStyle.DASHED,
+            "dotted": BorderStyle.DOTTED,
+            "hair": BorderStyle.HAIR,
+            "mediumDashed": BorderStyle.MEDIUM_DASHED,
+            "dashDot": BorderStyle.DASH_DOT,
+            "mediumDashDot": BorderStyle.MEDIUM_DASH_DOT,
+            "dashDotDot": BorderStyle.DASH_DOT_DOT,
+            "mediumDashDotDot": BorderStyle.MEDIUM_DASH_DOT_DOT,
+            "slantDashDot": BorderStyle.SLANT_DASH_DOT,
+        }
+
+        style = style_map.get(side.style, BorderStyle.THIN)
+
+        # Get color
+        color = _openpyxl_color_to_hex(getattr(side, "color", None)) or "#000000"
+
+        return BorderEdge(style=style, color=color)
+
+    return BorderInfo(
+        top=parse_side(border.top),
+        bottom=parse_side(border.bottom),
+        left=parse_side(border.left),
+        right=parse_side(border.right),
+        diagonal_up=parse_side(border.diagonal) if border.diagonalUp else None,
+        diagonal_down=parse_side(border.diagonal) if border.diagonalDown else None,
+    )
+
+
+_OPENPYXL_BORDER_STYLES: dict[BorderStyle, str | None] = {
+    BorderStyle.NONE: None,
+    BorderStyle.THIN: "thin",
+    BorderStyle.MEDIUM: "medium",
+    BorderStyle.THICK: "thick",
+    BorderStyle.DOUBLE: "double",
+    BorderStyle.DASHED: "dashed",
+    BorderStyle.DOTTED: "dotted",
+    BorderStyle.HAIR: "hair",
+    BorderStyle.MEDIUM_DASHED: "mediumDashed",
+    BorderStyle.DASH_DOT: "dashDot",
+    BorderStyle.MEDIUM_DASH_DOT: "mediumDashDot",
+    BorderStyle.DASH_DOT_DOT: "dashDotDot",
+    BorderStyle.MEDIUM_DASH_DOT_DOT: "mediumDashDotDot",
+    BorderStyle.SLANT_DASH_DOT: "slantDashDot",
+}
+
+# Style objects for the write path are built once per distinct color/style
+# and shared: openpyxl only reads them (cells hold read-only StyleProxies),
+# and handing back an equal object lets its style tables dedupe quickly.
+_NO_SIDE = Side()
+
+
+@lru_cache(maxsize=256)
+def _to_argb(hex_color: str) -> str:
+    """Opaque ARGB string ("FFRRGGBB") for a "#RRGGBB" (or bare "RRGGBB") color."""
+    return f"FF{hex_color.lstrip('#')}"
+
+
+@lru_cache(maxsize=256)
+def _argb_color(hex_color: str) -> Color:
+    return Color(rgb=_to_argb(hex_color))
+
+
+@lru_cache(maxsize=256)
+def _solid_fill(hex_color: str) -> PatternFill:
+    argb = _to_argb(hex_color)
+    return PatternFill(start_color=argb, end_color=argb, fill_type="solid")
+
+
+@lru_cache(maxsize=1024)
+def _side(style: str, hex_color: str) -> Side:
+    return Side(style=style, color=_argb_color(hex_color))
+
+
+_NO_FONT_KEY = (None,) * 7
+_NO_ALIGNMENT_KEY = (None,) * 5
+
+
+@lru_cache(maxsize=256)
+def _font(
+    bold: bool | None,
+    italic: bool | None,
+    underline: str | None,
+    strike: bool | None,
+    name: str | None,
+    size: float | None,
+    color: str | None,
+) -> Font:
+    """Font for the CellFormat font fields; Font() treats None as "use the default"."""
+    return Font(
+        bold=bold,
+        italic=italic,
+        underline=underline,
+        strike=strike,
+        name=name,
+        size=size,
+        color=_argb_color(color) if color is not None else None,
+    )
+
+
+@lru_cache(maxsize=256)
+def _alignment(
+    horizontal: str | None,
+    vertical: str | None,
+    wrap_text: bool | None,
+    text_rotation: int | None,
+    indent: int | None,
+) -> Alignment:
+    # indent is the one field that rejects None (its default is 0).
+    return Alignment(
+        horizontal=horizontal,
+        vertical=vertical,
+        wrap_text=wrap_text,
+        text_rotation=text_rotation,
+        indent=indent or 0,
+    )
 
 
 class OpenpyxlAdapter(ExcelAdapter):
     """Adapter for openpyxl library (read/write support)."""
 
+    __slots__ = ()
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
             name="openpyxl",
             version=_get_version(),
             language="python",
-            capabilities={"read", "write"},
+            capabilities={"read", "write", STREAM_WRITE},
         )
 
-    @property
-    def supported_read_extensions(self) -> set[str]:
-        return {".xlsx"}
+    supported_read_extensions: ClassVar[frozenset[str]] = frozenset({".xlsx"})
 
     def map_error_to_diagnostic(
         self,
@@ -182,9 +537,28 @@ class OpenpyxlAdapter(ExcelAdapter):
     # Read Operations
     # =========================================================================
 
-    def open_workbook(self, path: Path) -> Workbook:
-        """Open a workbook for reading."""
-        return openpyxl.load_workbook(str(path), data_only=False)
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Workbook:
+        """Open a workbook for reading.
+
+        ``opts.read_only`` selects openpyxl's streaming parser; external link
+        caches are skipped there since nothing can be written back.
+        """
+        return openpyxl.load_workbook(
+            str(path),
+            read_only=opts.read_only,
+            data_only=opts.data_only,
+            keep_links=not opts.read_only,
+        )
+
+    def open_workbook_from_stream(
+        self, stream: BinaryIO, opts: OpenOptions = OpenOptions()
+    ) -> Workbook:
+        return openpyxl.load_workbook(
+            stream,
+            read_only=opts.read_only,
+            data_only=opts.data_only,
+            keep_links=not opts.read_only,
+        )
 
     def close_workbook(self, workbook: Any) -> None:
         """Close an opened workbook."""
@@ -204,10 +578,10 @@ class OpenpyxlAdapter(ExcelAdapter):
 
         This is an optional helper used by performance workloads.
         """
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
 
         if cell_range:
-            rows = ws[cell_range]
+            rows = _iter_range(ws, cell_range)
         else:
             # Use the worksheet's used range.
             rows = ws.iter_rows()
@@ -220,6 +594,27 @@ class OpenpyxlAdapter(ExcelAdapter):
             out.append(out_row)
         return out
 
+    def read_used_range(
+        self,
+        workbook: Workbook,
+        sheet: str,
+    ) -> tuple[list[list[CellValue]], tuple[int, int, int, int]]:
+        """Read the worksheet's used range in a single ``iter_rows`` pass."""
+        ws = _worksheet(workbook, sheet)
+        # Capture the bounds before iterating: iter_rows() materializes cells.
+        min_row, min_col, max_row, max_col = (
+            ws.min_row,
+            ws.min_column,
+            ws.max_row,
+            ws.max_column,
+        )
+        rows = ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col)
+        out = [[_cell_value_from_openpyxl_cell(c) for c in row] for row in rows]
+        if not out or (len(out) == 1 and len(out[0]) == 1 and out[0][0].type == CellType.BLANK):
+            # openpyxl reports A1:A1 for an empty sheet (read-only mode yields no rows).
+            return [], (0, 0, -1, -1)
+        return out, (min_row - 1, min_col - 1, max_row - 1, max_col - 1)
+
     def read_sheet_values_raw(
         self,
         workbook: Workbook,
@@ -227,11 +622,30 @@ class OpenpyxlAdapter(ExcelAdapter):
         cell_range: str | None = None,
     ) -> list[tuple[Any, ...]]:
         """Return raw openpyxl Cell tuples without CellValue conversion."""
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         if cell_range:
-            return list(ws[cell_range])
+            return list(_iter_range(ws, cell_range))
         return list(ws.iter_rows())
 
+    def read_sheet_cells_soa(
+        self,
+        workbook: Workbook,
+        sheet: str,
+        cell_range: str | None = None,
+        pool: StringPool | None = None,
+    ) -> SoABlock:
+        """Encode ``iter_rows(values_only=True)`` straight into SoA columns.
+
+        No Cell objects are handed out and blank/numeric values skip
+        CellValue wrapping; works in read-only mode too.
+        """
+        ws = _worksheet(workbook, sheet)
+        if cell_range:
+            rows = _iter_range(ws, cell_range, values_only=True)
+        else:
+            rows = ws.iter_rows(values_only=True)
+        return raw_to_soa(list(rows), _cell_value_from_raw, range_origin(cell_range), pool)
+
     def read_cell_value(
         self,
         workbook: Workbook,
@@ -239,9 +653,12 @@ class OpenpyxlAdapter(ExcelAdapter):
         cell: str,
     ) -> CellValue:
         """Read the value of a cell."""
-        ws = workbook[sheet]
-        c: Cell = ws[cell]
-        return _cell_value_from_openpyxl_cell(c)
+        ws = _worksheet(workbook, sheet)
+        if type(ws) is Worksheet:
+            # ws[cell] would create (and keep) an empty Cell for absent refs.
+            c = ws._cells.get(cell_to_coord(cell))
+            return _BLANK if c is None else _cell_value_from_openpyxl_cell(c)
+        return _cell_value_from_openpyxl_cell(ws[cell])
 
     def read_cell_format(
         self,
@@ -250,57 +667,7 @@ class OpenpyxlAdapter(ExcelAdapter):
         cell: str,
     ) -> CellFormat:
         """Read the formatting of a cell."""
-        ws = workbook[sheet]
-        c: Cell = ws[cell]
-        font = c.font
-
-        # Convert color to hex
-        font_color = _openpyxl_color_to_hex(getattr(font, "color", None))
-
-        # Get background color
-        bg_color = None
-        fill = c.fill
-        if fill and getattr(fill, "patternType", None) == "solid":
-            bg_color = _openpyxl_color_to_hex(getattr(fill, "fgColor", None))
-
-        # Map underline
-        underline = None
-        if font.underline:
-            underline_map = {
-                "single": "single",
-                "double": "double",
-                "singleAccounting": "singleAccounting",
-                "doubleAccounting": "doubleAccounting",
-            }
-            underline = underline_map.get(font.underline, font.underline)
-
-        alignment = c.alignment
-        h_align = alignment.horizontal if alignment and alignment.horizontal else None
-        v_align = alignment.vertical if alignment and alignment.vertical else None
-        wrap = alignment.wrap_text if alignment and alignment.wrap_text else None
-        rotation = (
-            alignment.text_rotation
-            if alignment and alignment.text_rotation not in (0, None)
-            else None
-        )
-        indent = alignment.indent if alignment and alignment.indent else None
-
-        return CellFormat(
-            bold=font.bold if font.bold else None,
-            italic=font.italic if font.italic else None,
-            underline=underline,
-            strikethrough=font.strike if font.strike else None,
-            font_name=font.name if font.name else None,
-            font_size=font.size if font.size else None,
-            font_color=font_color,
-            bg_color=bg_color,
-            number_format=c.number_format if c.number_format else None,
-            h_align=h_align,
-            v_align=v_align,
-            wrap=wrap,
-            rotation=rotation,
-            indent=indent,
-        )
+        return _cell_format_from_openpyxl_cell(_worksheet(workbook, sheet)[cell])
 
     def read_cell_border(
         self,
@@ -309,46 +676,22 @@ class OpenpyxlAdapter(ExcelAdapter):
         cell: str,
     ) -> BorderInfo:
         """Read the border information of a cell."""
-        ws = workbook[sheet]
-        c: Cell = ws[cell]
-        border = c.border
-
-        def parse_side(side: Side | None) -> BorderEdge | None:
-            if side is None or side.style is None:
-                return None
-
-            # Map openpyxl style to our style
-            style_map = {
-                "thin": BorderStyle.THIN,
-                "medium": BorderStyle.MEDIUM,
-                "thick": BorderStyle.THICK,
-                "double": BorderStyle.DOUBLE,
-                "dashed": BorderStyle.DASHED,
-                "dotted": BorderStyle.DOTTED,
-                "hair": BorderStyle.HAIR,
-                "mediumDashed": BorderStyle.MEDIUM_DASHED,
-                "dashDot": BorderStyle.DASH_DOT,
-                "mediumDashDot": BorderStyle.MEDIUM_DASH_DOT,
-                "dashDotDot": BorderStyle.DASH_DOT_DOT,
-                "mediumDashDotDot": BorderStyle.MEDIUM_DASH_DOT_DOT,
-                "slantDashDot": BorderStyle.SLANT_DASH_DOT,
-            }
-
-            style = style_map.get(side.style, BorderStyle.THIN)
+        return _border_info_from_openpyxl_cell(_worksheet(workbook, sheet)[cell])
 
-            # Get color
-            color = _openpyxl_color_to_hex(getattr(side, "color", None)) or "#000000"
+    def read_cell_value_rc(self, workbook: Workbook, sheet: str, row: int, col: int) -> CellValue:
+        ws = _worksheet(workbook, sheet)
+        if type(ws) is Worksheet:
+            c = ws._cells.get((row + 1, col + 1))
+            return _BLANK if c is None else _cell_value_from_openpyxl_cell(c)
+        return _cell_value_from_openpyxl_cell(ws.cell(row=row + 1, column=col + 1))
 
-            return BorderEdge(style=style, color=color)
+    def read_cell_format_rc(self, workbook: Workbook, sheet: str, row: int, col: int) -> CellFormat:
+        ws = _worksheet(workbook, sheet)
+        return _cell_format_from_openpyxl_cell(ws.cell(row=row + 1, column=col + 1))
 
-        return BorderInfo(
-            top=parse_side(border.top),
-            bottom=parse_side(border.bottom),
-            left=parse_side(border.left),
-            right=parse_side(border.right),
-            diagonal_up=parse_side(border.diagonal) if border.diagonalUp else None,
-            diagonal_down=parse_side(border.diagonal) if border.diagonalDown else None,
-        )
+    def read_cell_border_rc(self, workbook: Workbook, sheet: str, row: int, col: int) -> BorderInfo:
+        ws = _worksheet(workbook, sheet)
+        return _border_info_from_openpyxl_cell(ws.cell(row=row + 1, column=col + 1))
 
     def read_row_height(
         self,
@@ -356,7 +699,7 @@ class OpenpyxlAdapter(ExcelAdapter):
         sheet: str,
         row: int,
     ) -> float | None:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         height = ws.row_dimensions[row].height
         return float(height) if isinstance(height, (int, float)) else None
 
@@ -366,7 +709,7 @@ class OpenpyxlAdapter(ExcelAdapter):
         sheet: str,
         column: str,
     ) -> float | None:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         width = ws.column_dimensions[column].width
         if width is None:
             return None
@@ -374,14 +717,9 @@ class OpenpyxlAdapter(ExcelAdapter):
             width_f = float(width)
         except (TypeError, ValueError):
             return None
-        # Excel and third-party libraries add font-metric padding to stored
-        # column widths. Known paddings:
-        #   0.83203125 - Excel (Calibri 11pt default)
-        #   0.7109375  - xlsxwriter
-        # Strip the padding to return the display character width.
+        # Strip font-metric padding to return the display character width.
         frac = width_f % 1
-        known_paddings = [0.83203125, 0.7109375]
-        for padding in known_paddings:
+        for padding in _WIDTH_PADDINGS:
             if abs(frac - padding) < 0.01:
                 width_f = width_f - padding
                 break
@@ -392,11 +730,11 @@ class OpenpyxlAdapter(ExcelAdapter):
     # =========================================================================
 
     def read_merged_ranges(self, workbook: Workbook, sheet: str) -> list[str]:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         return [str(rng) for rng in ws.merged_cells.ranges]
 
     def read_conditional_formats(self, workbook: Workbook, sheet: str) -> list[JSONDict]:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         rules: list[JSONDict] = []
         cf_rules = getattr(ws.conditional_formatting, "_cf_rules", {})
         for sqref, rule_list in cf_rules.items():
@@ -434,7 +772,7 @@ class OpenpyxlAdapter(ExcelAdapter):
         return rules
 
     def read_data_validations(self, workbook: Workbook, sheet: str) -> list[JSONDict]:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         validations: list[JSONDict] = []
         dv = getattr(ws, "data_validations", None)
         if not dv:
@@ -463,36 +801,33 @@ class OpenpyxlAdapter(ExcelAdapter):
         return validations
 
     def read_hyperlinks(self, workbook: Workbook, sheet: str) -> list[JSONDict]:
-        ws = workbook[sheet]
         links: list[JSONDict] = []
-        for row in ws.iter_rows():
-            for cell in row:
-                if cell.hyperlink:
-                    h = cell.hyperlink
-                    # xlsx stores URL and fragment separately (target + location).
-                    # Recombine when both exist (e.g. https://...#section-2).
-                    if h.target and h.location:
-                        target = f"{h.target}#{h.location}"
-                        internal = False
-                    elif h.target:
-                        target = h.target
-                        internal = False
-                    else:
-                        target = h.location
-                        internal = True
-                    links.append(
-                        {
-                            "cell": cell.coordinate,
-                            "target": target,
-                            "display": cell.value,
-                            "tooltip": h.tooltip,
-                            "internal": internal,
-                        }
-                    )
+        for cell in _cells_with(_worksheet(workbook, sheet), "hyperlink"):
+            h = cell.hyperlink
+            # xlsx stores URL and fragment separately (target + location).
+            # Recombine when both exist (e.g. https://...#section-2).
+            if h.target and h.location:
+                target = f"{h.target}#{h.location}"
+                internal = False
+            elif h.target:
+                target = h.target
+                internal = False
+            else:
+                target = h.location
+                internal = True
+            links.append(
+                {
+                    "cell": cell.coordinate,
+                    "target": target,
+                    "display": cell.value,
+                    "tooltip": h.tooltip,
+                    "internal": internal,
+                }
+            )
         return links
 
     def read_images(self, workbook: Workbook, sheet: str) -> list[JSONDict]:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         images: list[JSONDict] = []
         for img in getattr(ws, "_images", []):
             anchor = getattr(img, "anchor", None)
@@ -508,7 +843,7 @@ class OpenpyxlAdapter(ExcelAdapter):
                 col = getattr(from_anchor, "col", None)
                 row = getattr(from_anchor, "row", None)
                 if isinstance(col, int) and isinstance(row, int):
-                    cell = f"{_col_letter(col + 1)}{row + 1}"
+                    cell = coord_to_a1(row, col)
                 col_off = getattr(from_anchor, "colOff", None)
                 row_off = getattr(from_anchor, "rowOff", None)
                 if col_off is not None and row_off is not None:
@@ -528,7 +863,7 @@ class OpenpyxlAdapter(ExcelAdapter):
         return images
 
     def read_pivot_tables(self, workbook: Workbook, sheet: str) -> list[JSONDict]:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         pivots: list[JSONDict] = []
         pivot_list = getattr(ws, "_pivots", []) or []
         for pivot in pivot_list:
@@ -576,23 +911,18 @@ class OpenpyxlAdapter(ExcelAdapter):
         return pivots
 
     def read_comments(self, workbook: Workbook, sheet: str) -> list[JSONDict]:
-        ws = workbook[sheet]
-        comments: list[JSONDict] = []
-        for row in ws.iter_rows():
-            for cell in row:
-                if cell.comment:
-                    comments.append(
-                        {
-                            "cell": cell.coordinate,
-                            "text": cell.comment.text,
-                            "author": cell.comment.author,
-                            "threaded": False,
-                        }
-                    )
-        return comments
+        return [
+            {
+                "cell": cell.coordinate,
+                "text": cell.comment.text,
+                "author": cell.comment.author,
+                "threaded": False,
+            }
+            for cell in _cells_with(_worksheet(workbook, sheet), "comment")
+        ]
 
     def read_freeze_panes(self, workbook: Workbook, sheet: str) -> JSONDict:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         result: JSONDict = {}
         if ws.freeze_panes:
             freeze = ws.freeze_panes
@@ -655,7 +985,7 @@ class OpenpyxlAdapter(ExcelAdapter):
             )
 
         # Sheet-scoped names: only for the requested sheet.
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         sheet_id = workbook.worksheets.index(ws)
         seen: set[tuple[str, str, str]] = set()
 
@@ -697,7 +1027,7 @@ class OpenpyxlAdapter(ExcelAdapter):
     def read_tables(self, workbook: Workbook, sheet: str) -> list[JSONDict]:
         from openpyxl.utils.cell import range_boundaries
 
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         out: list[JSONDict] = []
         for tbl in ws.tables.values():
             cols: list[str] = []
@@ -766,12 +1096,8 @@ class OpenpyxlAdapter(ExcelAdapter):
 
         Optional helper used by performance workloads.
         """
-        from openpyxl.utils.cell import column_index_from_string, coordinate_from_string
-
-        ws = workbook[sheet]
-        col_str, row = coordinate_from_string(start_cell)
-        start_row = int(row)
-        start_col = int(column_index_from_string(col_str))
+        ws = _worksheet(workbook, sheet)
+        start_row, start_col = cell_to_coord(start_cell)
 
         for r, row_vals in enumerate(values):
             for c, v in enumerate(row_vals):
@@ -788,27 +1114,26 @@ class OpenpyxlAdapter(ExcelAdapter):
         value: CellValue,
     ) -> None:
         """Write a value to a cell."""
-        ws = workbook[sheet]
-        c: Cell = ws[cell]
+        _assign_openpyxl_value(_worksheet(workbook, sheet)[cell], value)
 
-        if value.type == CellType.BLANK:
-            c.value = None
-        elif value.type == CellType.FORMULA:
-            c.value = value.formula or value.value
-        elif value.type == CellType.ERROR:
-            # Write a formula that produces the error
-            error_formulas = {
-                "#DIV/0!": "=1/0",
-                "#N/A": "=NA()",
-                "#VALUE!": '="text"+1',
-                "#REF!": "=#REF!",
-                "#NAME?": "=_undefined_name_",
-                "#NUM!": "=SQRT(-1)",
-                "#NULL!": "=A1:A2 B1:B2",
-            }
-            c.value = error_formulas.get(value.value, value.value)
-        else:
-            c.value = value.value
+    def write_cell_value_rc(
+        self, workbook: Workbook, sheet: str, row: int, col: int, value: CellValue
+    ) -> None:
+        _assign_openpyxl_value(_worksheet(workbook, sheet).cell(row=row + 1, column=col + 1), value)
+
+    def write_rows(
+        self,
+        workbook: Workbook,
+        sheet: str,
+        row0: int,
+        col0: int,
+        rows: Iterable[Sequence[CellValue]],
+    ) -> None:
+        """Write a block of rows, resolving the worksheet once."""
+        cell_at = _worksheet(workbook, sheet).cell
+        for r, row in enumerate(rows, row0 + 1):
+            for c, value in enumerate(row, col0 + 1):
+                _assign_openpyxl_value(cell_at(row=r, column=c), value)
 
     def write_cell_format(
         self,
@@ -818,59 +1143,31 @@ class OpenpyxlAdapter(ExcelAdapter):
         format: CellFormat,
     ) -> None:
         """Apply formatting to a cell."""
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         c: Cell = ws[cell]
 
-        # Build font kwargs
-        font_kwargs: dict[str, Any] = {}
-
-        if format.bold is not None:
-            font_kwargs["bold"] = format.bold
-        if format.italic is not None:
-            font_kwargs["italic"] = format.italic
-        if format.underline is not None:
-            font_kwargs["underline"] = format.underline
-        if format.strikethrough is not None:
-            font_kwargs["strike"] = format.strikethrough
-        if format.font_name is not None:
-            font_kwargs["name"] = format.font_name
-        if format.font_size is not None:
-            font_kwargs["size"] = format.font_size
-        if format.font_color is not None:
-            from openpyxl.styles import Color
-
-            # Remove # prefix if present
-            hex_color = format.font_color.lstrip("#")
-            font_kwargs["color"] = Color(rgb=f"FF{hex_color}")
-
-        if font_kwargs:
-            c.font = Font(**font_kwargs)
+        font_key = (
+            format.bold,
+            format.italic,
+            format.underline,
+            format.strikethrough,
+            format.font_name,
+            format.font_size,
+            format.font_color,
+        )
+        if font_key != _NO_FONT_KEY:
+            c.font = _font(*font_key)
 
         # Apply background color
         if format.bg_color is not None:
-            hex_color = format.bg_color.lstrip("#")
-            c.fill = PatternFill(
-                start_color=f"FF{hex_color}",
-                end_color=f"FF{hex_color}",
-                fill_type="solid",
-            )
+            c.fill = _solid_fill(format.bg_color)
 
         if format.number_format is not None:
             c.number_format = format.number_format
 
-        align_kwargs: dict[str, Any] = {}
-        if format.h_align is not None:
-            align_kwargs["horizontal"] = format.h_align
-        if format.v_align is not None:
-            align_kwargs["vertical"] = format.v_align
-        if format.wrap is not None:
-            align_kwargs["wrap_text"] = format.wrap
-        if format.rotation is not None:
-            align_kwargs["text_rotation"] = format.rotation
-        if format.indent is not None:
-            align_kwargs["indent"] = format.indent
-        if align_kwargs:
-            c.alignment = Alignment(**align_kwargs)
+        align_key = (format.h_align, format.v_align, format.wrap, format.rotation, format.indent)
+        if align_key != _NO_ALIGNMENT_KEY:
+            c.alignment = _alignment(*align_key)
 
     def write_cell_border(
         self,
@@ -880,42 +1177,19 @@ class OpenpyxlAdapter(ExcelAdapter):
         border: BorderInfo,
     ) -> None:
         """Apply border to a cell."""
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         c: Cell = ws[cell]
 
         def make_side(edge: BorderEdge | None) -> Side:
             if edge is None:
-                return Side()
-
-            # Map our style to openpyxl style
-            style_map = {
-                BorderStyle.NONE: None,
-                BorderStyle.THIN: "thin",
-                BorderStyle.MEDIUM: "medium",
-                BorderStyle.THICK: "thick",
-                BorderStyle.DOUBLE: "double",
-                BorderStyle.DASHED: "dashed",
-                BorderStyle.DOTTED: "dotted",
-                BorderStyle.HAIR: "hair",
-                BorderStyle.MEDIUM_DASHED: "mediumDashed",
-                BorderStyle.DASH_DOT: "dashDot",
-                BorderStyle.MEDIUM_DASH_DOT: "mediumDashDot",
-                BorderStyle.DASH_DOT_DOT: "dashDotDot",
-                BorderStyle.MEDIUM_DASH_DOT_DOT: "mediumDashDotDot",
-                BorderStyle.SLANT_DASH_DOT: "slantDashDot",
-            }
-
-            style = style_map.get(edge.style)
+                return _NO_SIDE
+            style = _OPENPYXL_BORDER_STYLES.get(edge.style)
             if style is None:
-                return Side()
-
-            hex_color = edge.color.lstrip("#")
-            from openpyxl.styles import Color
-
-            return Side(style=style, color=Color(rgb=f"FF{hex_color}"))
+                return _NO_SIDE
+            return _side(style, edge.color)
 
         # Determine diagonal settings
-        diagonal_side = Side()
+        diagonal_side = _NO_SIDE
         diagonal_up = False
         diagonal_down = False
 
@@ -936,10 +1210,16 @@ class OpenpyxlAdapter(ExcelAdapter):
             diagonalDown=diagonal_down,
         )
 
+    def begin_streaming_write(self, path: Path) -> StreamWriter:
+        return OpenpyxlStreamWriter(path)
+
     def save_workbook(self, workbook: Workbook, path: Path) -> None:
         """Save a workbook to a file."""
         workbook.save(str(path))
 
+    def save_workbook_to_stream(self, workbook: Workbook, stream: BinaryIO) -> None:
+        workbook.save(stream)
+
     def set_row_height(
         self,
         workbook: Workbook,
@@ -947,7 +1227,7 @@ class OpenpyxlAdapter(ExcelAdapter):
         row: int,
         height: float,
     ) -> None:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         ws.row_dimensions[row].height = height
 
     def set_column_width(
@@ -957,7 +1237,7 @@ class OpenpyxlAdapter(ExcelAdapter):
         column: str,
         width: float,
     ) -> None:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         ws.column_dimensions[column].width = width
 
     # =========================================================================
@@ -965,11 +1245,11 @@ class OpenpyxlAdapter(ExcelAdapter):
     # =========================================================================
 
     def merge_cells(self, workbook: Workbook, sheet: str, cell_range: str) -> None:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         ws.merge_cells(cell_range)
 
     def add_conditional_format(self, workbook: Workbook, sheet: str, rule: JSONDict) -> None:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         cf = rule.get("cf_rule", rule)
         range_ref = cf.get("range")
         rule_type = cf.get("rule_type")
@@ -981,13 +1261,9 @@ class OpenpyxlAdapter(ExcelAdapter):
         fill = None
         font = None
         if fmt.get("bg_color"):
-            hex_color = fmt["bg_color"].lstrip("#")
-            fill = PatternFill(
-                start_color=f"FF{hex_color}", end_color=f"FF{hex_color}", fill_type="solid"
-            )
+            fill = _solid_fill(fmt["bg_color"])
         if fmt.get("font_color"):
-            hex_color = fmt["font_color"].lstrip("#")
-            font = Font(color=f"FF{hex_color}")
+            font = _font(None, None, None, None, None, None, fmt["font_color"])
 
         rule_obj = None
         if rule_type in ("cellIs", "cellIsRule"):
@@ -1029,7 +1305,7 @@ class OpenpyxlAdapter(ExcelAdapter):
             ws.conditional_formatting.add(range_ref, rule_obj)
 
     def add_data_validation(self, workbook: Workbook, sheet: str, validation: JSONDict) -> None:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         v = validation.get("validation", validation)
         dv = DataValidation(
             type=v.get("validation_type"),
@@ -1048,7 +1324,7 @@ class OpenpyxlAdapter(ExcelAdapter):
         dv.add(v.get("range"))
 
     def add_hyperlink(self, workbook: Workbook, sheet: str, link: JSONDict) -> None:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         data = link.get("hyperlink", link)
         cell = data.get("cell")
         target = data.get("target")
@@ -1075,7 +1351,7 @@ class OpenpyxlAdapter(ExcelAdapter):
             c.hyperlink.tooltip = tooltip
 
     def add_image(self, workbook: Workbook, sheet: str, image: JSONDict) -> None:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         data = image.get("image", image)
         path = data.get("path")
         cell = data.get("cell")
@@ -1088,7 +1364,7 @@ class OpenpyxlAdapter(ExcelAdapter):
         raise NotImplementedError("openpyxl does not support pivot table creation")
 
     def add_comment(self, workbook: Workbook, sheet: str, comment: JSONDict) -> None:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         data = comment.get("comment", comment)
         cell = data.get("cell")
         text = data.get("text")
@@ -1122,7 +1398,7 @@ class OpenpyxlAdapter(ExcelAdapter):
             attr_text=(f"={refers_to_str}" if not refers_to_str.startswith("=") else refers_to_str),
         )
         if scope == "sheet":
-            ws = workbook[sheet]
+            ws = _worksheet(workbook, sheet)
             ws.defined_names.add(dn)
         else:
             workbook.defined_names.add(dn)
@@ -1165,7 +1441,7 @@ class OpenpyxlAdapter(ExcelAdapter):
         else:
             # Best-effort: infer columns from header row cells.
             try:
-                ws = workbook[sheet]
+                ws = _worksheet(workbook, sheet)
                 min_col, min_row, max_col, _ = range_boundaries(str(ref))
                 if min_col is not None and min_row is not None and max_col is not None:
                     inferred: list[str] = []
@@ -1184,11 +1460,11 @@ class OpenpyxlAdapter(ExcelAdapter):
         if data.get("autofilter"):
             tbl.autoFilter = AutoFilter(ref=str(ref))
 
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         ws.add_table(tbl)
 
     def set_freeze_panes(self, workbook: Workbook, sheet: str, settings: JSONDict) -> None:
-        ws = workbook[sheet]
+        ws = _worksheet(workbook, sheet)
         cfg = settings.get("freeze", settings)
         mode = cfg.get("mode")
         if mode == "freeze":
@@ -1210,3 +1486,26 @@ class OpenpyxlAdapter(ExcelAdapter):
             if cfg.get("active_pane") is not None:
                 pane.activePane = cfg["active_pane"]
             pane.state = "split"
+
+
+class OpenpyxlStreamWriter(StreamWriter):
+    """Row sink backed by an openpyxl ``write_only`` workbook."""
+
+    __slots__ = ("_path", "_wb", "_ws")
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._wb = Workbook(write_only=True)
+        self._ws: Any = None
+
+    def add_sheet(self, name: str) -> None:
+        self._ws = self._wb.create_sheet(name)
+
+    def append_row(self, row: Sequence[Any]) -> None:
+        if self._ws is None:
+            raise ValueError("add_sheet() must be called before append_row()")
+        self._ws.append([_openpyxl_raw_value(v) if isinstance(v, CellValue) else v for v in row])
+
+    def close(self) -> None:
+        # write_only workbooks serialize everything in a single save().
+        self._wb.save(str(self._path))
@@ -6,23 +6,46 @@ lazy-loading iterators instead of building the full DOM.  Some metadata
 available — measuring the read-mode fidelity difference vs. full mode.
 """
 
-from datetime import date, datetime
+from collections.abc import Sequence
+from datetime import date, datetime, time
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import openpyxl
 
+from excelbench.harness.adapters.a1 import cell_to_coord, range_bounds
 from excelbench.harness.adapters.base import ReadOnlyAdapter
+from excelbench.harness.adapters.error_values import is_error_string
 from excelbench.models import (
     BorderInfo,
     CellFormat,
     CellType,
     CellValue,
     LibraryInfo,
+    OpenOptions,
 )
 
 JSONDict = dict[str, Any]
 
+# Hot-path CellValues are built positionally with pre-bound enum members
+# (keyword arguments and CellType.X lookups cost more than the slotted
+# instance itself); blanks share one instance, which callers never mutate.
+_BLANK = CellValue(type=CellType.BLANK)
+_NUMBER = CellType.NUMBER
+_DATE = CellType.DATE
+_DATETIME = CellType.DATETIME
+_STRING = CellType.STRING
+_MIDNIGHT = time()
+
+
+def _range_to_rc(cell_range: str) -> tuple[int, int, int, int]:
+    """Parse an A1 range to 1-based inclusive bounds, defaulting to A1."""
+    try:
+        r0, c0, r1, c1 = range_bounds(cell_range)
+    except ValueError:
+        return 1, 1, 1, 1
+    return r0 + 1, c0 + 1, r1 + 1, c1 + 1
+
 
 def _get_version() -> str:
     return str(openpyxl.__version__)
@@ -36,6 +59,8 @@ class OpenpyxlReadonlyAdapter(ReadOnlyAdapter):
     supported and raise ``NotImplementedError`` via :class:`ReadOnlyAdapter`.
     """
 
+    __slots__ = ()
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
@@ -45,16 +70,14 @@ class OpenpyxlReadonlyAdapter(ReadOnlyAdapter):
             capabilities={"read"},
         )
 
-    @property
-    def supported_read_extensions(self) -> set[str]:
-        return {".xlsx"}
+    supported_read_extensions: ClassVar[frozenset[str]] = frozenset({".xlsx"})
 
     # =========================================================================
     # Read Operations
     # =========================================================================
 
-    def open_workbook(self, path: Path) -> Any:
-        return openpyxl.load_workbook(str(path), data_only=False, read_only=True)
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
+        return openpyxl.load_workbook(str(path), data_only=opts.data_only, read_only=True)
 
     def close_workbook(self, workbook: Any) -> None:
         workbook.close()
@@ -75,31 +98,7 @@ class OpenpyxlReadonlyAdapter(ReadOnlyAdapter):
         ws = workbook[sheet]
 
         if cell_range:
-            import re
-
-            clean = cell_range.replace("$", "").upper()
-            if ":" in clean:
-                a, b = clean.split(":", 1)
-            else:
-                a, b = clean, clean
-
-            def _cell_to_rc(cell: str) -> tuple[int, int]:
-                m = re.match(r"([A-Z]+)(\d+)", cell)
-                if not m:
-                    return 1, 1
-                col_str, row_str = m.groups()
-                row = int(row_str)
-                col = 0
-                for ch in col_str:
-                    col = col * 26 + (ord(ch) - ord("A") + 1)
-                return row, col
-
-            r0, c0 = _cell_to_rc(a)
-            r1, c1 = _cell_to_rc(b)
-            if r1 < r0:
-                r0, r1 = r1, r0
-            if c1 < c0:
-                c0, c1 = c1, c0
+            r0, c0, r1, c1 = _range_to_rc(cell_range)
 
             rows = ws.iter_rows(min_row=r0, max_row=r1, min_col=c0, max_col=c1)
         else:
@@ -119,31 +118,7 @@ class OpenpyxlReadonlyAdapter(ReadOnlyAdapter):
         """Return raw ReadOnlyCell rows without CellValue conversion."""
         ws = workbook[sheet]
         if cell_range:
-            import re
-
-            clean = cell_range.replace("$", "").upper()
-            if ":" in clean:
-                a, b = clean.split(":", 1)
-            else:
-                a, b = clean, clean
-
-            def _cell_to_rc(ref: str) -> tuple[int, int]:
-                m = re.match(r"([A-Z]+)(\d+)", ref)
-                if not m:
-                    return 1, 1
-                col_str, row_str = m.groups()
-                row = int(row_str)
-                col = 0
-                for ch in col_str:
-                    col = col * 26 + (ord(ch) - ord("A") + 1)
-                return row, col
-
-            r0, c0 = _cell_to_rc(a)
-            r1, c1 = _cell_to_rc(b)
-            if r1 < r0:
-                r0, r1 = r1, r0
-            if c1 < c0:
-                c0, c1 = c1, c0
+            r0, c0, r1, c1 = _range_to_rc(cell_range)
             return [list(row) for row in ws.iter_rows(
                 min_row=r0, max_row=r1, min_col=c0, max_col=c1
             )]
@@ -159,17 +134,10 @@ class OpenpyxlReadonlyAdapter(ReadOnlyAdapter):
 
         # ReadOnlyWorksheet doesn't support ws[cell] random access directly.
         # We need to use iter_rows to reach the target cell.
-        import re
-
-        match = re.match(r"([A-Z]+)(\d+)", cell.upper())
-        if not match:
-            return CellValue(type=CellType.BLANK)
-
-        col_str, row_str = match.groups()
-        target_row = int(row_str)
-        target_col = 0
-        for char in col_str:
-            target_col = target_col * 26 + (ord(char) - ord("A") + 1)
+        try:
+            target_row, target_col = cell_to_coord(cell)
+        except ValueError:
+            return _BLANK
 
         # iter_rows with specific range for efficiency
         for row in ws.iter_rows(
@@ -182,14 +150,56 @@ class OpenpyxlReadonlyAdapter(ReadOnlyAdapter):
                 c = row[0]
                 return self._classify_value(c)
 
-        return CellValue(type=CellType.BLANK)
+        return _BLANK
+
+    def read_cells(
+        self,
+        workbook: Any,
+        sheet: str,
+        coords: Sequence[tuple[int, int]],
+    ) -> list[CellValue]:
+        """Read sparse cells in one streaming pass over their bounding box.
+
+        read_cell_value() restarts the XML stream for every cell; here the
+        requested cells are grouped by row and plucked as the rows go by.
+        """
+        out = [_BLANK] * len(coords)
+        if not coords:
+            return out
+        wanted: dict[int, list[tuple[int, int]]] = {}
+        for i, (row, col) in enumerate(coords):
+            wanted.setdefault(row, []).append((col, i))
+        r_min, r_max = min(wanted), max(wanted)
+        c_min = min(col for _, col in coords)
+        c_max = max(col for _, col in coords)
+        rows = workbook[sheet].iter_rows(
+            min_row=r_min + 1, max_row=r_max + 1, min_col=c_min + 1, max_col=c_max + 1
+        )
+        for row_idx, cells in enumerate(rows, start=r_min):
+            for col, i in wanted.get(row_idx, ()):
+                k = col - c_min
+                if k < len(cells):
+                    out[i] = self._classify_value(cells[k])
+        return out
 
     @staticmethod
     def _classify_value(c: Any) -> CellValue:
         value = c.value
 
         if value is None:
-            return CellValue(type=CellType.BLANK)
+            return _BLANK
+
+        # Exact-type checks first: openpyxl stores plain int/float/str, so the
+        # common cells skip the isinstance chain (kept below for subclasses).
+        t = type(value)
+        if t is float or t is int:
+            return CellValue(_NUMBER, value)
+        if t is str and value[:1] not in ("#", "=") and getattr(c, "data_type", None) != "f":
+            return CellValue(_STRING, value)
+        if t is datetime:
+            if value.time() == _MIDNIGHT:
+                return CellValue(_DATE, value.date())
+            return CellValue(_DATETIME, value)
 
         if isinstance(value, bool):
             return CellValue(type=CellType.BOOLEAN, value=value)
@@ -201,19 +211,12 @@ class OpenpyxlReadonlyAdapter(ReadOnlyAdapter):
             return CellValue(type=CellType.DATE, value=value)
 
         if isinstance(value, datetime):
-            if (
-                value.hour == 0
-                and value.minute == 0
-                and value.second == 0
-                and value.microsecond == 0
-            ):
+            if value.time() == _MIDNIGHT:
                 return CellValue(type=CellType.DATE, value=value.date())
             return CellValue(type=CellType.DATETIME, value=value)
 
         if isinstance(value, str):
-            if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
-                return CellValue(type=CellType.ERROR, value=value)
-            if value.startswith("#") and value.endswith("!"):
+            if is_error_string(value):
                 return CellValue(type=CellType.ERROR, value=value)
 
             # Check formula via data_type attribute
@@ -6,27 +6,35 @@ are lost in the DataFrame abstraction.  This adapter measures the
 "abstraction cost" of going through pandas vs. using openpyxl directly.
 """
 
-import re
 from datetime import date, datetime, time
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
+from excelbench.harness.adapters.a1 import parse_cell_ref, range_bounds
 from excelbench.harness.adapters.base import ExcelAdapter
+from excelbench.harness.adapters.error_values import is_error_string
 from excelbench.models import (
     BorderInfo,
     CellFormat,
     CellType,
     CellValue,
     LibraryInfo,
+    OpenOptions,
 )
 
 JSONDict = dict[str, Any]
 WorkbookData = dict[str, Any]
 
+_parse_cell_ref = parse_cell_ref
 
+_MIDNIGHT = time()
+
+
+@cache
 def _get_version() -> str:
     try:
         from importlib.metadata import version
@@ -36,36 +44,6 @@ def _get_version() -> str:
         return "unknown"
 
 
-def _parse_cell_ref(cell: str) -> tuple[int, int]:
-    """Parse a cell reference like 'A1' to (row_0based, col_0based)."""
-    match = re.match(r"([A-Z]+)(\d+)", cell.upper())
-    if not match:
-        raise ValueError(f"Invalid cell reference: {cell}")
-    col_str, row_str = match.groups()
-    row = int(row_str) - 1
-    col = 0
-    for char in col_str:
-        col = col * 26 + (ord(char) - ord("A") + 1)
-    col -= 1
-    return row, col
-
-
-def _parse_cell_range(cell_range: str) -> tuple[int, int, int, int]:
-    """Parse A1:B2 into (r0, c0, r1, c1) inclusive, 0-based."""
-    clean = cell_range.replace("$", "").upper()
-    if ":" in clean:
-        a, b = clean.split(":", 1)
-    else:
-        a, b = clean, clean
-    r0, c0 = _parse_cell_ref(a)
-    r1, c1 = _parse_cell_ref(b)
-    if r1 < r0:
-        r0, r1 = r1, r0
-    if c1 < c0:
-        c0, c1 = c1, c0
-    return r0, c0, r1, c1
-
-
 class PandasAdapter(ExcelAdapter):
     """Adapter for pandas library (read+write, value-only).
 
@@ -74,6 +52,8 @@ class PandasAdapter(ExcelAdapter):
     conditional formatting, comments, or images.
     """
 
+    __slots__ = ()
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
@@ -87,10 +67,10 @@ class PandasAdapter(ExcelAdapter):
     # Read Operations
     # =========================================================================
 
-    def open_workbook(self, path: Path) -> Any:
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
         frames = pd.read_excel(
             path,
-            sheet_name=None,
+            sheet_name=sorted(opts.sheets) if opts.sheets else None,
             header=None,
             engine="openpyxl",
         )
@@ -120,7 +100,7 @@ class PandasAdapter(ExcelAdapter):
         if not cell_range:
             return df
 
-        r0, c0, r1, c1 = _parse_cell_range(cell_range)
+        r0, c0, r1, c1 = range_bounds(cell_range)
         r1 = min(r1, len(df) - 1)
         c1 = min(c1, len(df.columns) - 1)
         if r1 < 0 or c1 < 0:
@@ -157,18 +137,13 @@ class PandasAdapter(ExcelAdapter):
 
         if isinstance(value, pd.Timestamp):
             dt = value.to_pydatetime()
-            is_midnight = dt.hour == 0 and dt.minute == 0 and dt.second == 0 and dt.microsecond == 0
+            is_midnight = dt.time() == _MIDNIGHT
             if is_midnight:
                 return CellValue(type=CellType.DATE, value=dt.date())
             return CellValue(type=CellType.DATETIME, value=dt)
 
         if isinstance(value, datetime):
-            is_midnight = (
-                value.hour == 0
-                and value.minute == 0
-                and value.second == 0
-                and value.microsecond == 0
-            )
+            is_midnight = value.time() == _MIDNIGHT
             if is_midnight:
                 return CellValue(type=CellType.DATE, value=value.date())
             return CellValue(type=CellType.DATETIME, value=value)
@@ -183,9 +158,7 @@ class PandasAdapter(ExcelAdapter):
             )
 
         if isinstance(value, str):
-            if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
-                return CellValue(type=CellType.ERROR, value=value)
-            if value.startswith("#") and value.endswith("!"):
+            if is_error_string(value):
                 return CellValue(type=CellType.ERROR, value=value)
             if value.startswith("="):
                 return CellValue(type=CellType.FORMULA, value=value, formula=value)
@@ -10,25 +10,33 @@ This adapter measures the abstraction cost of polars vs. both pandas
 and the raw calamine adapter.
 """
 
-import re
-from datetime import date, datetime
+from datetime import date, datetime, time
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import polars as pl
 
+from excelbench.harness.adapters.a1 import parse_cell_ref, range_bounds
 from excelbench.harness.adapters.base import ReadOnlyAdapter
+from excelbench.harness.adapters.error_values import is_error_string
 from excelbench.models import (
     BorderInfo,
     CellFormat,
     CellType,
     CellValue,
     LibraryInfo,
+    OpenOptions,
 )
 
 JSONDict = dict[str, Any]
 
+_MIDNIGHT = time()
 
+_parse_cell_ref = parse_cell_ref
+
+
+@cache
 def _get_version() -> str:
     try:
         from importlib.metadata import version
@@ -38,36 +46,6 @@ def _get_version() -> str:
         return "unknown"
 
 
-def _parse_cell_ref(cell: str) -> tuple[int, int]:
-    """Parse a cell reference like 'A1' to (row_0based, col_0based)."""
-    match = re.match(r"([A-Z]+)(\d+)", cell.upper())
-    if not match:
-        raise ValueError(f"Invalid cell reference: {cell}")
-    col_str, row_str = match.groups()
-    row = int(row_str) - 1
-    col = 0
-    for char in col_str:
-        col = col * 26 + (ord(char) - ord("A") + 1)
-    col -= 1
-    return row, col
-
-
-def _parse_cell_range(cell_range: str) -> tuple[int, int, int, int]:
-    """Parse A1:B2 into (r0, c0, r1, c1) inclusive, 0-based."""
-    clean = cell_range.replace("$", "").upper()
-    if ":" in clean:
-        a, b = clean.split(":", 1)
-    else:
-        a, b = clean, clean
-    r0, c0 = _parse_cell_ref(a)
-    r1, c1 = _parse_cell_ref(b)
-    if r1 < r0:
-        r0, r1 = r1, r0
-    if c1 < c0:
-        c0, c1 = c1, c0
-    return r0, c0, r1, c1
-
-
 class PolarsAdapter(ReadOnlyAdapter):
     """Adapter for polars library (read-only, value-only).
 
@@ -76,6 +54,8 @@ class PolarsAdapter(ReadOnlyAdapter):
     Python types for cell-level comparison.
     """
 
+    __slots__ = ()
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
@@ -85,22 +65,29 @@ class PolarsAdapter(ReadOnlyAdapter):
             capabilities={"read"},
         )
 
-    @property
-    def supported_read_extensions(self) -> set[str]:
-        return {".xlsx"}
+    supported_read_extensions: ClassVar[frozenset[str]] = frozenset({".xlsx"})
 
     # =========================================================================
     # Read Operations
     # =========================================================================
 
-    def open_workbook(self, path: Path) -> Any:
-        frames = pl.read_excel(
-            path,
-            sheet_id=0,  # 0 = all sheets
-            has_header=False,
-            infer_schema_length=0,  # don't infer — keep as String
-            raise_if_empty=False,
-        )
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
+        if opts.sheets:
+            frames = pl.read_excel(
+                path,
+                sheet_name=sorted(opts.sheets),
+                has_header=False,
+                infer_schema_length=0,
+                raise_if_empty=False,
+            )
+        else:
+            frames = pl.read_excel(
+                path,
+                sheet_id=0,  # 0 = all sheets
+                has_header=False,
+                infer_schema_length=0,  # don't infer — keep as String
+                raise_if_empty=False,
+            )
         if isinstance(frames, pl.DataFrame):
             # Single sheet — wrap in dict
             frames = {"Sheet1": frames}
@@ -130,7 +117,7 @@ class PolarsAdapter(ReadOnlyAdapter):
         if not cell_range:
             return df
 
-        r0, c0, r1, c1 = _parse_cell_range(cell_range)
+        r0, c0, r1, c1 = range_bounds(cell_range)
         if r0 >= df.height or c0 >= df.width:
             return pl.DataFrame()
 
@@ -173,12 +160,7 @@ class PolarsAdapter(ReadOnlyAdapter):
             return CellValue(type=CellType.DATE, value=value)
 
         if isinstance(value, datetime):
-            if (
-                value.hour == 0
-                and value.minute == 0
-                and value.second == 0
-                and value.microsecond == 0
-            ):
+            if value.time() == _MIDNIGHT:
                 return CellValue(type=CellType.DATE, value=value.date())
             return CellValue(type=CellType.DATETIME, value=value)
 
@@ -188,9 +170,7 @@ class PolarsAdapter(ReadOnlyAdapter):
                 return CellValue(type=CellType.BLANK)
 
             # Error values
-            if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
-                return CellValue(type=CellType.ERROR, value=value)
-            if value.startswith("#") and value.endswith("!"):
+            if is_error_string(value):
                 return CellValue(type=CellType.ERROR, value=value)
 
             # Formula
@@ -215,7 +195,7 @@ class PolarsAdapter(ReadOnlyAdapter):
             # Datetime (polars stringifies as "YYYY-MM-DD HH:MM:SS")
             try:
                 dt = datetime.fromisoformat(value)
-                if dt.hour == 0 and dt.minute == 0 and dt.second == 0 and dt.microsecond == 0:
+                if dt.time() == _MIDNIGHT:
                     return CellValue(type=CellType.DATE, value=dt.date())
                 return CellValue(type=CellType.DATETIME, value=dt)
             except ValueError:
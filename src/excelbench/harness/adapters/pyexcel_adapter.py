@@ -1,25 +1,33 @@
 """Adapter for pyexcel library (read+write, value-only)."""
 
-import re
 from datetime import date, datetime, time
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 import pyexcel
 
+from excelbench.harness.adapters.a1 import parse_cell_ref
 from excelbench.harness.adapters.base import ExcelAdapter
+from excelbench.harness.adapters.error_values import is_error_string
 from excelbench.models import (
     BorderInfo,
     CellFormat,
     CellType,
     CellValue,
     LibraryInfo,
+    OpenOptions,
 )
 
 JSONDict = dict[str, Any]
 WorkbookData = dict[str, Any]
 
+_parse_cell_ref = parse_cell_ref
 
+_MIDNIGHT = time()
+
+
+@cache
 def _get_version() -> str:
     try:
         from importlib.metadata import version
@@ -29,20 +37,6 @@ def _get_version() -> str:
         return "unknown"
 
 
-def _parse_cell_ref(cell: str) -> tuple[int, int]:
-    """Parse a cell reference like 'A1' to (row_0based, col_0based)."""
-    match = re.match(r"([A-Z]+)(\d+)", cell.upper())
-    if not match:
-        raise ValueError(f"Invalid cell reference: {cell}")
-    col_str, row_str = match.groups()
-    row = int(row_str) - 1
-    col = 0
-    for char in col_str:
-        col = col * 26 + (ord(char) - ord("A") + 1)
-    col -= 1
-    return row, col
-
-
 class PyexcelAdapter(ExcelAdapter):
     """Adapter for pyexcel library (read+write, value-only).
 
@@ -51,6 +45,8 @@ class PyexcelAdapter(ExcelAdapter):
     comments, or images.
     """
 
+    __slots__ = ()
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
@@ -64,7 +60,7 @@ class PyexcelAdapter(ExcelAdapter):
     # Read Operations
     # =========================================================================
 
-    def open_workbook(self, path: Path) -> Any:
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
         return pyexcel.get_book(file_name=str(path))
 
     def close_workbook(self, workbook: Any) -> None:
@@ -103,12 +99,7 @@ class PyexcelAdapter(ExcelAdapter):
             return CellValue(type=CellType.NUMBER, value=value)
 
         if isinstance(value, datetime):
-            is_midnight = (
-                value.hour == 0
-                and value.minute == 0
-                and value.second == 0
-                and value.microsecond == 0
-            )
+            is_midnight = value.time() == _MIDNIGHT
             if is_midnight:
                 return CellValue(type=CellType.DATE, value=value.date())
             return CellValue(type=CellType.DATETIME, value=value)
@@ -123,9 +114,7 @@ class PyexcelAdapter(ExcelAdapter):
             )
 
         if isinstance(value, str):
-            if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
-                return CellValue(type=CellType.ERROR, value=value)
-            if value.startswith("#") and value.endswith("!"):
+            if is_error_string(value):
                 return CellValue(type=CellType.ERROR, value=value)
             if value.startswith("="):
                 return CellValue(type=CellType.FORMULA, value=value, formula=value)
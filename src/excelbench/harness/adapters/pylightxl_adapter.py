@@ -1,24 +1,34 @@
 """Adapter for pylightxl library (read/write, zero-dependency)."""
 
 import re
-from datetime import date, datetime
+from datetime import date, datetime, time
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import pylightxl
 
+from excelbench.harness.adapters.a1 import cell_to_coord
 from excelbench.harness.adapters.base import ExcelAdapter
+from excelbench.harness.adapters.error_values import is_error_string
 from excelbench.models import (
     BorderInfo,
     CellFormat,
     CellType,
     CellValue,
     LibraryInfo,
+    OpenOptions,
 )
 
 JSONDict = dict[str, Any]
 
+_MIDNIGHT = time()
 
+_DATE_RE = re.compile(r"^\d{4}/\d{2}/\d{2}$")
+_DATETIME_RE = re.compile(r"^\d{4}/\d{2}/\d{2}\s\d{2}:\d{2}:\d{2}$")
+
+
+@cache
 def _get_version() -> str:
     """Get pylightxl version."""
     try:
@@ -31,15 +41,7 @@ def _get_version() -> str:
 
 def _parse_cell_ref(cell: str) -> tuple[int, int]:
     """Parse a cell reference like 'A1' to (row_1based, col_1based)."""
-    match = re.match(r"([A-Z]+)(\d+)", cell.upper())
-    if not match:
-        raise ValueError(f"Invalid cell reference: {cell}")
-    col_str, row_str = match.groups()
-    row = int(row_str)
-    col = 0
-    for char in col_str:
-        col = col * 26 + (ord(char) - ord("A") + 1)
-    return row, col
+    return cell_to_coord(cell)
 
 
 class PylightxlAdapter(ExcelAdapter):
@@ -50,6 +52,8 @@ class PylightxlAdapter(ExcelAdapter):
     strings. Dates are NOT auto-converted (serial numbers returned as floats).
     """
 
+    __slots__ = ()
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
@@ -59,15 +63,15 @@ class PylightxlAdapter(ExcelAdapter):
             capabilities={"read", "write"},
         )
 
-    @property
-    def supported_read_extensions(self) -> set[str]:
-        return {".xlsx"}
+    supported_read_extensions: ClassVar[frozenset[str]] = frozenset({".xlsx"})
 
     # =========================================================================
     # Read Operations
     # =========================================================================
 
-    def open_workbook(self, path: Path) -> Any:
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
+        if opts.sheets:
+            return pylightxl.readxl(fn=str(path), ws=tuple(sorted(opts.sheets)))
         return pylightxl.readxl(fn=str(path))
 
     def close_workbook(self, workbook: Any) -> None:
@@ -99,12 +103,7 @@ class PylightxlAdapter(ExcelAdapter):
             return CellValue(type=CellType.NUMBER, value=value)
 
         if isinstance(value, datetime):
-            is_midnight = (
-                value.hour == 0
-                and value.minute == 0
-                and value.second == 0
-                and value.microsecond == 0
-            )
+            is_midnight = value.time() == _MIDNIGHT
             if is_midnight:
                 return CellValue(type=CellType.DATE, value=value.date())
             return CellValue(type=CellType.DATETIME, value=value)
@@ -113,20 +112,20 @@ class PylightxlAdapter(ExcelAdapter):
             return CellValue(type=CellType.DATE, value=value)
 
         if isinstance(value, str):
-            # Date strings — pylightxl returns dates as "YYYY/MM/DD" strings
-            if re.match(r"^\d{4}/\d{2}/\d{2}$", value):
-                parsed = datetime.strptime(value, "%Y/%m/%d").date()
-                return CellValue(type=CellType.DATE, value=parsed)
-
-            # DateTime strings — "YYYY/MM/DD HH:MM:SS"
-            if re.match(r"^\d{4}/\d{2}/\d{2}\s\d{2}:\d{2}:\d{2}$", value):
-                parsed_dt = datetime.strptime(value, "%Y/%m/%d %H:%M:%S")
-                return CellValue(type=CellType.DATETIME, value=parsed_dt)
+            # Both date shapes have "/" at index 4; other strings skip the regexes.
+            if value[4:5] == "/":
+                # Date strings — pylightxl returns dates as "YYYY/MM/DD" strings
+                if _DATE_RE.match(value):
+                    parsed = datetime.strptime(value, "%Y/%m/%d").date()
+                    return CellValue(type=CellType.DATE, value=parsed)
+
+                # DateTime strings — "YYYY/MM/DD HH:MM:SS"
+                if _DATETIME_RE.match(value):
+                    parsed_dt = datetime.strptime(value, "%Y/%m/%d %H:%M:%S")
+                    return CellValue(type=CellType.DATETIME, value=parsed_dt)
 
             # Error values — includes #N/A (no trailing !)
-            if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
-                return CellValue(type=CellType.ERROR, value=value)
-            if value.startswith("#") and value.endswith("!"):
+            if is_error_string(value):
                 return CellValue(type=CellType.ERROR, value=value)
 
             # Formulas — pylightxl preserves formula strings
@@ -7,12 +7,14 @@ fixtures as pyumya expands formatting coverage.
 from __future__ import annotations
 
 from datetime import date, datetime
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 import pyumya
 
 from excelbench.harness.adapters.base import ExcelAdapter
+from excelbench.harness.adapters.error_values import is_error_string
 from excelbench.models import (
     BorderEdge,
     BorderInfo,
@@ -21,6 +23,7 @@ from excelbench.models import (
     CellType,
     CellValue,
     LibraryInfo,
+    OpenOptions,
 )
 
 JSONDict = dict[str, Any]
@@ -34,6 +37,7 @@ _ALT_WIDTH_PADDING = 0.7109375
 _WIDTH_TOLERANCE = 0.0005
 
 
+@cache
 def _get_version() -> str:
     try:
         from importlib.metadata import version
@@ -48,10 +52,6 @@ def _get_version() -> str:
             return "unknown"
 
 
-def _is_error_token(value: str) -> bool:
-    return value == "#N/A" or (value.startswith("#") and value.endswith("!"))
-
-
 def _to_rgb_no_hash(value: str) -> str:
     s = value.strip()
     if s.startswith("#"):
@@ -77,6 +77,8 @@ def _border_style(style: str) -> BorderStyle:
 
 
 class PyumyaAdapter(ExcelAdapter):
+    __slots__ = ()
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
@@ -90,7 +92,7 @@ class PyumyaAdapter(ExcelAdapter):
     # Read
     # =========================================================================
 
-    def open_workbook(self, path: Path) -> Any:
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
         return pyumya.load_workbook(str(path))
 
     def close_workbook(self, workbook: Any) -> None:
@@ -122,7 +124,7 @@ class PyumyaAdapter(ExcelAdapter):
         if isinstance(value, str):
             if value.startswith("="):
                 return CellValue(type=CellType.FORMULA, value=value, formula=value)
-            if _is_error_token(value):
+            if is_error_string(value):
                 return CellValue(type=CellType.ERROR, value=value)
             return CellValue(type=CellType.STRING, value=value)
 
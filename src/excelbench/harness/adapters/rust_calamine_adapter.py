@@ -5,7 +5,7 @@ module. It is read-only.
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from excelbench.harness.adapters.base import ReadOnlyAdapter
 from excelbench.harness.adapters.rust_adapter_utils import (
@@ -18,6 +18,7 @@ from excelbench.models import (
     CellType,
     CellValue,
     LibraryInfo,
+    OpenOptions,
 )
 
 JSONDict = dict[str, Any]
@@ -37,6 +38,8 @@ if getattr(_excelbench_rust, "CalamineBook", None) is None:  # pragma: no cover
 class RustCalamineAdapter(ReadOnlyAdapter):
     """Adapter for the Rust calamine crate via our PyO3 module."""
 
+    __slots__ = ()
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
@@ -46,11 +49,9 @@ class RustCalamineAdapter(ReadOnlyAdapter):
             capabilities={"read"},
         )
 
-    @property
-    def supported_read_extensions(self) -> set[str]:
-        return {".xlsx", ".xls"}
+    supported_read_extensions: ClassVar[frozenset[str]] = frozenset({".xlsx", ".xls"})
 
-    def open_workbook(self, path: Path) -> Any:
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
         import wolfxl._rust as rust
 
         m: Any = rust
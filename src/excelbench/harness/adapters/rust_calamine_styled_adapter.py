@@ -7,7 +7,7 @@ Xlsx<R> reader, not the format-sniffing open_workbook_auto).
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from excelbench.harness.adapters.base import ReadOnlyAdapter
 from excelbench.harness.adapters.rust_adapter_utils import (
@@ -22,6 +22,7 @@ from excelbench.models import (
     CellType,
     CellValue,
     LibraryInfo,
+    OpenOptions,
 )
 
 JSONDict = dict[str, Any]
@@ -38,6 +39,8 @@ if getattr(_excelbench_rust, "CalamineStyledBook", None) is None:  # pragma: no
 class RustCalamineStyledAdapter(ReadOnlyAdapter):
     """Adapter for the Rust calamine crate (with style support) via PyO3."""
 
+    __slots__ = ("_cell_cache",)
+
     def __init__(self) -> None:
         self._cell_cache: dict[tuple[int, str, str], CellValue] = {}
 
@@ -50,12 +53,10 @@ class RustCalamineStyledAdapter(ReadOnlyAdapter):
             capabilities={"read"},
         )
 
-    @property
-    def supported_read_extensions(self) -> set[str]:
-        # CalamineStyledBook uses Xlsx<R> directly — only .xlsx supported.
-        return {".xlsx"}
+    # CalamineStyledBook uses Xlsx<R> directly — only .xlsx supported.
+    supported_read_extensions: ClassVar[frozenset[str]] = frozenset({".xlsx"})
 
-    def open_workbook(self, path: Path) -> Any:
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
         import wolfxl._rust as rust
 
         m: Any = rust
@@ -37,6 +37,8 @@ if getattr(_excelbench_rust, "RustXlsxWriterBook", None) is None:  # pragma: no
 
 
 class RustXlsxWriterAdapter(WriteOnlyAdapter):
+    __slots__ = ()
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
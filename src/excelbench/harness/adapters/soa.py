@@ -0,0 +1,215 @@
+"""Structure-of-arrays (SoA) encoding for bulk sheet reads.
+
+``read_sheet_values`` returns a grid of ``CellValue`` wrappers (one Python
+object per cell).  For raw comparisons it is cheaper to hold a sheet as a
+handful of parallel numpy columns, so that expected-vs-actual diffing is a
+vectorized ``!=`` instead of N ``CellValue.__eq__`` calls.
+
+Schema (all arrays have length N, row-major over the read range):
+
+- ``dtype``:   uint8 cell kind, one of the ``SOA_*`` codes below
+- ``num``:     float64 numeric payload (numbers, booleans as 0/1), NaN otherwise
+- ``str``:     object payload (strings, error codes, ISO dates), None otherwise
+- ``formula``: object formula text, None otherwise
+- ``row`` / ``col``: int32 0-based sheet coordinates of each cell
+
+String payloads can be deduplicated through a shared ``StringPool`` so that
+equal strings in the expected and actual blocks are the same object, which
+lets the object-array comparison short-circuit on identity.
+
+numpy is imported lazily so adapters that never use the SoA path do not pay
+for it at import time.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from datetime import date, datetime
+from math import nan
+from typing import Any
+
+from excelbench.harness.adapters.a1 import range_bounds
+from excelbench.models import CellType, CellValue
+
+SoABlock = dict[str, Any]
+StringPool = dict[str, str]
+
+SOA_EMPTY = 0
+SOA_NUM = 1
+SOA_STR = 2
+SOA_BOOL = 3
+SOA_ERR = 4
+SOA_FORMULA = 5
+SOA_DATE = 6
+SOA_DATETIME = 7
+
+_SOA_CODE_BY_TYPE: dict[CellType, int] = {
+    CellType.BLANK: SOA_EMPTY,
+    CellType.NUMBER: SOA_NUM,
+    CellType.STRING: SOA_STR,
+    CellType.BOOLEAN: SOA_BOOL,
+    CellType.ERROR: SOA_ERR,
+    CellType.FORMULA: SOA_FORMULA,
+    CellType.DATE: SOA_DATE,
+    CellType.DATETIME: SOA_DATETIME,
+}
+
+
+def range_origin(cell_range: str | None) -> tuple[int, int]:
+    """Return the 0-based (row, col) of the top-left cell of *cell_range*."""
+    if not cell_range:
+        return 0, 0
+    r0, c0, _, _ = range_bounds(cell_range)
+    return r0, c0
+
+
+def _encode_cell(
+    i: int,
+    cv: CellValue,
+    kinds: Any,
+    nums: Any,
+    strs: Any,
+    formulas: Any,
+    intern: Callable[[str, str], str],
+) -> None:
+    """Write one ``CellValue`` into slot *i* of the SoA columns."""
+    code = _SOA_CODE_BY_TYPE.get(cv.type, SOA_STR)
+    kinds[i] = code
+    value = cv.value
+    if code == SOA_NUM or code == SOA_BOOL:
+        nums[i] = float(value)
+    elif code == SOA_FORMULA:
+        formula = cv.formula if cv.formula is not None else value
+        formulas[i] = intern(formula, formula) if isinstance(formula, str) else formula
+    elif code != SOA_EMPTY:
+        if isinstance(value, (date, datetime)):
+            value = value.isoformat()
+        if isinstance(value, str):
+            value = intern(value, value)
+        strs[i] = value
+
+
+def _coords(lengths: list[int], origin: tuple[int, int]) -> tuple[Any, Any]:
+    """Vectorized row/col columns for a row-major grid with the given row lengths."""
+    import numpy as np
+
+    counts = np.asarray(lengths, dtype=np.int32)
+    starts = np.cumsum(counts) - counts
+    r0, c0 = origin
+    row_idx = np.repeat(np.arange(len(lengths), dtype=np.int32) + r0, counts)
+    col_idx = np.arange(int(counts.sum()), dtype=np.int32) - np.repeat(starts, counts) + c0
+    return row_idx.astype(np.int32), col_idx.astype(np.int32)
+
+
+def cells_to_soa(
+    rows: Sequence[Sequence[CellValue]],
+    origin: tuple[int, int] = (0, 0),
+    pool: StringPool | None = None,
+) -> SoABlock:
+    """Encode a ``read_sheet_values``-style grid into an SoA block.
+
+    Pass the same *pool* when encoding blocks that will be compared so that
+    repeated strings are stored once and compare by identity.
+    """
+    import numpy as np
+
+    if pool is None:
+        pool = {}
+    intern = pool.setdefault
+
+    n = sum(len(r) for r in rows)
+    kinds = np.zeros(n, dtype=np.uint8)
+    nums = np.full(n, np.nan, dtype=np.float64)
+    strs = np.full(n, None, dtype=object)
+    formulas = np.full(n, None, dtype=object)
+    row_idx, col_idx = _coords([len(r) for r in rows], origin)
+
+    i = 0
+    for row in rows:
+        for cv in row:
+            _encode_cell(i, cv, kinds, nums, strs, formulas, intern)
+            i += 1
+
+    return {
+        "dtype": kinds,
+        "num": nums,
+        "str": strs,
+        "formula": formulas,
+        "row": row_idx,
+        "col": col_idx,
+    }
+
+
+def raw_to_soa(
+    rows: Sequence[Sequence[Any]],
+    convert: Callable[[Any], CellValue],
+    origin: tuple[int, int] = (0, 0),
+    pool: StringPool | None = None,
+) -> SoABlock:
+    """Encode a grid of library-native values without wrapping every cell.
+
+    ``None`` and exact ``int``/``float`` cells are written straight into the
+    numeric columns; everything else goes through *convert* (the adapter's
+    raw-value -> ``CellValue`` function), so the result matches
+    ``cells_to_soa`` over the converted grid.
+    """
+    import numpy as np
+
+    if pool is None:
+        pool = {}
+    intern = pool.setdefault
+
+    lengths = [len(r) for r in rows]
+    n = sum(lengths)
+    kinds = bytearray(n)
+    nums = [nan] * n
+    strs: list[Any] = [None] * n
+    formulas: list[Any] = [None] * n
+
+    i = 0
+    for row in rows:
+        for v in row:
+            t = type(v)
+            if v is None:
+                pass
+            elif t is float or t is int:
+                kinds[i] = SOA_NUM
+                nums[i] = v
+            else:
+                _encode_cell(i, convert(v), kinds, nums, strs, formulas, intern)
+            i += 1
+
+    row_idx, col_idx = _coords(lengths, origin)
+    str_col = np.empty(n, dtype=object)
+    str_col[:] = strs
+    formula_col = np.empty(n, dtype=object)
+    formula_col[:] = formulas
+    return {
+        "dtype": np.frombuffer(bytes(kinds), dtype=np.uint8).copy(),
+        "num": np.asarray(nums, dtype=np.float64),
+        "str": str_col,
+        "formula": formula_col,
+        "row": row_idx,
+        "col": col_idx,
+    }
+
+
+def soa_mismatch_indices(expected: SoABlock, actual: SoABlock) -> Any:
+    """Return the flat indices where two equally shaped SoA blocks differ.
+
+    Numeric payloads compare NaN-equal so empty/non-numeric cells do not
+    register as mismatches on the ``num`` column alone.
+    """
+    import numpy as np
+
+    if expected["dtype"].shape != actual["dtype"].shape:
+        raise ValueError(
+            "SoA blocks differ in size: "
+            f"expected={expected['dtype'].shape[0]}, actual={actual['dtype'].shape[0]}"
+        )
+    e_num, a_num = expected["num"], actual["num"]
+    diff = expected["dtype"] != actual["dtype"]
+    diff |= (e_num != a_num) & ~(np.isnan(e_num) & np.isnan(a_num))
+    diff |= expected["str"] != actual["str"]
+    diff |= expected["formula"] != actual["formula"]
+    return np.nonzero(diff)[0]
@@ -0,0 +1,53 @@
+"""Row-at-a-time streaming writers for constant-memory output.
+
+``create_workbook`` / ``write_cell_value`` / ``save_workbook`` keep every
+cell alive until save, so peak memory grows with rows x cols.  Adapters that
+advertise the ``"stream_write"`` capability can instead hand out a
+``StreamWriter`` from ``ExcelAdapter.begin_streaming_write``: rows are flushed
+as they are appended and only the current row is held in memory.
+
+Rows are written top to bottom starting at column A of the most recently
+added sheet.  Plain Python values are written as-is (``None`` leaves the cell
+empty); ``CellValue`` items are written with their declared type.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from types import TracebackType
+from typing import Any, Self
+
+STREAM_WRITE = "stream_write"
+
+
+class StreamWriter(ABC):
+    """Append-only sink returned by ``ExcelAdapter.begin_streaming_write``."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def add_sheet(self, name: str) -> None:
+        """Start a new sheet; subsequent rows are appended to it."""
+        ...
+
+    @abstractmethod
+    def append_row(self, row: Sequence[Any]) -> None:
+        """Write *row* below the previously appended row."""
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finish the file. The writer cannot be used afterwards."""
+        ...
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
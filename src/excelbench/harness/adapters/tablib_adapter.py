@@ -6,26 +6,34 @@ formatting.  This adapter measures the abstraction cost of going through
 tablib's Dataset/Databook model.
 """
 
-import re
 from datetime import date, datetime, time
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 import tablib
 
+from excelbench.harness.adapters.a1 import parse_cell_ref, range_bounds
 from excelbench.harness.adapters.base import ExcelAdapter
+from excelbench.harness.adapters.error_values import is_error_string
 from excelbench.models import (
     BorderInfo,
     CellFormat,
     CellType,
     CellValue,
     LibraryInfo,
+    OpenOptions,
 )
 
 JSONDict = dict[str, Any]
 WorkbookData = dict[str, Any]
 
+_parse_cell_ref = parse_cell_ref
 
+_MIDNIGHT = time()
+
+
+@cache
 def _get_version() -> str:
     try:
         from importlib.metadata import version
@@ -35,36 +43,6 @@ def _get_version() -> str:
         return "unknown"
 
 
-def _parse_cell_ref(cell: str) -> tuple[int, int]:
-    """Parse a cell reference like 'A1' to (row_0based, col_0based)."""
-    match = re.match(r"([A-Z]+)(\d+)", cell.upper())
-    if not match:
-        raise ValueError(f"Invalid cell reference: {cell}")
-    col_str, row_str = match.groups()
-    row = int(row_str) - 1
-    col = 0
-    for char in col_str:
-        col = col * 26 + (ord(char) - ord("A") + 1)
-    col -= 1
-    return row, col
-
-
-def _parse_cell_range(cell_range: str) -> tuple[int, int, int, int]:
-    """Parse A1:B2 into (r0, c0, r1, c1) inclusive, 0-based."""
-    clean = cell_range.replace("$", "").upper()
-    if ":" in clean:
-        a, b = clean.split(":", 1)
-    else:
-        a, b = clean, clean
-    r0, c0 = _parse_cell_ref(a)
-    r1, c1 = _parse_cell_ref(b)
-    if r1 < r0:
-        r0, r1 = r1, r0
-    if c1 < c0:
-        c0, c1 = c1, c0
-    return r0, c0, r1, c1
-
-
 class TablibAdapter(ExcelAdapter):
     """Adapter for tablib library (read+write, value-only).
 
@@ -73,6 +51,8 @@ class TablibAdapter(ExcelAdapter):
     comments, or images.
     """
 
+    __slots__ = ()
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
@@ -86,7 +66,7 @@ class TablibAdapter(ExcelAdapter):
     # Read Operations
     # =========================================================================
 
-    def open_workbook(self, path: Path) -> Any:
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
         with open(path, "rb") as f:
             raw = f.read()
         book = tablib.Databook()
@@ -127,7 +107,7 @@ class TablibAdapter(ExcelAdapter):
         if not cell_range:
             return [list(ds[r]) for r in range(ds.height)]
 
-        r0, c0, r1, c1 = _parse_cell_range(cell_range)
+        r0, c0, r1, c1 = range_bounds(cell_range)
         out: list[list[Any]] = []
         for r in range(r0, min(r1, ds.height - 1) + 1):
             row = ds[r]
@@ -169,12 +149,7 @@ class TablibAdapter(ExcelAdapter):
             return CellValue(type=CellType.NUMBER, value=value)
 
         if isinstance(value, datetime):
-            if (
-                value.hour == 0
-                and value.minute == 0
-                and value.second == 0
-                and value.microsecond == 0
-            ):
+            if value.time() == _MIDNIGHT:
                 return CellValue(type=CellType.DATE, value=value.date())
             return CellValue(type=CellType.DATETIME, value=value)
 
@@ -188,9 +163,7 @@ class TablibAdapter(ExcelAdapter):
             )
 
         if isinstance(value, str):
-            if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
-                return CellValue(type=CellType.ERROR, value=value)
-            if value.startswith("#") and value.endswith("!"):
+            if is_error_string(value):
                 return CellValue(type=CellType.ERROR, value=value)
             if value.startswith("="):
                 return CellValue(type=CellType.FORMULA, value=value, formula=value)
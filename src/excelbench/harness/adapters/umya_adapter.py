@@ -8,7 +8,7 @@ tables).
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from excelbench.harness.adapters.base import ExcelAdapter
 from excelbench.harness.adapters.rust_adapter_utils import (
@@ -26,6 +26,7 @@ from excelbench.models import (
     CellType,
     CellValue,
     LibraryInfo,
+    OpenOptions,
 )
 
 JSONDict = dict[str, Any]
@@ -41,6 +42,8 @@ if getattr(_excelbench_rust, "UmyaBook", None) is None:  # pragma: no cover
 
 
 class UmyaAdapter(ExcelAdapter):
+    __slots__ = ()
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
@@ -50,15 +53,13 @@ class UmyaAdapter(ExcelAdapter):
             capabilities={"read", "write"},
         )
 
-    @property
-    def supported_read_extensions(self) -> set[str]:
-        return {".xlsx"}
+    supported_read_extensions: ClassVar[frozenset[str]] = frozenset({".xlsx"})
 
     # =========================================================================
     # Read
     # =========================================================================
 
-    def open_workbook(self, path: Path) -> Any:
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
         import wolfxl._rust as rust
 
         m: Any = rust
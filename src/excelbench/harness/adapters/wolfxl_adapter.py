@@ -5,7 +5,7 @@ fastest Rust writer (rust_xlsxwriter) into a single full-fidelity R+W adapter.
 """
 
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from excelbench.harness.adapters.base import ExcelAdapter
 from excelbench.harness.adapters.rust_adapter_utils import (
@@ -23,6 +23,7 @@ from excelbench.models import (
     CellType,
     CellValue,
     LibraryInfo,
+    OpenOptions,
 )
 
 JSONDict = dict[str, Any]
@@ -41,6 +42,8 @@ if getattr(_excelbench_rust, "RustXlsxWriterBook", None) is None:  # pragma: no
 class WolfxlAdapter(ExcelAdapter):
     """Hybrid adapter: calamine-styled reads + rust_xlsxwriter writes."""
 
+    __slots__ = ("_cell_cache",)
+
     def __init__(self) -> None:
         # Python-side cell cache: avoids FFI on repeated reads of the same cell.
         # Keyed by (workbook_id, sheet, cell) → CellValue.
@@ -57,15 +60,13 @@ class WolfxlAdapter(ExcelAdapter):
             capabilities={"read", "write", "modify"},
         )
 
-    @property
-    def supported_read_extensions(self) -> set[str]:
-        return {".xlsx"}
+    supported_read_extensions: ClassVar[frozenset[str]] = frozenset({".xlsx"})
 
     # =========================================================================
     # Read — delegates to CalamineStyledBook
     # =========================================================================
 
-    def open_workbook(self, path: Path) -> Any:
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
         import wolfxl._rust as rust
 
         m: Any = rust
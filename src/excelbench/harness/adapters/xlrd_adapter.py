@@ -1,14 +1,20 @@
 """Adapter for xlrd library (read-only, .xls format only)."""
 
-import re
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import xlrd
 from xlrd import Book
 from xlrd.sheet import Sheet
 
+from excelbench.harness.adapters.a1 import (
+    column_index,
+    coord_to_a1,
+    format_range,
+    parse_cell_ref,
+)
 from excelbench.harness.adapters.base import ReadOnlyAdapter
+from excelbench.harness.adapters.error_values import is_error_string
 from excelbench.models import (
     BorderEdge,
     BorderInfo,
@@ -17,29 +23,18 @@ from excelbench.models import (
     CellType,
     CellValue,
     LibraryInfo,
+    OpenOptions,
 )
 
 JSONDict = dict[str, Any]
 
+_parse_cell_ref = parse_cell_ref
+
 
 def _get_version() -> str:
     return str(xlrd.__version__)
 
 
-def _parse_cell_ref(cell: str) -> tuple[int, int]:
-    """Parse a cell reference like 'A1' to (row_0based, col_0based)."""
-    match = re.match(r"([A-Z]+)(\d+)", cell.upper())
-    if not match:
-        raise ValueError(f"Invalid cell reference: {cell}")
-    col_str, row_str = match.groups()
-    row = int(row_str) - 1
-    col = 0
-    for char in col_str:
-        col = col * 26 + (ord(char) - ord("A") + 1)
-    col -= 1
-    return row, col
-
-
 # xlrd border style index → ExcelBench BorderStyle
 _BORDER_STYLE_MAP: dict[int, BorderStyle] = {
     0: BorderStyle.NONE,
@@ -98,6 +93,8 @@ class XlrdAdapter(ReadOnlyAdapter):
     error when attempting to open .xlsx files.
     """
 
+    __slots__ = ()
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
@@ -107,16 +104,19 @@ class XlrdAdapter(ReadOnlyAdapter):
             capabilities={"read"},
         )
 
-    @property
-    def supported_read_extensions(self) -> set[str]:
-        return {".xls"}
+    supported_read_extensions: ClassVar[frozenset[str]] = frozenset({".xls"})
 
     # =========================================================================
     # Read Operations
     # =========================================================================
 
-    def open_workbook(self, path: Path) -> Book:
-        return xlrd.open_workbook(str(path), formatting_info=True)
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Book:
+        # on_demand defers parsing each sheet until it is first accessed.
+        return xlrd.open_workbook(
+            str(path),
+            formatting_info=opts.load_styles,
+            on_demand=opts.sheets is not None,
+        )
 
     def close_workbook(self, workbook: Any) -> None:
         workbook.release_resources()
@@ -147,9 +147,7 @@ class XlrdAdapter(ReadOnlyAdapter):
 
         if cell_type == xlrd.XL_CELL_TEXT:
             if isinstance(value, str):
-                if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
-                    return CellValue(type=CellType.ERROR, value=value)
-                if value.startswith("#") and value.endswith("!"):
+                if is_error_string(value):
                     return CellValue(type=CellType.ERROR, value=value)
                 if value.startswith("="):
                     return CellValue(type=CellType.FORMULA, value=value, formula=value)
@@ -323,11 +321,7 @@ class XlrdAdapter(ReadOnlyAdapter):
         column: str,
     ) -> float | None:
         sh = workbook.sheet_by_name(sheet)
-        col_idx = 0
-        for char in column.upper():
-            col_idx = col_idx * 26 + (ord(char) - ord("A") + 1)
-        col_idx -= 1
-        colinfo = sh.colinfo_map.get(col_idx)
+        colinfo = sh.colinfo_map.get(column_index(column))
         if not colinfo:
             return None
         width = getattr(colinfo, "width", None)
@@ -341,12 +335,8 @@ class XlrdAdapter(ReadOnlyAdapter):
 
     def read_merged_ranges(self, workbook: Book, sheet: str) -> list[str]:
         sh = workbook.sheet_by_name(sheet)
-        ranges: list[str] = []
-        for rlo, rhi, clo, chi in sh.merged_cells:
-            start = f"{_col_letter(clo + 1)}{rlo + 1}"
-            end = f"{_col_letter(chi)}{rhi}"
-            ranges.append(f"{start}:{end}")
-        return ranges
+        # xlrd merged bounds are half-open: (rlo, rhi, clo, chi).
+        return [format_range(rlo, clo, rhi - 1, chi - 1) for rlo, rhi, clo, chi in sh.merged_cells]
 
     def read_conditional_formats(self, workbook: Book, sheet: str) -> list[JSONDict]:
         return []  # xlrd has limited CF support
@@ -358,7 +348,7 @@ class XlrdAdapter(ReadOnlyAdapter):
         sh = workbook.sheet_by_name(sheet)
         links: list[JSONDict] = []
         for link in sh.hyperlink_list:
-            cell = f"{_col_letter(link.fcolx + 1)}{link.frowx + 1}"
+            cell = coord_to_a1(link.frowx, link.fcolx)
             target = link.url_or_path
             display = link.desc or sh.cell_value(link.frowx, link.fcolx)
             links.append(
@@ -383,7 +373,7 @@ class XlrdAdapter(ReadOnlyAdapter):
         comments: list[JSONDict] = []
         note_map = getattr(sh, "cell_note_map", {})
         for (row_idx, col_idx), note in note_map.items():
-            cell = f"{_col_letter(col_idx + 1)}{row_idx + 1}"
+            cell = coord_to_a1(row_idx, col_idx)
             comments.append(
                 {
                     "cell": cell,
@@ -401,14 +391,5 @@ class XlrdAdapter(ReadOnlyAdapter):
             result["mode"] = "freeze"
             top_row = sh.frozen_row_count or 0
             left_col = sh.frozen_col_count or 0
-            result["top_left_cell"] = f"{_col_letter(left_col + 1)}{top_row + 1}"
+            result["top_left_cell"] = coord_to_a1(top_row, left_col)
         return result
-
-
-def _col_letter(index: int) -> str:
-    """Convert 1-based column index to letter(s)."""
-    result = ""
-    while index > 0:
-        index, rem = divmod(index - 1, 26)
-        result = chr(65 + rem) + result
-    return result
@@ -1,14 +1,17 @@
 """Adapter for xlsxwriter library (write-only)."""
 
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import date as _date
 from datetime import datetime as _datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, ClassVar
 
 import xlsxwriter
 from xlsxwriter import Workbook
 
+from excelbench.harness.adapters.a1 import column_index, parse_cell_ref
 from excelbench.harness.adapters.base import WriteOnlyAdapter
+from excelbench.harness.adapters.streaming import STREAM_WRITE, StreamWriter
 from excelbench.models import (
     BorderInfo,
     BorderStyle,
@@ -37,6 +40,11 @@ class XlsxwriterAdapter(WriteOnlyAdapter):
     This adapter creates formats on-demand for simplicity.
     """
 
+    __slots__ = ("_workbooks",)
+
+    # Extra xlsxwriter.Workbook() options used at save time.
+    _workbook_options: ClassVar[dict[str, Any]] = {}
+
     def __init__(self) -> None:
         self._workbooks: dict[int, WorkbookData] = {}  # wb id -> {sheets, formats, path}
 
@@ -73,7 +81,7 @@ class XlsxwriterAdapter(WriteOnlyAdapter):
             name="xlsxwriter",
             version=_get_version(),
             language="python",
-            capabilities={"write"},
+            capabilities={"write", STREAM_WRITE},
         )
 
     def create_workbook(self) -> WorkbookData:
@@ -94,6 +102,7 @@ class XlsxwriterAdapter(WriteOnlyAdapter):
             "images": {},  # sheet_name -> list of images
             "comments": {},  # sheet_name -> list of comments
             "freeze": {},  # sheet_name -> freeze/split settings
+            "shared_strings": {},  # string -> None, in registration order
             "path": None,
             "workbook": None,
         }
@@ -128,30 +137,12 @@ class XlsxwriterAdapter(WriteOnlyAdapter):
             workbook["freeze"][sheet] = None
 
     def _parse_cell(self, cell: str) -> tuple[int, int]:
-        """Parse cell reference like 'A1' to (row, col) tuple."""
-        import re
-
-        match = re.match(r"([A-Z]+)(\d+)", cell.upper())
-        if not match:
-            raise ValueError(f"Invalid cell reference: {cell}")
-
-        col_str, row_str = match.groups()
-        row = int(row_str) - 1  # Convert to 0-indexed
-
-        # Convert column letters to number
-        col = 0
-        for char in col_str:
-            col = col * 26 + (ord(char) - ord("A") + 1)
-        col -= 1  # Convert to 0-indexed
-
-        return row, col
+        """Parse cell reference like 'A1' to 0-indexed (row, col) tuple."""
+        return parse_cell_ref(cell)
 
     def _col_to_index(self, column: str) -> int:
         """Convert column letter(s) to 0-indexed column number."""
-        col = 0
-        for char in column.upper():
-            col = col * 26 + (ord(char) - ord("A") + 1)
-        return col - 1
+        return column_index(column)
 
     def write_cell_value(
         self,
@@ -174,6 +165,33 @@ class XlsxwriterAdapter(WriteOnlyAdapter):
             }
         )
 
+    def write_cell_value_rc(
+        self,
+        workbook: WorkbookData,
+        sheet: str,
+        row: int,
+        col: int,
+        value: CellValue,
+    ) -> None:
+        self._ensure_sheet(workbook, sheet)
+        workbook["sheets"][sheet].append({"type": "value", "row": row, "col": col, "value": value})
+
+    def write_rows(
+        self,
+        workbook: WorkbookData,
+        sheet: str,
+        row0: int,
+        col0: int,
+        rows: Iterable[Sequence[CellValue]],
+    ) -> None:
+        """Queue a block of typed rows with one list extend."""
+        self._ensure_sheet(workbook, sheet)
+        workbook["sheets"][sheet].extend(
+            {"type": "value", "row": r, "col": c, "value": value}
+            for r, row in enumerate(rows, row0)
+            for c, value in enumerate(row, col0)
+        )
+
     def write_sheet_values(
         self,
         workbook: WorkbookData,
@@ -236,6 +254,72 @@ class XlsxwriterAdapter(WriteOnlyAdapter):
             }
         )
 
+    def write_cells_bulk(
+        self,
+        workbook: WorkbookData,
+        sheet: str,
+        cells: Sequence[str],
+        values: Sequence[CellValue],
+        formats: Sequence[CellFormat | None] | None = None,
+        borders: Sequence[BorderInfo | None] | None = None,
+    ) -> None:
+        """Queue many cell writes with a single sheet lookup."""
+        n = len(cells)
+        if (
+            len(values) != n
+            or (formats is not None and len(formats) != n)
+            or (borders is not None and len(borders) != n)
+        ):
+            raise ValueError("write_cells_bulk inputs must all have the same length")
+        self._ensure_sheet(workbook, sheet)
+        ops: list[dict[str, Any]] = []
+        append = ops.append
+        for i, cell in enumerate(cells):
+            row, col = self._parse_cell(cell)
+            append({"type": "value", "row": row, "col": col, "value": values[i]})
+            if formats is not None and (fmt := formats[i]) is not None:
+                append({"type": "format", "row": row, "col": col, "format": fmt})
+            if borders is not None and (border := borders[i]) is not None:
+                append({"type": "border", "row": row, "col": col, "border": border})
+        workbook["sheets"][sheet].extend(ops)
+
+    @staticmethod
+    def _write_typed_cell(
+        ws: Any,
+        wb: Any,
+        row: int,
+        col: int,
+        cell_value: CellValue,
+        fmt: Any,
+    ) -> None:
+        if cell_value.type == CellType.BLANK:
+            ws.write_blank(row, col, None, fmt)
+        elif cell_value.type == CellType.FORMULA:
+            ws.write_formula(row, col, cell_value.formula or cell_value.value, fmt)
+        elif cell_value.type == CellType.BOOLEAN:
+            ws.write_boolean(row, col, cell_value.value, fmt)
+        elif cell_value.type == CellType.NUMBER:
+            ws.write_number(row, col, cell_value.value, fmt)
+        elif cell_value.type == CellType.DATE:
+            dt_value = cell_value.value
+            if isinstance(dt_value, _date) and not isinstance(dt_value, _datetime):
+                dt_value = _datetime.combine(dt_value, _datetime.min.time())
+            ws.write_datetime(row, col, dt_value, fmt)
+        elif cell_value.type == CellType.DATETIME:
+            ws.write_datetime(row, col, cell_value.value, fmt)
+        elif cell_value.type == CellType.ERROR:
+            # Write formula that produces error
+            error_formulas = {
+                "#DIV/0!": "=1/0",
+                "#N/A": "=NA()",
+                "#VALUE!": '="text"+1',
+            }
+            fallback = f'=ERROR("{cell_value.value}")'
+            formula = error_formulas.get(cell_value.value, fallback)
+            ws.write_formula(row, col, formula, fmt)
+        else:
+            ws.write_string(row, col, str(cell_value.value), fmt)
+
     def _create_format(
         self,
         wb: Workbook,
@@ -348,13 +432,51 @@ class XlsxwriterAdapter(WriteOnlyAdapter):
 
         return wb.add_format(fmt_dict)
 
+    def begin_streaming_write(self, path: Path) -> StreamWriter:
+        return XlsxwriterStreamWriter(path)
+
+    def register_shared_strings(self, workbook: WorkbookData, strings: Iterable[str]) -> None:
+        workbook["shared_strings"].update(dict.fromkeys(strings))
+
+    @staticmethod
+    def _seed_shared_strings(wb: Workbook, workbook: WorkbookData) -> None:
+        """Give registered strings the lowest SST indices, in registration order.
+
+        Only the lookup table is seeded; reference counts are still taken as
+        cells are written, so the sst count attribute stays accurate.
+        """
+        strings = workbook.get("shared_strings")
+        if not strings:
+            return
+        # Private SharedStringTable layout (string_table dict + unique_count),
+        # checked against xlsxwriter 3.2.9. If it changes, skip seeding: the
+        # strings still enter the table as their cells are written.
+        table: Any = getattr(wb, "str_table", None)
+        string_table = getattr(table, "string_table", None)
+        if not isinstance(string_table, dict) or not isinstance(
+            getattr(table, "unique_count", None), int
+        ):
+            return
+        for string in strings:
+            if string not in string_table:
+                string_table[string] = table.unique_count
+                table.unique_count += 1
+
     def save_workbook(self, workbook: WorkbookData, path: Path) -> None:
         """Save a workbook to a file.
 
         This is where the actual xlsxwriter workbook is created and
         all queued operations are executed.
         """
-        wb = xlsxwriter.Workbook(str(path))
+        self._replay(workbook, xlsxwriter.Workbook(str(path), dict(self._workbook_options)))
+
+    def save_workbook_to_stream(self, workbook: WorkbookData, stream: BinaryIO) -> None:
+        options = {**self._workbook_options, "in_memory": True}
+        self._replay(workbook, xlsxwriter.Workbook(stream, options))
+
+    def _replay(self, workbook: WorkbookData, wb: Workbook) -> None:
+        """Execute all queued operations against *wb*, then close it."""
+        self._seed_shared_strings(wb, workbook)
 
         try:
             for sheet_name, operations in workbook["sheets"].items():
@@ -439,33 +561,7 @@ class XlsxwriterAdapter(WriteOnlyAdapter):
                                 CellFormat(number_format=default_format),
                                 None,
                             )
-                        if cell_value.type == CellType.BLANK:
-                            ws.write_blank(row, col, None, fmt)
-                        elif cell_value.type == CellType.FORMULA:
-                            ws.write_formula(row, col, cell_value.formula or cell_value.value, fmt)
-                        elif cell_value.type == CellType.BOOLEAN:
-                            ws.write_boolean(row, col, cell_value.value, fmt)
-                        elif cell_value.type == CellType.NUMBER:
-                            ws.write_number(row, col, cell_value.value, fmt)
-                        elif cell_value.type == CellType.DATE:
-                            dt_value = cell_value.value
-                            if isinstance(dt_value, _date) and not isinstance(dt_value, _datetime):
-                                dt_value = _datetime.combine(dt_value, _datetime.min.time())
-                            ws.write_datetime(row, col, dt_value, fmt)
-                        elif cell_value.type == CellType.DATETIME:
-                            ws.write_datetime(row, col, cell_value.value, fmt)
-                        elif cell_value.type == CellType.ERROR:
-                            # Write formula that produces error
-                            error_formulas = {
-                                "#DIV/0!": "=1/0",
-                                "#N/A": "=NA()",
-                                "#VALUE!": '="text"+1',
-                            }
-                            fallback = f'=ERROR("{cell_value.value}")'
-                            formula = error_formulas.get(cell_value.value, fallback)
-                            ws.write_formula(row, col, formula, fmt)
-                        else:
-                            ws.write_string(row, col, str(cell_value.value), fmt)
+                        self._write_typed_cell(ws, wb, row, col, cell_value, fmt)
                     elif fmt:
                         # Write blank with format
                         ws.write_blank(row, col, None, fmt)
@@ -631,6 +727,12 @@ class XlsxwriterAdapter(WriteOnlyAdapter):
         col_index = self._col_to_index(column)
         workbook["col_widths"][sheet][col_index] = width
 
+    def write_column_widths(
+        self, workbook: WorkbookData, sheet: str, widths: Mapping[int, float]
+    ) -> None:
+        self._ensure_sheet(workbook, sheet)
+        workbook["col_widths"][sheet].update(widths)
+
     # =========================================================================
     # Tier 2 Write Operations
     # =========================================================================
@@ -665,3 +767,46 @@ class XlsxwriterAdapter(WriteOnlyAdapter):
     def set_freeze_panes(self, workbook: WorkbookData, sheet: str, settings: JSONDict) -> None:
         self._ensure_sheet(workbook, sheet)
         workbook["freeze"][sheet] = settings
+
+
+class XlsxwriterStreamWriter(StreamWriter):
+    """Row sink backed by an xlsxwriter workbook in ``constant_memory`` mode."""
+
+    __slots__ = ("_wb", "_ws", "_row", "_date_formats")
+
+    def __init__(self, path: Path) -> None:
+        self._wb = xlsxwriter.Workbook(str(path), {"constant_memory": True})
+        self._ws: Any = None
+        self._row = 0
+        self._date_formats: dict[CellType, Any] = {}
+
+    def add_sheet(self, name: str) -> None:
+        self._ws = self._wb.add_worksheet(name)
+        self._row = 0
+
+    def append_row(self, row: Sequence[Any]) -> None:
+        ws = self._ws
+        if ws is None:
+            raise ValueError("add_sheet() must be called before append_row()")
+        r = self._row
+        for c, value in enumerate(row):
+            if value is None:
+                continue
+            if isinstance(value, CellValue):
+                fmt = None
+                if value.type in (CellType.DATE, CellType.DATETIME):
+                    fmt = self._date_format(value.type)
+                XlsxwriterAdapter._write_typed_cell(ws, self._wb, r, c, value, fmt)
+            else:
+                ws.write(r, c, value)
+        self._row = r + 1
+
+    def close(self) -> None:
+        self._wb.close()
+
+    def _date_format(self, cell_type: CellType) -> Any:
+        fmt = self._date_formats.get(cell_type)
+        if fmt is None:
+            pattern = "yyyy-mm-dd" if cell_type == CellType.DATE else "yyyy-mm-dd hh:mm:ss"
+            fmt = self._date_formats[cell_type] = self._wb.add_format({"num_format": pattern})
+        return fmt
@@ -8,11 +8,12 @@ Key constraint: cells must be written top→bottom, left→right.
 The deferred buffer is sorted by (row, col) before replay.
 """
 
-from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import xlsxwriter
+from xlsxwriter import Workbook
 
+from excelbench.harness.adapters.streaming import STREAM_WRITE
 from excelbench.harness.adapters.xlsxwriter_adapter import XlsxwriterAdapter
 from excelbench.models import CellFormat, CellType, CellValue, LibraryInfo
 
@@ -27,22 +28,24 @@ class XlsxwriterConstmemAdapter(XlsxwriterAdapter):
     """xlsxwriter with ``constant_memory=True`` (streaming writes).
 
     Inherits all buffering/replay logic from :class:`XlsxwriterAdapter`.
-    Only ``info`` and ``save_workbook`` are overridden.
+    Only ``info``, the workbook options and the op replay are overridden.
     """
 
+    __slots__ = ()
+
+    _workbook_options: ClassVar[dict[str, Any]] = {"constant_memory": True}
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
             name="xlsxwriter-constmem",
             version=_get_version(),
             language="python",
-            capabilities={"write"},
+            capabilities={"write", STREAM_WRITE},
         )
 
-    def save_workbook(self, workbook: WorkbookData, path: Path) -> None:
-        """Save with constant_memory=True, replaying ops in row-major order."""
-        wb = xlsxwriter.Workbook(str(path), {"constant_memory": True})
-
+    def _replay(self, workbook: WorkbookData, wb: Workbook) -> None:
+        """Replay queued ops in row-major order, as constant_memory requires."""
         try:
             for sheet_name, operations in workbook["sheets"].items():
                 ws = wb.add_worksheet(sheet_name)
@@ -126,45 +129,6 @@ class XlsxwriterConstmemAdapter(XlsxwriterAdapter):
 
     # -- Helper methods extracted for reuse --
 
-    @staticmethod
-    def _write_typed_cell(
-        ws: Any,
-        wb: Any,
-        row: int,
-        col: int,
-        cell_value: CellValue,
-        fmt: Any,
-    ) -> None:
-        from datetime import date as _date
-        from datetime import datetime as _datetime
-
-        if cell_value.type == CellType.BLANK:
-            ws.write_blank(row, col, None, fmt)
-        elif cell_value.type == CellType.FORMULA:
-            ws.write_formula(row, col, cell_value.formula or cell_value.value, fmt)
-        elif cell_value.type == CellType.BOOLEAN:
-            ws.write_boolean(row, col, cell_value.value, fmt)
-        elif cell_value.type == CellType.NUMBER:
-            ws.write_number(row, col, cell_value.value, fmt)
-        elif cell_value.type == CellType.DATE:
-            dt_value = cell_value.value
-            if isinstance(dt_value, _date) and not isinstance(dt_value, _datetime):
-                dt_value = _datetime.combine(dt_value, _datetime.min.time())
-            ws.write_datetime(row, col, dt_value, fmt)
-        elif cell_value.type == CellType.DATETIME:
-            ws.write_datetime(row, col, cell_value.value, fmt)
-        elif cell_value.type == CellType.ERROR:
-            error_formulas = {
-                "#DIV/0!": "=1/0",
-                "#N/A": "=NA()",
-                "#VALUE!": '="text"+1',
-            }
-            fallback = f'=ERROR("{cell_value.value}")'
-            formula = error_formulas.get(cell_value.value, fallback)
-            ws.write_formula(row, col, formula, fmt)
-        else:
-            ws.write_string(row, col, str(cell_value.value), fmt)
-
     def _apply_conditional_format(self, ws: Any, wb: Any, rule: dict[str, Any]) -> None:
         cf = rule.get("cf_rule", rule)
         rng = cf.get("range")
@@ -1,11 +1,12 @@
 """Excel oracle adapter using xlwings (read-only)."""
 
-from datetime import date, datetime
+from datetime import date, datetime, time
 from pathlib import Path
 from typing import Any
 
 import xlwings as xw
 
+from excelbench.harness.adapters.a1 import coord_to_a1
 from excelbench.harness.adapters.base import ReadOnlyAdapter
 from excelbench.models import (
     BorderEdge,
@@ -15,10 +16,13 @@ from excelbench.models import (
     CellType,
     CellValue,
     LibraryInfo,
+    OpenOptions,
 )
 
 JSONDict = dict[str, Any]
 
+_MIDNIGHT = time()
+
 
 class XlLineStyle:
     CONTINUOUS = 1
@@ -116,17 +120,11 @@ def _map_underline(value: object) -> str | None:
     return str(value)
 
 
-def _cell_address(row: int, col: int) -> str:
-    result = ""
-    while col > 0:
-        col, rem = divmod(col - 1, 26)
-        result = chr(65 + rem) + result
-    return f"{result}{row}"
-
-
 class ExcelOracleAdapter(ReadOnlyAdapter):
     """Read-only adapter backed by Excel via xlwings."""
 
+    __slots__ = ()
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
@@ -136,7 +134,7 @@ class ExcelOracleAdapter(ReadOnlyAdapter):
             capabilities={"read"},
         )
 
-    def open_workbook(self, path: Path) -> Any:
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
         return xw.Book(str(path))
 
     def close_workbook(self, workbook: Any) -> None:
@@ -172,12 +170,7 @@ class ExcelOracleAdapter(ReadOnlyAdapter):
             return CellValue(type=CellType.DATE, value=value)
 
         if isinstance(value, datetime):
-            if (
-                value.hour == 0
-                and value.minute == 0
-                and value.second == 0
-                and value.microsecond == 0
-            ):
+            if value.time() == _MIDNIGHT:
                 return CellValue(type=CellType.DATE, value=value.date())
             return CellValue(type=CellType.DATETIME, value=value)
 
@@ -601,7 +594,7 @@ class ExcelOracleAdapter(ReadOnlyAdapter):
             if window.FreezePanes:
                 return {
                     "mode": "freeze",
-                    "top_left_cell": _cell_address(window.ScrollRow, window.ScrollColumn),
+                    "top_left_cell": coord_to_a1(window.ScrollRow - 1, window.ScrollColumn - 1),
                 }
             if window.SplitRow or window.SplitColumn:
                 return {
@@ -1,13 +1,14 @@
 """Adapter for xlwt library (write-only, .xls BIFF8 format)."""
 
-import re
 from datetime import date as _date
 from datetime import datetime as _datetime
+from functools import cache
 from pathlib import Path
 from typing import Any
 
 import xlwt
 
+from excelbench.harness.adapters.a1 import column_index, parse_cell_ref, range_bounds
 from excelbench.harness.adapters.base import WriteOnlyAdapter
 from excelbench.models import (
     BorderInfo,
@@ -20,7 +21,10 @@ from excelbench.models import (
 
 JSONDict = dict[str, Any]
 
+_parse_cell_ref = parse_cell_ref
 
+
+@cache
 def _get_version() -> str:
     try:
         from importlib.metadata import version
@@ -30,25 +34,7 @@ def _get_version() -> str:
         return "unknown"
 
 
-def _parse_cell_ref(cell: str) -> tuple[int, int]:
-    """Parse a cell reference like 'A1' to (row_0based, col_0based)."""
-    match = re.match(r"([A-Z]+)(\d+)", cell.upper())
-    if not match:
-        raise ValueError(f"Invalid cell reference: {cell}")
-    col_str, row_str = match.groups()
-    row = int(row_str) - 1
-    col = 0
-    for char in col_str:
-        col = col * 26 + (ord(char) - ord("A") + 1)
-    col -= 1
-    return row, col
-
-
-def _col_to_index(column: str) -> int:
-    col = 0
-    for char in column.upper():
-        col = col * 26 + (ord(char) - ord("A") + 1)
-    return col - 1
+_col_to_index = column_index
 
 
 # xlwt border style constants
@@ -203,6 +189,8 @@ class XlwtAdapter(WriteOnlyAdapter):
     comments, or pivot tables.
     """
 
+    __slots__ = ()
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
@@ -427,9 +415,7 @@ class XlwtAdapter(WriteOnlyAdapter):
 
     def merge_cells(self, workbook: xlwt.Workbook, sheet: str, cell_range: str) -> None:
         ws = self._get_sheet(workbook, sheet)
-        start, end = cell_range.replace("$", "").split(":")
-        r1, c1 = _parse_cell_ref(start)
-        r2, c2 = _parse_cell_ref(end)
+        r1, c1, r2, c2 = range_bounds(cell_range)
         ws.write_merge(r1, r2, c1, c2, "")
 
     def add_conditional_format(self, workbook: Any, sheet: str, rule: JSONDict) -> None:
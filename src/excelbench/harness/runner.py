@@ -14,6 +14,7 @@ from excelbench.harness.adapters import (
     OpenpyxlAdapter,
     get_all_adapters,
 )
+from excelbench.harness.adapters.a1 import cell_to_coord
 from excelbench.models import (
     BenchmarkMetadata,
     BenchmarkResults,
@@ -773,10 +774,11 @@ def read_merged_cells_actual(
                 result["top_left_value"] = _read_cell_scalar(adapter, workbook, sheet, start_cell)
             if expected.get("non_top_left_nonempty") is not None:
                 count = 0
+                read_value = adapter.bind_readers()[0]
                 for cell in _cells_in_range(start_cell, end_cell):
                     if cell == start_cell:
                         continue
-                    value = adapter.read_cell_value(workbook, sheet, cell)
+                    value = read_value(workbook, sheet, cell)
                     if value.type != CellType.BLANK and value.value not in (None, ""):
                         count += 1
                 result["non_top_left_nonempty"] = count
@@ -1116,6 +1118,10 @@ def test_write(
             for name in sheet_names:
                 adapter.add_sheet(workbook, name)
 
+            # cell_values writes are batched per sheet and flushed with one
+            # write_cells_bulk() call each after the loop.
+            bulk: dict[str, tuple[list[str], list[CellValue], list[CellFormat | None]]] = {}
+
             for tc in test_file.test_cases:
                 if "sheet_names" in tc.expected:
                     continue
@@ -1124,9 +1130,11 @@ def test_write(
                 target_cell = tc.cell or f"B{tc.row}"
 
                 if test_file.feature == "cell_values":
-                    _write_cell_value_case(
-                        adapter, workbook, target_sheet, target_cell, tc.expected
-                    )
+                    cells, values, formats = bulk.setdefault(target_sheet, ([], [], []))
+                    cell_value, cell_format = _cell_value_write(tc.expected)
+                    cells.append(target_cell)
+                    values.append(cell_value)
+                    formats.append(cell_format)
                 elif test_file.feature == "formulas":
                     _write_formula_case(adapter, workbook, target_sheet, target_cell, tc.expected)
                 elif test_file.feature == "text_formatting":
@@ -1194,6 +1202,9 @@ def test_write(
                 elif test_file.feature == "freeze_panes":
                     _write_freeze_panes_case(adapter, workbook, target_sheet, tc.expected)
 
+            for bulk_sheet, (cells, values, formats) in bulk.items():
+                adapter.write_cells_bulk(workbook, bulk_sheet, cells, values, formats)
+
             adapter.save_workbook(workbook, output_path)
         except Exception as e:
             for tc in test_file.test_cases:
@@ -1456,16 +1467,10 @@ def _extract_column(cell: str) -> str:
 
 
 def _cell_to_coord(cell: str) -> tuple[int, int]:
-    import re
-
-    match = re.match(r"([A-Z]+)(\d+)", cell.upper())
-    if not match:
+    try:
+        return cell_to_coord(cell)
+    except ValueError:
         return 1, 1
-    col_str, row_str = match.groups()
-    col = 0
-    for char in col_str:
-        col = col * 26 + (ord(char) - ord("A") + 1)
-    return int(row_str), col
 
 
 def _coord_to_cell(row: int, col: int) -> str:
@@ -1713,6 +1718,14 @@ def _border_from_expected(expected: JSONDict) -> BorderInfo:
     )
 
 
+def _cell_value_write(expected: JSONDict) -> tuple[CellValue, CellFormat | None]:
+    cell_value = _cell_value_from_expected(expected)
+    if cell_value.type in (CellType.DATE, CellType.DATETIME):
+        number_format = "yyyy-mm-dd" if cell_value.type == CellType.DATE else "yyyy-mm-dd hh:mm:ss"
+        return cell_value, CellFormat(number_format=number_format)
+    return cell_value, None
+
+
 def _write_cell_value_case(
     adapter: ExcelAdapter,
     workbook: Any,
@@ -1720,12 +1733,10 @@ def _write_cell_value_case(
     cell: str,
     expected: JSONDict,
 ) -> None:
-    cell_value = _cell_value_from_expected(expected)
+    cell_value, cell_format = _cell_value_write(expected)
     adapter.write_cell_value(workbook, sheet, cell, cell_value)
-
-    if cell_value.type in (CellType.DATE, CellType.DATETIME):
-        number_format = "yyyy-mm-dd" if cell_value.type == CellType.DATE else "yyyy-mm-dd hh:mm:ss"
-        adapter.write_cell_format(workbook, sheet, cell, CellFormat(number_format=number_format))
+    if cell_format is not None:
+        adapter.write_cell_format(workbook, sheet, cell, cell_format)
 
 
 def _write_formula_case(
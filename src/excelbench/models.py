@@ -1,5 +1,6 @@
 """Core data models for ExcelBench."""
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
@@ -63,7 +64,7 @@ class BorderStyle(StrEnum):
     SLANT_DASH_DOT = "slantDashDot"
 
 
-@dataclass
+@dataclass(slots=True)
 class CellValue:
     """Represents a cell's value and type."""
 
@@ -72,7 +73,7 @@ class CellValue:
     formula: str | None = None  # If type is FORMULA, this holds the formula string
 
 
-@dataclass
+@dataclass(slots=True)
 class CellFormat:
     """Represents text formatting for a cell."""
 
@@ -92,7 +93,7 @@ class CellFormat:
     indent: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BorderEdge:
     """Represents one edge of a cell border."""
 
@@ -100,7 +101,7 @@ class BorderEdge:
     color: str = "#000000"
 
 
-@dataclass
+@dataclass(slots=True)
 class BorderInfo:
     """Represents all borders of a cell."""
 
@@ -168,7 +169,7 @@ class TestResult:
     label: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DiagnosticLocation:
     """Location metadata for a diagnostic event."""
 
@@ -179,14 +180,50 @@ class DiagnosticLocation:
     cell: str | None = None
 
 
-@dataclass
+class LazyMessage:
+    """A diagnostic message rendered on first use.
+
+    Mismatch diagnostics embed reprs of the expected/actual payloads; building
+    that text is deferred until the diagnostic is displayed or serialized.
+    Compares and hashes like the rendered string.
+    """
+
+    __slots__ = ("_render", "_text")
+
+    def __init__(self, render: Callable[[], str]) -> None:
+        self._render: Callable[[], str] | None = render
+        self._text: str | None = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            assert self._render is not None
+            self._text = self._render()
+            self._render = None
+        return self._text
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (str, LazyMessage)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __contains__(self, item: str) -> bool:
+        return item in str(self)
+
+
+@dataclass(slots=True)
 class Diagnostic:
     """Normalized diagnostic information attached to failed checks."""
 
     category: DiagnosticCategory
     severity: DiagnosticSeverity
     location: DiagnosticLocation
-    adapter_message: str
+    adapter_message: str | LazyMessage
     probable_cause: str | None = None
 
 
@@ -452,6 +489,22 @@ class LibraryInfo:
     capabilities: set[str] = field(default_factory=set)  # {"read", "write"}
 
 
+@dataclass(frozen=True)
+class OpenOptions:
+    """Hints passed to ``ExcelAdapter.open_workbook`` for selective loading.
+
+    Adapters honour what their library supports and ignore the rest, so the
+    defaults must always describe a full load. When ``sheets`` is set, an
+    adapter may load (and report) only those sheets.
+    """
+
+    read_only: bool = False
+    data_only: bool = False
+    sheets: frozenset[str] | None = None
+    load_styles: bool = True
+    load_shared_strings: bool = True
+
+
 @dataclass
 class BenchmarkMetadata:
     """Metadata about a benchmark run."""
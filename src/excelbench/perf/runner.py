@@ -8,10 +8,15 @@ Design principles:
 
 from __future__ import annotations
 
+import io
+from collections.abc import Iterator
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from excelbench.models import OpenOptions
 
 
 @dataclass(frozen=True)
@@ -70,6 +75,18 @@ class PerfResults:
 
 BENCHMARK_VERSION = "0.1.0"
 
+# bulk_write_grid workloads at least this large use the adapter's streaming
+# writer when it has one (override per workload with "streaming": true/false).
+STREAMING_WRITE_MIN_CELLS = 1_000_000
+
+# Read ops that only look at cell values; adapters may skip loading styles.
+_VALUE_ONLY_READ_OPS = frozenset(
+    {"cell_value", "formula", "bulk_sheet_values", "bulk_sheet_values_raw"}
+)
+# Ops that walk the sheet once in row order. They can use a streaming
+# (read-only) load; per-cell ops cannot, since random access would rescan.
+_STREAMING_READ_OPS = frozenset({"bulk_sheet_values", "bulk_sheet_values_raw"})
+
 
 def run_perf(
     test_dir: Path,
@@ -146,22 +163,29 @@ def run_perf(
                 notes_parts.append("Write unsupported")
 
             if adapter.can_read():
+                read_path = adapter.pick_read_path(file_path) if file_exists else file_path
                 if "read" not in workload_ops:
                     # Workload explicitly excludes read.
                     pass
                 elif not file_exists:
                     notes_parts.append(f"Read skipped: missing input file {test_file.path}")
-                elif not adapter.supports_read_path(file_path):
+                elif not adapter.supports_read_path(read_path):
                     notes_parts.append(
                         f"Read not applicable: {adapter.name} does not support "
                         f"{file_path.suffix} input"
                     )
+                elif not adapter.quick_probe(read_path):
+                    notes_parts.append(
+                        f"Read skipped: {read_path.name} is not a valid {read_path.suffix} file"
+                    )
                 else:
+                    if read_path != file_path:
+                        notes_parts.append(f"Read input: {read_path.name}")
                     try:
                         read_res = _bench_read(
                             adapter=adapter,
                             test_file=test_file,
-                            file_path=file_path,
+                            file_path=read_path,
                             warmup=warmup,
                             iters=iters,
                             breakdown=breakdown,
@@ -409,30 +433,33 @@ def _measure_read_iteration(
     if breakdown:
         phases["open"] = _ns_to_ms(t1 - t0)
 
-    t0 = time.perf_counter_ns()
-    sheet_names = adapter.get_sheet_names(workbook)
-    default_sheet = sheet_names[0] if sheet_names else test_file.feature
-    t1 = time.perf_counter_ns()
-    if breakdown:
-        phases["sheets"] = _ns_to_ms(t1 - t0)
-
-    t0 = time.perf_counter_ns()
-    for tc in test_file.test_cases:
-        _exercise_read_case(
-            fidelity=fidelity,
-            adapter=adapter,
-            workbook=workbook,
-            default_sheet=default_sheet,
-            test_case=tc,
-            feature=test_file.feature,
-        )
-    t1 = time.perf_counter_ns()
-    if breakdown:
-        phases["exercise"] = _ns_to_ms(t1 - t0)
-
-    t0 = time.perf_counter_ns()
-    adapter.close_workbook(workbook)
-    t1 = time.perf_counter_ns()
+    # Close in ``finally`` so a failing case does not leak the handle into
+    # the next iteration.
+    try:
+        t0 = time.perf_counter_ns()
+        sheet_names = adapter.get_sheet_names(workbook)
+        default_sheet = sheet_names[0] if sheet_names else test_file.feature
+        t1 = time.perf_counter_ns()
+        if breakdown:
+            phases["sheets"] = _ns_to_ms(t1 - t0)
+
+        t0 = time.perf_counter_ns()
+        for tc in test_file.test_cases:
+            _exercise_read_case(
+                fidelity=fidelity,
+                adapter=adapter,
+                workbook=workbook,
+                default_sheet=default_sheet,
+                test_case=tc,
+                feature=test_file.feature,
+            )
+        t1 = time.perf_counter_ns()
+        if breakdown:
+            phases["exercise"] = _ns_to_ms(t1 - t0)
+    finally:
+        t0 = time.perf_counter_ns()
+        adapter.close_workbook(workbook)
+        t1 = time.perf_counter_ns()
     if breakdown:
         phases["close"] = _ns_to_ms(t1 - t0)
 
@@ -604,6 +631,7 @@ def _bench_write_workload(
 
     feature_stem = Path(str(workload.get("scenario") or "workload")).name
     ext = adapter.output_extension
+    streaming = _use_streaming_write(adapter, workload, len(cells))
 
     with tempfile.TemporaryDirectory() as tmpdir:
         out_dir = Path(tmpdir) / adapter.name
@@ -611,7 +639,12 @@ def _bench_write_workload(
         out_path = out_dir / f"{feature_stem}{ext}"
 
         for i in range(warmup + iters):
-            m = _measure_write_workload_iteration(
+            measure = (
+                _measure_streaming_write_iteration
+                if streaming
+                else _measure_write_workload_iteration
+            )
+            m = measure(
                 adapter=adapter,
                 output_path=out_path,
                 workload=workload,
@@ -646,14 +679,45 @@ def _bench_write_workload(
     )
 
 
-def _measure_read_workload_iteration(
+def _workload_open_options(workload: dict[str, Any]) -> OpenOptions:
+    """Ask adapters to load only what a read workload touches.
+
+    Workloads read a single sheet, value-only ops never need styles, and
+    whole-sheet scans can use a streaming load.
+    """
+    from excelbench.models import OpenOptions
+
+    op = str(workload.get("op") or "cell_value")
+    return OpenOptions(
+        read_only=op in _STREAMING_READ_OPS,
+        sheets=frozenset({str(workload.get("sheet") or "S1")}),
+        load_styles=op not in _VALUE_ONLY_READ_OPS,
+    )
+
+
+def _use_streaming_write(adapter: Any, workload: dict[str, Any], n_cells: int) -> bool:
+    """Decide whether a write workload should go through begin_streaming_write()."""
+    requested = workload.get("streaming")
+    if requested is False:
+        return False
+    op = str(workload.get("op") or "")
+    capable = getattr(adapter, "can_stream_write", lambda: False)() is True
+    if requested is True:
+        if op != "bulk_write_grid" or not capable:
+            raise ValueError(f"Streaming write not supported for {adapter.name} op={op!r}")
+        return True
+    return op == "bulk_write_grid" and capable and n_cells >= STREAMING_WRITE_MIN_CELLS
+
+
+def _measure_streaming_write_iteration(
     *,
     adapter: Any,
-    file_path: Path,
+    output_path: Path,
     workload: dict[str, Any],
     cells: list[str],
     breakdown: bool,
 ) -> dict[str, Any]:
+    """Like _measure_write_workload_iteration, but rows go through a StreamWriter."""
     import resource
     import time
 
@@ -664,27 +728,93 @@ def _measure_read_workload_iteration(
 
     phases: dict[str, float] = {}
 
+    start_cell, grid_rows = _bulk_write_grid_rows(workload)
+    r0, c0 = _cell_to_coord(start_cell)
+    lead: list[Any] = [None] * (c0 - 1)
+
     t0 = time.perf_counter_ns()
-    workbook = adapter.open_workbook(file_path)
+    writer = adapter.begin_streaming_write(output_path)
     t1 = time.perf_counter_ns()
     if breakdown:
-        phases["open"] = _ns_to_ms(t1 - t0)
+        phases["create"] = _ns_to_ms(t1 - t0)
 
     t0 = time.perf_counter_ns()
-    adapter.get_sheet_names(workbook)
+    writer.add_sheet(str(workload.get("sheet") or "S1"))
     t1 = time.perf_counter_ns()
     if breakdown:
-        phases["sheets"] = _ns_to_ms(t1 - t0)
+        phases["add_sheets"] = _ns_to_ms(t1 - t0)
 
     t0 = time.perf_counter_ns()
-    _run_workload_read(adapter=adapter, workbook=workbook, workload=workload, cells=cells)
+    append_row = writer.append_row
+    for _ in range(r0 - 1):
+        append_row(())
+    for row in grid_rows:
+        append_row(lead + row if lead else row)
     t1 = time.perf_counter_ns()
     if breakdown:
         phases["exercise"] = _ns_to_ms(t1 - t0)
 
     t0 = time.perf_counter_ns()
-    adapter.close_workbook(workbook)
+    writer.close()
     t1 = time.perf_counter_ns()
+    if breakdown:
+        phases["save"] = _ns_to_ms(t1 - t0)
+
+    wall1 = time.perf_counter_ns()
+    cpu1 = time.process_time_ns()
+
+    rss_after = _ru_maxrss_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    rss_peak = max(rss_before, rss_after)
+
+    return {
+        "wall_ms": _ns_to_ms(wall1 - wall0),
+        "cpu_ms": _ns_to_ms(cpu1 - cpu0),
+        "rss_peak_mb": rss_peak,
+        "breakdown_ms": phases if breakdown else None,
+    }
+
+
+def _measure_read_workload_iteration(
+    *,
+    adapter: Any,
+    file_path: Path,
+    workload: dict[str, Any],
+    cells: list[str],
+    breakdown: bool,
+) -> dict[str, Any]:
+    import resource
+    import time
+
+    rss_before = _ru_maxrss_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+    wall0 = time.perf_counter_ns()
+    cpu0 = time.process_time_ns()
+
+    phases: dict[str, float] = {}
+
+    opts = _workload_open_options(workload)
+    t0 = time.perf_counter_ns()
+    workbook = adapter.open_workbook(file_path, opts)
+    t1 = time.perf_counter_ns()
+    if breakdown:
+        phases["open"] = _ns_to_ms(t1 - t0)
+
+    try:
+        t0 = time.perf_counter_ns()
+        adapter.get_sheet_names(workbook)
+        t1 = time.perf_counter_ns()
+        if breakdown:
+            phases["sheets"] = _ns_to_ms(t1 - t0)
+
+        t0 = time.perf_counter_ns()
+        _run_workload_read(adapter=adapter, workbook=workbook, workload=workload, cells=cells)
+        t1 = time.perf_counter_ns()
+        if breakdown:
+            phases["exercise"] = _ns_to_ms(t1 - t0)
+    finally:
+        t0 = time.perf_counter_ns()
+        adapter.close_workbook(workbook)
+        t1 = time.perf_counter_ns()
     if breakdown:
         phases["close"] = _ns_to_ms(t1 - t0)
 
@@ -739,8 +869,13 @@ def _measure_write_workload_iteration(
     if breakdown:
         phases["exercise"] = _ns_to_ms(t1 - t0)
 
+    # "save_to": "memory" serializes into a BytesIO so the save phase times
+    # serialization alone, without filesystem writes.
     t0 = time.perf_counter_ns()
-    adapter.save_workbook(workbook, output_path)
+    if workload.get("save_to") == "memory":
+        adapter.save_workbook_to_stream(workbook, io.BytesIO())
+    else:
+        adapter.save_workbook(workbook, output_path)
     t1 = time.perf_counter_ns()
     if breakdown:
         phases["save"] = _ns_to_ms(t1 - t0)
@@ -764,14 +899,17 @@ def _run_workload_read(
 ) -> None:
     sheet = str(workload.get("sheet") or "S1")
     op = str(workload.get("op") or "cell_value")
+    # Resolve the adapter methods once so the timed loops measure the adapter,
+    # not repeated attribute lookups.
+    read_value, read_format, read_border = adapter.bind_readers()
     if op == "cell_value":
         for cell in cells:
-            adapter.read_cell_value(workbook, sheet, cell)
+            read_value(workbook, sheet, cell)
         return
 
     if op == "formula":
         for cell in cells:
-            v = adapter.read_cell_value(workbook, sheet, cell)
+            v = read_value(workbook, sheet, cell)
             _ = v.formula or v.value
         return
 
@@ -818,25 +956,25 @@ def _run_workload_read(
 
     if op == "bg_color":
         for cell in cells:
-            fmt = adapter.read_cell_format(workbook, sheet, cell)
+            fmt = read_format(workbook, sheet, cell)
             _ = fmt.bg_color
         return
 
     if op == "number_format":
         for cell in cells:
-            fmt = adapter.read_cell_format(workbook, sheet, cell)
+            fmt = read_format(workbook, sheet, cell)
             _ = fmt.number_format
         return
 
     if op == "alignment":
         for cell in cells:
-            fmt = adapter.read_cell_format(workbook, sheet, cell)
+            fmt = read_format(workbook, sheet, cell)
             _ = (fmt.h_align, fmt.v_align, fmt.wrap)
         return
 
     if op == "border":
         for cell in cells:
-            border = adapter.read_cell_border(workbook, sheet, cell)
+            border = read_border(workbook, sheet, cell)
             _ = (
                 getattr(border.top, "style", None),
                 getattr(border.bottom, "style", None),
@@ -848,52 +986,36 @@ def _run_workload_read(
     raise ValueError(f"Unsupported workload op for read: {op}")
 
 
-def _run_workload_write(
-    *,
-    adapter: Any,
-    workbook: Any,
-    workload: dict[str, Any],
-    cells: list[str],
-) -> None:
-    from excelbench.models import (
-        BorderEdge,
-        BorderInfo,
-        BorderStyle,
-        CellFormat,
-        CellType,
-        CellValue,
-    )
-
-    sheet = str(workload.get("sheet") or "S1")
-    op = str(workload.get("op") or "cell_value")
+def _bulk_write_grid_rows(workload: dict[str, Any]) -> tuple[str, Iterator[list[Any]]]:
+    """Return the start cell and a lazy row iterator for a ``bulk_write_grid`` workload.
 
-    if op == "bulk_write_grid":
-        fn = getattr(adapter, "write_sheet_values", None)
-        if fn is None:
-            raise ValueError(f"Adapter does not support bulk sheet writes: {adapter.name}")
+    Rows are generated on demand so streaming writers never hold the full grid.
+    """
+    start_cell, end_cell = _split_range(str(workload.get("range") or "A1"))
+    r0, c0 = _cell_to_coord(start_cell)
+    r1, c1 = _cell_to_coord(end_cell)
+    rows = r1 - r0 + 1
+    cols = c1 - c0 + 1
 
-        start_cell, end_cell = _split_range(str(workload.get("range") or "A1"))
-        r0, c0 = _cell_to_coord(start_cell)
-        r1, c1 = _cell_to_coord(end_cell)
-        rows = r1 - r0 + 1
-        cols = c1 - c0 + 1
+    value_type = str(workload.get("value_type") or "number").strip().lower()
 
-        value_type = str(workload.get("value_type") or "number").strip().lower()
+    start = int(workload.get("start") or 1)
+    step = int(workload.get("step") or 1)
 
-        start = int(workload.get("start") or 1)
-        step = int(workload.get("step") or 1)
+    string_prefix = str(workload.get("string_prefix") or "V")
+    string_mode = str(workload.get("string_mode") or "unique").strip().lower()
+    string_value = str(workload.get("string_value") or "X")
+    string_length_raw = workload.get("string_length")
+    string_length = int(string_length_raw) if isinstance(string_length_raw, int) else None
 
-        string_prefix = str(workload.get("string_prefix") or "V")
-        string_mode = str(workload.get("string_mode") or "unique").strip().lower()
-        string_value = str(workload.get("string_value") or "X")
-        string_length_raw = workload.get("string_length")
-        string_length = int(string_length_raw) if isinstance(string_length_raw, int) else None
+    sparse_every = workload.get("sparse_every")
+    if not isinstance(sparse_every, int) or sparse_every < 1:
+        sparse_every = 1
 
-        sparse_every = workload.get("sparse_every")
-        if not isinstance(sparse_every, int) or sparse_every < 1:
-            sparse_every = 1
+    if value_type not in ("number", "string"):
+        raise ValueError(f"Unsupported bulk_write_grid value_type: {value_type}")
 
-        values: list[list[Any]] = []
+    def generate() -> Iterator[list[Any]]:
         v = start
         linear_idx = 0
         for _r in range(rows):
@@ -909,7 +1031,7 @@ def _run_workload_write(
 
                 if value_type == "number":
                     row_vals.append(v)
-                elif value_type == "string":
+                else:
                     if string_mode == "repeated":
                         s = string_value
                     else:
@@ -920,13 +1042,40 @@ def _run_workload_write(
                         else:
                             s = s[:string_length]
                     row_vals.append(s)
-                else:
-                    raise ValueError(f"Unsupported bulk_write_grid value_type: {value_type}")
 
                 v += step
-            values.append(row_vals)
+            yield row_vals
+
+    return start_cell, generate()
+
+
+def _run_workload_write(
+    *,
+    adapter: Any,
+    workbook: Any,
+    workload: dict[str, Any],
+    cells: list[str],
+) -> None:
+    from excelbench.models import (
+        BorderEdge,
+        BorderInfo,
+        BorderStyle,
+        CellFormat,
+        CellType,
+        CellValue,
+    )
+
+    sheet = str(workload.get("sheet") or "S1")
+    op = str(workload.get("op") or "cell_value")
+    write_value, write_format, write_border = adapter.bind_writers()
 
-        fn(workbook, sheet, start_cell, values)
+    if op == "bulk_write_grid":
+        fn = getattr(adapter, "write_sheet_values", None)
+        if fn is None:
+            raise ValueError(f"Adapter does not support bulk sheet writes: {adapter.name}")
+
+        start_cell, grid_rows = _bulk_write_grid_rows(workload)
+        fn(workbook, sheet, start_cell, list(grid_rows))
         return
 
     if op == "bulk_write_styled_grid":
@@ -996,14 +1145,14 @@ def _run_workload_write(
                 palette = ["#FF0000", "#00FF00", "#0000FF", "#FFFF00"]
             for idx, cell in enumerate(cells):
                 color = str(palette[idx % len(palette)])
-                adapter.write_cell_format(workbook, sheet, cell, CellFormat(bg_color=color))
+                write_format(workbook, sheet, cell, CellFormat(bg_color=color))
         elif style_kind == "border":
             border_style_val = BorderStyle(str(workload.get("border_style") or "thin"))
             border_color_val = str(workload.get("border_color") or "#000000")
             edge = BorderEdge(style=border_style_val, color=border_color_val)
             border_obj = BorderInfo(top=edge, bottom=edge, left=edge, right=edge)
             for cell in cells:
-                adapter.write_cell_border(workbook, sheet, cell, border_obj)
+                write_border(workbook, sheet, cell, border_obj)
         return
 
     if op == "cell_value":
@@ -1011,9 +1160,7 @@ def _run_workload_write(
         step = int(workload.get("step") or 1)
         value = start
         for cell in cells:
-            adapter.write_cell_value(
-                workbook, sheet, cell, CellValue(type=CellType.NUMBER, value=value)
-            )
+            write_value(workbook, sheet, cell, CellValue(type=CellType.NUMBER, value=value))
             value += step
         return
 
@@ -1021,7 +1168,7 @@ def _run_workload_write(
         formula = str(workload.get("formula") or "=1+1")
         cell_value = CellValue(type=CellType.FORMULA, formula=formula, value=formula)
         for cell in cells:
-            adapter.write_cell_value(workbook, sheet, cell, cell_value)
+            write_value(workbook, sheet, cell, cell_value)
         return
 
     if op == "bg_color":
@@ -1029,25 +1176,25 @@ def _run_workload_write(
         if not isinstance(palette, list) or not palette:
             palette = ["#FF0000", "#00FF00", "#0000FF", "#FFFF00"]
 
+        if cells:
+            adapter.register_shared_strings(workbook, ("Color",))
         for idx, cell in enumerate(cells):
-            adapter.write_cell_value(
-                workbook, sheet, cell, CellValue(type=CellType.STRING, value="Color")
-            )
+            write_value(workbook, sheet, cell, CellValue(type=CellType.STRING, value="Color"))
             color = str(palette[idx % len(palette)])
-            adapter.write_cell_format(workbook, sheet, cell, CellFormat(bg_color=color))
+            write_format(workbook, sheet, cell, CellFormat(bg_color=color))
         return
 
     if op == "number_format":
         number_format = str(workload.get("number_format") or "0.00")
         cell_format = CellFormat(number_format=number_format)
         for idx, cell in enumerate(cells):
-            adapter.write_cell_value(
+            write_value(
                 workbook,
                 sheet,
                 cell,
                 CellValue(type=CellType.NUMBER, value=float(idx) + 0.5),
             )
-            adapter.write_cell_format(workbook, sheet, cell, cell_format)
+            write_format(workbook, sheet, cell, cell_format)
         return
 
     if op == "alignment":
@@ -1056,11 +1203,11 @@ def _run_workload_write(
         wrap = bool(workload.get("wrap") if workload.get("wrap") is not None else True)
 
         cell_format = CellFormat(h_align=h_align, v_align=v_align, wrap=wrap)
+        if cells:
+            adapter.register_shared_strings(workbook, ("Align",))
         for cell in cells:
-            adapter.write_cell_value(
-                workbook, sheet, cell, CellValue(type=CellType.STRING, value="Align")
-            )
-            adapter.write_cell_format(workbook, sheet, cell, cell_format)
+            write_value(workbook, sheet, cell, CellValue(type=CellType.STRING, value="Align"))
+            write_format(workbook, sheet, cell, cell_format)
         return
 
     if op == "border":
@@ -1068,12 +1215,11 @@ def _run_workload_write(
         color = str(workload.get("border_color") or "#000000")
         edge = BorderEdge(style=style, color=color)
         border = BorderInfo(top=edge, bottom=edge, left=edge, right=edge)
-
+        if cells:
+            adapter.register_shared_strings(workbook, ("Border",))
         for cell in cells:
-            adapter.write_cell_value(
-                workbook, sheet, cell, CellValue(type=CellType.STRING, value="Border")
-            )
-            adapter.write_cell_border(workbook, sheet, cell, border)
+            write_value(workbook, sheet, cell, CellValue(type=CellType.STRING, value="Border"))
+            write_border(workbook, sheet, cell, border)
         return
 
     raise ValueError(f"Unsupported workload op for write: {op}")
@@ -1252,6 +1398,7 @@ def _measure_write_iteration(
         phases["add_sheets"] = _ns_to_ms(t1 - t0)
 
     t0 = time.perf_counter_ns()
+    adapter.register_shared_strings(workbook, _fixture_shared_strings(test_file))
     for tc in test_file.test_cases:
         if isinstance(tc.expected, dict) and "sheet_names" in tc.expected:
             continue
@@ -1290,6 +1437,20 @@ def _measure_write_iteration(
     }
 
 
+def _fixture_shared_strings(test_file: Any) -> list[str]:
+    """Return the plain strings a cell_values fixture write will store."""
+    if test_file.feature != "cell_values":
+        return []
+    return [
+        tc.expected["value"]
+        for tc in test_file.test_cases
+        if isinstance(tc.expected, dict)
+        and tc.expected.get("type", "string") == "string"
+        and isinstance(tc.expected.get("value"), str)
+        and tc.expected["value"]
+    ]
+
+
 def _exercise_write_case(
     *,
     fidelity: Any,
@@ -852,7 +852,7 @@ def _diagnostic_to_json(diagnostic: Diagnostic) -> dict[str, Any]:
             "sheet": diagnostic.location.sheet,
             "cell": diagnostic.location.cell,
         },
-        "adapter_message": diagnostic.adapter_message,
+        "adapter_message": str(diagnostic.adapter_message),
         "probable_cause": diagnostic.probable_cause,
     }
 
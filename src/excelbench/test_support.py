@@ -10,7 +10,14 @@ from pathlib import Path
 from typing import Any
 
 from excelbench.harness.adapters.base import ExcelAdapter
-from excelbench.models import BorderInfo, CellFormat, CellType, CellValue, LibraryInfo
+from excelbench.models import (
+    BorderInfo,
+    CellFormat,
+    CellType,
+    CellValue,
+    LibraryInfo,
+    OpenOptions,
+)
 
 
 class StubExcelAdapter(ExcelAdapter):
@@ -26,7 +33,9 @@ class StubExcelAdapter(ExcelAdapter):
         )
 
     # Read
-    def open_workbook(self, path: Path) -> Any:  # pragma: no cover
+    def open_workbook(  # pragma: no cover
+        self, path: Path, opts: OpenOptions = OpenOptions()
+    ) -> Any:
         raise NotImplementedError
 
     def close_workbook(self, workbook: Any) -> None:  # pragma: no cover
@@ -0,0 +1,79 @@
+"""Tests for the shared A1 cell-reference helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from excelbench.harness.adapters.a1 import (
+    cell_to_coord,
+    column_index,
+    column_letter,
+    coord_to_a1,
+    format_range,
+    parse_cell_ref,
+    range_bounds,
+)
+
+
+@pytest.mark.parametrize(
+    ("cell", "expected"),
+    [
+        ("A1", (1, 1)),
+        ("b7", (7, 2)),
+        ("Z10", (10, 26)),
+        ("AA1", (1, 27)),
+        ("XFD1048576", (1048576, 16384)),
+        ("C3:D4", (3, 3)),  # only the leading reference is consumed
+        ("$A$1", (1, 1)),  # absolute anchors are ignored
+        ("$B7", (7, 2)),
+        ("c$3", (3, 3)),
+    ],
+)
+def test_cell_to_coord(cell: str, expected: tuple[int, int]) -> None:
+    assert cell_to_coord(cell) == expected
+
+
+def test_parse_cell_ref_is_zero_based() -> None:
+    assert parse_cell_ref("A1") == (0, 0)
+    assert parse_cell_ref("AB12") == (11, 27)
+
+
+def test_column_letter() -> None:
+    assert [column_letter(c) for c in (0, 25, 26, 16383)] == ["A", "Z", "AA", "XFD"]
+
+
+def test_column_index_inverts_column_letter() -> None:
+    assert [column_index(s) for s in ("A", "z", "AA", "XFD")] == [0, 25, 26, 16383]
+    assert all(column_index(column_letter(c)) == c for c in range(0, 16384, 97))
+
+
+@pytest.mark.parametrize("letters", ["", "A1", "$A"])
+def test_invalid_column_letters(letters: str) -> None:
+    with pytest.raises(ValueError, match="Invalid column letters"):
+        column_index(letters)
+
+
+def test_coord_to_a1() -> None:
+    assert coord_to_a1(0, 0) == "A1"
+    assert coord_to_a1(9, 27) == "AB10"
+
+
+@pytest.mark.parametrize(
+    "cell", ["", "!!!", "A", "12", "$", "$$A1", "A$$1", "$1", "@1", "[1", "\u00e91"]
+)
+def test_invalid_cell_reference(cell: str) -> None:
+    with pytest.raises(ValueError, match="Invalid cell reference"):
+        parse_cell_ref(cell)
+
+
+@pytest.mark.parametrize(
+    ("cell_range", "expected"),
+    [("B3", (2, 1, 2, 1)), ("A1:C2", (0, 0, 1, 2)), ("$C$5:A2", (1, 0, 4, 2))],
+)
+def test_range_bounds(cell_range: str, expected: tuple[int, int, int, int]) -> None:
+    assert range_bounds(cell_range) == expected
+
+
+@pytest.mark.parametrize("cell_range", ["A1:B3", "C5:AA5", "XFD1:XFD1048576"])
+def test_format_range_round_trips(cell_range: str) -> None:
+    assert format_range(*range_bounds(cell_range)) == cell_range
@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Any
 
 import pytest
 
-from excelbench.harness.adapters.base import ReadOnlyAdapter, WriteOnlyAdapter
+from excelbench.harness.adapters.base import (
+    ReadOnlyAdapter,
+    WriteOnlyAdapter,
+    _read_only,
+    _write_only,
+)
 from excelbench.models import (
+    BorderEdge,
     BorderInfo,
+    BorderStyle,
     CellFormat,
     CellType,
     CellValue,
     DiagnosticCategory,
+    DiagnosticSeverity,
     LibraryInfo,
+    OpenOptions,
     OperationType,
 )
 
@@ -30,7 +40,7 @@ class ConcreteReadOnly(ReadOnlyAdapter):
             name="test-readonly", version="0.0", language="python", capabilities={"read"}
         )
 
-    def open_workbook(self, path: Path) -> Any:
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
         return None
 
     def close_workbook(self, workbook: Any) -> None:
@@ -308,6 +318,12 @@ class TestAdapterCapabilities:
         assert a.supports_read_path(Path("test.xlsx")) is True
         assert a.supports_read_path(Path("test.csv")) is False
 
+    def test_supports_read_path_accepts_str_and_ignores_case(self) -> None:
+        a = ConcreteReadOnly()
+        assert a.supports_read_path("dir.v2/Report.XLSX") is True
+        assert a.supports_read_path("dir.xlsx/report") is False
+        assert a.supports_read_path(Path(".xlsx")) is False
+
 
 def test_map_error_to_diagnostic() -> None:
     adapter = ConcreteReadOnly()
@@ -318,9 +334,21 @@ def test_map_error_to_diagnostic() -> None:
         test_case_id="t1",
     )
     assert diag.category == DiagnosticCategory.UNSUPPORTED_FEATURE
+    assert diag.severity == DiagnosticSeverity.WARNING
     assert diag.location.feature == "pivot_tables"
 
 
+def test_map_error_to_diagnostic_error_severity() -> None:
+    adapter = ConcreteReadOnly()
+    diag = adapter.map_error_to_diagnostic(
+        exc=ValueError("bad input"),
+        feature="cell_values",
+        operation=OperationType.READ,
+    )
+    assert diag.category == DiagnosticCategory.INVALID_INPUT
+    assert diag.severity == DiagnosticSeverity.ERROR
+
+
 def test_build_mismatch_diagnostic() -> None:
     adapter = ConcreteReadOnly()
     diag = adapter.build_mismatch_diagnostic(
@@ -344,3 +372,301 @@ def test_tier3_defaults_raise_not_implemented() -> None:
         adapter.read_tables(None, "S")
     with pytest.raises(NotImplementedError, match="table writes"):
         adapter.add_table(None, "S", {})
+
+
+def test_write_cells_bulk_default_loops_per_cell() -> None:
+    calls: list[tuple[str, str]] = []
+
+    class Recording(ConcreteWriteOnly):
+        def write_cell_value(self, workbook: Any, sheet: str, cell: str, value: CellValue) -> None:
+            calls.append(("value", cell))
+
+        def write_cell_format(
+            self, workbook: Any, sheet: str, cell: str, format: CellFormat
+        ) -> None:
+            calls.append(("format", cell))
+
+        def write_cell_border(
+            self, workbook: Any, sheet: str, cell: str, border: BorderInfo
+        ) -> None:
+            calls.append(("border", cell))
+
+    Recording().write_cells_bulk(
+        None,
+        "S",
+        ["A1", "B1"],
+        [CellValue(type=CellType.NUMBER, value=1), CellValue(type=CellType.NUMBER, value=2)],
+        formats=[None, CellFormat(bold=True)],
+        borders=[BorderInfo(), None],
+    )
+    assert calls == [("value", "A1"), ("border", "A1"), ("value", "B1"), ("format", "B1")]
+
+
+def test_write_rows_and_column_widths_defaults() -> None:
+    calls: list[tuple[str, str]] = []
+
+    class Recording(ConcreteWriteOnly):
+        def write_cell_value(self, workbook: Any, sheet: str, cell: str, value: CellValue) -> None:
+            calls.append(("value", cell))
+
+        def set_column_width(self, workbook: Any, sheet: str, column: str, width: float) -> None:
+            calls.append(("width", column))
+
+    adapter = Recording()
+    one = CellValue(type=CellType.NUMBER, value=1)
+    adapter.write_rows(None, "S", 1, 2, [[one, one], [one]])
+    adapter.write_column_widths(None, "S", {0: 10.0, 27: 5.0})
+    assert calls == [
+        ("value", "C2"),
+        ("value", "D2"),
+        ("value", "C3"),
+        ("width", "A"),
+        ("width", "AB"),
+    ]
+
+
+def test_write_cells_bulk_rejects_ragged_inputs() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        ConcreteWriteOnly().write_cells_bulk(
+            None, "S", ["A1"], [CellValue(type=CellType.BLANK)], formats=[]
+        )
+
+
+@pytest.mark.parametrize(
+    ("name", "header", "expected"),
+    [
+        ("ok.xlsx", b"PK\x03\x04rest", True),
+        ("ok.XLSM", b"PK\x03\x04", True),
+        ("ok.xls", b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1rest", True),
+        ("bad.xlsx", b"<html>", False),
+        ("bad.xls", b"PK\x03\x04", False),
+        ("empty.xlsx", b"", False),
+        ("data.csv", b"a,b", True),
+    ],
+)
+def test_quick_probe(tmp_path: Path, name: str, header: bytes, expected: bool) -> None:
+    path = tmp_path / name
+    path.write_bytes(header)
+    assert ConcreteReadOnly.quick_probe(path) is expected
+
+
+def test_quick_probe_accepts_str_and_ignores_case(tmp_path: Path) -> None:
+    path = tmp_path / "Report.XLS"
+    path.write_bytes(b"PK\x03\x04")
+    assert ConcreteReadOnly.quick_probe(str(path)) is False
+
+
+def test_quick_probe_missing_file(tmp_path: Path) -> None:
+    assert ConcreteReadOnly().quick_probe(tmp_path / "missing.xlsx") is False
+
+
+def test_pick_read_path_prefers_supported_binary_sibling(tmp_path: Path) -> None:
+    class XlsbReader(ConcreteReadOnly):
+        supported_read_extensions = frozenset({".xlsx", ".xlsb"})
+
+    xlsx = tmp_path / "data.xlsx"
+    xlsx.write_bytes(b"PK\x03\x04")
+    assert XlsbReader().pick_read_path(xlsx) == xlsx
+
+    xlsb = tmp_path / "data.xlsb"
+    xlsb.write_bytes(b"PK\x03\x04")
+    assert XlsbReader().pick_read_path(xlsx) == xlsb
+    # Adapters without XLSB support keep the original input.
+    assert ConcreteReadOnly().pick_read_path(xlsx) == xlsx
+    # Formats ranked after the original are never substituted.
+    assert XlsbReader().pick_read_path(xlsb) == xlsb
+
+
+def test_open_workbook_ctx_closes_on_error(tmp_path: Path) -> None:
+    closed: list[Any] = []
+
+    class Tracking(ConcreteReadOnly):
+        def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
+            return path
+
+        def close_workbook(self, workbook: Any) -> None:
+            closed.append(workbook)
+
+    adapter = Tracking()
+    path = tmp_path / "a.xlsx"
+    with adapter.open_workbook_ctx(path) as wb:
+        assert wb == path
+    assert closed == [path]
+
+    with pytest.raises(RuntimeError):
+        with adapter.open_workbook_ctx(path):
+            raise RuntimeError("boom")
+    assert closed == [path, path]
+
+
+def test_aopen_workbooks_preserves_order_and_closes_on_error(tmp_path: Path) -> None:
+    closed: list[Any] = []
+
+    class Tracking(ConcreteReadOnly):
+        def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> Any:
+            if path.name == "bad.xlsx":
+                raise ValueError("bad")
+            return path.name
+
+        def close_workbook(self, workbook: Any) -> None:
+            closed.append(workbook)
+
+    adapter = Tracking()
+    names = [f"{i}.xlsx" for i in range(6)]
+    handles = asyncio.run(adapter.aopen_workbooks([tmp_path / n for n in names], max_concurrency=2))
+    assert handles == names
+    assert closed == []
+
+    paths = [tmp_path / "a.xlsx", tmp_path / "bad.xlsx", tmp_path / "b.xlsx"]
+    with pytest.raises(ValueError, match="bad"):
+        asyncio.run(adapter.aopen_workbooks(paths))
+    assert sorted(closed) == ["a.xlsx", "b.xlsx"]
+
+
+def test_info_is_built_once_per_class() -> None:
+    calls: list[int] = []
+
+    class Counting(ConcreteReadOnly):
+        __slots__ = ()
+
+        @property
+        def info(self) -> LibraryInfo:
+            calls.append(1)
+            return LibraryInfo(name="counting", version="0", language="python")
+
+    first, second = Counting(), Counting()
+    assert first.info is second.info
+    assert first.name == second.name == "counting"
+    assert len(calls) == 1
+    # The parent class keeps its own, separately cached info.
+    assert ConcreteReadOnly().name == "test-readonly"
+
+
+def test_guard_stubs_are_not_abstract() -> None:
+    write_methods = {"create_workbook", "add_sheet", "write_cell_value", "save_workbook"}
+    read_methods = {"open_workbook", "get_sheet_names", "read_cell_value", "read_comments"}
+    assert not write_methods & ReadOnlyAdapter.__abstractmethods__
+    assert not read_methods & WriteOnlyAdapter.__abstractmethods__
+
+
+def test_guard_stubs_cover_opposite_abstract_surface() -> None:
+    # Each guard base stubs exactly the abstract methods the other leaves open,
+    # so a new abstract read/write method cannot be forgotten in one of them.
+    read_only_stubs = {name for name, attr in vars(ReadOnlyAdapter).items() if attr is _read_only}
+    write_only_stubs = {
+        name for name, attr in vars(WriteOnlyAdapter).items() if attr is _write_only
+    }
+    read_surface = ReadOnlyAdapter.__abstractmethods__ - {"info", "close_workbook"}
+    write_surface = WriteOnlyAdapter.__abstractmethods__ - {"info"}
+    assert read_only_stubs == write_surface
+    assert write_only_stubs == read_surface
+
+
+class XMLParseError(Exception):
+    pass
+
+
+@pytest.mark.parametrize(
+    ("exc", "category"),
+    [
+        (FileNotFoundError("missing"), DiagnosticCategory.FILE_IO),
+        (OSError("File is not a zip file"), DiagnosticCategory.PARSE),
+        (KeyError("Sheet1"), DiagnosticCategory.INVALID_INPUT),
+        (NotImplementedError(), DiagnosticCategory.UNSUPPORTED_FEATURE),
+        (RuntimeError("feature not supported"), DiagnosticCategory.UNSUPPORTED_FEATURE),
+        (XMLParseError("bad token"), DiagnosticCategory.PARSE),
+        (RuntimeError("could not parse"), DiagnosticCategory.PARSE),
+        (RuntimeError("boom"), DiagnosticCategory.INTERNAL),
+    ],
+)
+def test_map_error_to_diagnostic_categories(exc: Exception, category: DiagnosticCategory) -> None:
+    diag = ConcreteReadOnly().map_error_to_diagnostic(
+        exc=exc, feature="cell_values", operation=OperationType.READ
+    )
+    assert diag.category == category
+
+
+def test_mismatch_message_is_rendered_lazily() -> None:
+    renders: list[int] = []
+
+    class Payload:
+        def __repr__(self) -> str:
+            renders.append(1)
+            return "<payload>"
+
+    diag = ConcreteReadOnly().build_mismatch_diagnostic(
+        feature="cell_values",
+        operation=OperationType.READ,
+        test_case_id="t1",
+        expected={"value": Payload()},
+        actual={"value": None},
+    )
+    assert renders == []
+    assert "<payload>" in str(diag.adapter_message)
+    assert diag.adapter_message == str(diag.adapter_message)
+    str(diag.adapter_message)
+    assert renders == [1]
+
+
+def test_diagnostics_are_slotted() -> None:
+    diag = ConcreteReadOnly().map_error_to_diagnostic(
+        exc=ValueError("bad"), feature="cell_values", operation=OperationType.READ
+    )
+    assert not hasattr(diag, "__dict__")
+    assert not hasattr(diag.location, "__dict__")
+    # Adapters still annotate diagnostics after construction.
+    diag.probable_cause = "bad input"
+    assert diag.probable_cause == "bad input"
+
+
+def test_per_cell_models_are_slotted() -> None:
+    edge = BorderEdge(style=BorderStyle.THIN)
+    for obj in (CellValue(type=CellType.BLANK), CellFormat(), BorderInfo(top=edge), edge):
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+
+def test_bind_readers_returns_bound_methods() -> None:
+    adapter = ConcreteReadOnly()
+    read_value, read_format, read_border = adapter.bind_readers()
+    assert read_value(None, "S", "A1") == CellValue(type=CellType.BLANK)
+    assert read_format(None, "S", "A1") == CellFormat()
+    assert read_border(None, "S", "A1") == BorderInfo()
+
+
+def test_bind_writers_returns_bound_methods() -> None:
+    adapter = ConcreteReadOnly()
+    write_value, write_format, write_border = adapter.bind_writers()
+    with pytest.raises(NotImplementedError, match="read-only"):
+        write_value(None, "S", "A1", CellValue(type=CellType.BLANK))
+    assert write_format.__self__ is adapter  # type: ignore[attr-defined]
+    assert write_border.__func__ is _read_only  # type: ignore[attr-defined]
+
+
+def test_read_range_defaults_fall_back_per_cell() -> None:
+    adapter = ConcreteReadOnly()
+    values = adapter.read_range_values(None, "S", "B2:C3")
+    formats = adapter.read_range_formats(None, "S", "B2:C3")
+    assert values == [[CellValue(type=CellType.BLANK)] * 2] * 2
+    assert formats == [[CellFormat()] * 2] * 2
+
+
+def test_integer_coordinate_defaults_use_a1_methods() -> None:
+    calls: list[str] = []
+
+    class Recording(ConcreteReadOnly):
+        def read_cell_value(self, workbook: Any, sheet: str, cell: str) -> CellValue:
+            calls.append(cell)
+            return CellValue(type=CellType.BLANK)
+
+    adapter = Recording()
+    adapter.read_cell_value_rc(None, "S", 9, 27)
+    assert calls == ["AB10"]
+    assert adapter.read_cell_format_rc(None, "S", 0, 0) == CellFormat()
+    assert adapter.read_cell_border_rc(None, "S", 0, 0) == BorderInfo()
+    with pytest.raises(NotImplementedError):
+        adapter.write_cell_value_rc(None, "S", 0, 0, CellValue(type=CellType.BLANK))
+
+
+def test_read_used_range_requires_bulk_reader() -> None:
+    with pytest.raises(NotImplementedError, match="bulk reads"):
+        ConcreteReadOnly().read_used_range(None, "S")
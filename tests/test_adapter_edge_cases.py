@@ -27,6 +27,7 @@ from excelbench.models import (
     BorderInfo,
     CellType,
     CellValue,
+    OpenOptions,
 )
 
 JSONDict = dict[str, Any]
@@ -118,6 +119,19 @@ class TestOpenpyxlHyperlinkEdgeCases:
         assert links[0]["tooltip"] == "Click me!"
         opxl.close_workbook(wb2)
 
+    def test_sparse_links_and_comments_in_row_order(self, opxl: OpenpyxlAdapter) -> None:
+        """Only stored cells are scanned; results stay row-major."""
+        wb = opxl.create_workbook()
+        opxl.add_sheet(wb, "S1")
+        for cell in ("C500", "A2", "B2"):
+            opxl.add_hyperlink(wb, "S1", {"cell": cell, "target": "https://example.com"})
+            opxl.add_comment(wb, "S1", {"cell": cell, "text": cell, "author": "t"})
+        n_cells = len(wb["S1"]._cells)
+
+        assert [h["cell"] for h in opxl.read_hyperlinks(wb, "S1")] == ["A2", "B2", "C500"]
+        assert [c["text"] for c in opxl.read_comments(wb, "S1")] == ["A2", "B2", "C500"]
+        assert len(wb["S1"]._cells) == n_cells
+
     def test_internal_hyperlink(self, opxl: OpenpyxlAdapter, tmp_path: Path) -> None:
         """Internal hyperlink (to another sheet) should be marked internal."""
         path = tmp_path / "link_internal.xlsx"
@@ -261,6 +275,47 @@ class TestOpenpyxlImageEdgeCases:
 
 
 class TestOpenpyxlCellValueEdgeCases:
+    def test_reading_absent_cells_does_not_create_them(self, opxl: OpenpyxlAdapter) -> None:
+        wb = opxl.create_workbook()
+        opxl.add_sheet(wb, "S1")
+        opxl.write_cell_value(wb, "S1", "B2", CellValue(type=CellType.NUMBER, value=5))
+        ws = wb["S1"]
+        assert opxl.read_cell_value(wb, "S1", "b2").value == 5
+        assert opxl.read_cell_value_rc(wb, "S1", 1, 1).value == 5
+        assert opxl.read_cell_value(wb, "S1", "Z99").type == CellType.BLANK
+        assert opxl.read_cell_value_rc(wb, "S1", 50, 50).type == CellType.BLANK
+        assert list(ws._cells) == [(2, 2)]
+
+    def test_read_cell_value_accepts_absolute_refs(self, opxl: OpenpyxlAdapter) -> None:
+        wb = opxl.create_workbook()
+        opxl.add_sheet(wb, "S1")
+        opxl.write_cell_value(wb, "S1", "B2", CellValue(type=CellType.NUMBER, value=5))
+        assert opxl.read_cell_value(wb, "S1", "$B$2").value == 5
+        assert opxl.read_cell_value(wb, "S1", "$C$3").type == CellType.BLANK
+
+    def test_sheet_lookup_follows_renames(self, opxl: OpenpyxlAdapter) -> None:
+        """The memoized sheet lookup must not serve a renamed sheet."""
+        wb = opxl.create_workbook()
+        opxl.add_sheet(wb, "S1")
+        opxl.write_cell_value(wb, "S1", "A1", CellValue(type=CellType.NUMBER, value=1))
+        assert opxl.read_cell_value(wb, "S1", "A1").value == 1
+
+        wb["S1"].title = "Renamed"
+        opxl.add_sheet(wb, "S1")
+        assert opxl.read_cell_value(wb, "S1", "A1").type == CellType.BLANK
+        assert opxl.read_cell_value(wb, "Renamed", "A1").value == 1
+
+    def test_sheet_lookup_follows_remove_and_recreate(self, opxl: OpenpyxlAdapter) -> None:
+        """A sheet removed and re-created under the same title is not served stale."""
+        wb = opxl.create_workbook()
+        opxl.add_sheet(wb, "S1")
+        opxl.write_cell_value(wb, "S1", "A1", CellValue(type=CellType.NUMBER, value=1))
+        wb.remove(wb["S1"])
+        opxl.add_sheet(wb, "S1")
+        opxl.write_cell_value(wb, "S1", "B1", CellValue(type=CellType.NUMBER, value=2))
+        assert wb["S1"]["B1"].value == 2
+        assert opxl.read_cell_value(wb, "S1", "A1").type == CellType.BLANK
+
     def test_error_string_na(self, opxl: OpenpyxlAdapter, tmp_path: Path) -> None:
         """Cell with string '#N/A' should be detected as error (line 124)."""
         path = tmp_path / "err_str.xlsx"
@@ -652,6 +707,25 @@ class TestXlrdErrorCells:
         assert _color_to_hex(book, 0x7FFF) is None  # No fill
         assert _color_to_hex(book, 64) is None  # System default
 
+    def test_getting_data_text_is_error(
+        self, xlwt_adapter: Any, xlrd_adapter: Any, tmp_path: Path
+    ) -> None:
+        """A text cell holding '#GETTING_DATA' is classified as an error."""
+        path = tmp_path / "getting_data.xls"
+        wb = xlwt_adapter.create_workbook()
+        xlwt_adapter.add_sheet(wb, "S1")
+        xlwt_adapter.write_cell_value(
+            wb, "S1", "A1", CellValue(type=CellType.STRING, value="#GETTING_DATA")
+        )
+        xlwt_adapter.save_workbook(wb, path)
+
+        rb = xlrd_adapter.open_workbook(path)
+        try:
+            v = xlrd_adapter.read_cell_value(rb, "S1", "A1")
+        finally:
+            xlrd_adapter.close_workbook(rb)
+        assert v == CellValue(type=CellType.ERROR, value="#GETTING_DATA")
+
 
 class TestXlrdRowColumnEdgeCases:
     @pytest.fixture
@@ -700,6 +774,30 @@ class TestXlrdRowColumnEdgeCases:
         xlrd_adapter.close_workbook(rb)
 
 
+# ═════════════════════════════════════════════════
+# PyumyaAdapter — Error strings
+# ═════════════════════════════════════════════════
+
+
+class TestPyumyaErrorStrings:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("#GETTING_DATA", CellType.ERROR),
+            ("#N/A", CellType.ERROR),
+            ("#DIV/0!", CellType.ERROR),
+            ("#hashtag", CellType.STRING),
+        ],
+    )
+    def test_error_strings(self, raw: str, expected: CellType) -> None:
+        pytest.importorskip("pyumya")
+        from excelbench.harness.adapters.pyumya_adapter import PyumyaAdapter
+
+        wb = MagicMock()
+        wb.__getitem__.return_value.__getitem__.return_value.value = raw
+        assert PyumyaAdapter().read_cell_value(wb, "S1", "A1").type == expected
+
+
 # ═════════════════════════════════════════════════
 # PylightxlAdapter — Edge Cases
 # ═════════════════════════════════════════════════
@@ -1195,3 +1293,212 @@ class TestRustPayloadConversion:
         cv = cell_value_from_payload({"type": "unknown", "value": None})
         assert cv.type == CellType.STRING
         assert cv.value is None
+
+
+class TestReadUsedRange:
+    @pytest.fixture
+    def offset_xlsx(self, tmp_path: Path) -> Path:
+        wb = _openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "S"
+        ws["C3"] = 1
+        ws["D5"] = "x"
+        wb.create_sheet("Empty")
+        path = tmp_path / "offset.xlsx"
+        wb.save(path)
+        return path
+
+    @pytest.mark.parametrize("name", ["openpyxl", "calamine"])
+    def test_used_range_bounds(self, name: str, offset_xlsx: Path) -> None:
+        adapter: Any
+        if name == "calamine":
+            if not HAS_CALAMINE:
+                pytest.skip("python-calamine not installed")
+            from excelbench.harness.adapters.calamine_adapter import CalamineAdapter
+
+            adapter = CalamineAdapter()
+        else:
+            adapter = OpenpyxlAdapter()
+        wb = adapter.open_workbook(offset_xlsx)
+        try:
+            rows, bounds = adapter.read_used_range(wb, "S")
+            empty = adapter.read_used_range(wb, "Empty")
+        finally:
+            adapter.close_workbook(wb)
+        assert bounds == (2, 2, 4, 3)
+        assert rows[0][0] == CellValue(type=CellType.NUMBER, value=1)
+        assert rows[2][1] == CellValue(type=CellType.STRING, value="x")
+        assert rows[1][0].type == CellType.BLANK
+        assert empty == ([], (0, 0, -1, -1))
+
+    @pytest.mark.parametrize("read_only", [False, True])
+    def test_openpyxl_single_cell_range(self, offset_xlsx: Path, read_only: bool) -> None:
+        adapter = OpenpyxlAdapter()
+        wb = adapter.open_workbook(offset_xlsx, OpenOptions(read_only=read_only))
+        try:
+            single = adapter.read_range_values(wb, "S", "C3")
+            absolute = adapter.read_range_values(wb, "S", "$C$3")
+            raw = adapter.read_sheet_values_raw(wb, "S", "C3")
+            soa = adapter.read_sheet_cells_soa(wb, "S", "C3")
+        finally:
+            adapter.close_workbook(wb)
+        assert single == absolute == [[CellValue(type=CellType.NUMBER, value=1)]]
+        assert [[c.value for c in row] for row in raw] == [[1]]
+        assert (soa["row"].tolist(), soa["col"].tolist()) == ([2], [2])
+
+    @pytest.mark.parametrize("name", ["openpyxl", "calamine"])
+    def test_read_all_sheets(self, name: str, offset_xlsx: Path) -> None:
+        adapter: Any
+        if name == "calamine":
+            if not HAS_CALAMINE:
+                pytest.skip("python-calamine not installed")
+            from excelbench.harness.adapters.calamine_adapter import CalamineAdapter
+
+            adapter = CalamineAdapter()
+        else:
+            adapter = OpenpyxlAdapter()
+        wb = adapter.open_workbook(offset_xlsx)
+        try:
+            sheets = adapter.read_all_sheets(wb)
+            expected = {s: adapter.read_used_range(wb, s) for s in ("S", "Empty")}
+        finally:
+            adapter.close_workbook(wb)
+        assert list(sheets) == ["S", "Empty"]
+        assert sheets == expected
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_read_sheets_in_processes(self, offset_xlsx: Path, max_workers: int) -> None:
+        adapter = OpenpyxlAdapter()
+        wb = adapter.open_workbook(offset_xlsx)
+        try:
+            expected = adapter.read_all_sheets(wb)
+        finally:
+            adapter.close_workbook(wb)
+        sheets = adapter.read_sheets_in_processes(offset_xlsx, max_workers=max_workers)
+        assert list(sheets) == ["S", "Empty"]
+        assert sheets == expected
+        merged = adapter.read_sheets_in_processes(
+            offset_xlsx, "read_merged_ranges", max_workers=max_workers
+        )
+        assert merged == {"S": [], "Empty": []}
+
+    def test_openpyxl_read_only_matches_full_load(self, offset_xlsx: Path) -> None:
+        adapter = OpenpyxlAdapter()
+        results = []
+        for read_only in (False, True):
+            wb = adapter.open_workbook(offset_xlsx, OpenOptions(read_only=read_only))
+            try:
+                results.append(
+                    (
+                        adapter.read_all_sheets(wb),
+                        adapter.read_sheet_values(wb, "S", "C3:D5"),
+                    )
+                )
+            finally:
+                adapter.close_workbook(wb)
+        assert results[0] == results[1]
+
+
+# ═════════════════════════════════════════════════
+# Sparse read_cells
+# ═════════════════════════════════════════════════
+
+
+class TestReadCells:
+    @pytest.fixture
+    def sparse_xlsx(self, tmp_path: Path) -> Path:
+        wb = _openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "S"
+        ws["C3"] = 1
+        ws["D5"] = "x"
+        ws["B7"] = True
+        path = tmp_path / "sparse.xlsx"
+        wb.save(path)
+        return path
+
+    @pytest.mark.parametrize("name", ["openpyxl", "openpyxl-readonly", "calamine"])
+    def test_read_cells_matches_input_order(self, name: str, sparse_xlsx: Path) -> None:
+        adapter: Any
+        if name == "calamine":
+            if not HAS_CALAMINE:
+                pytest.skip("python-calamine not installed")
+            from excelbench.harness.adapters.calamine_adapter import CalamineAdapter
+
+            adapter = CalamineAdapter()
+        elif name == "openpyxl-readonly":
+            from excelbench.harness.adapters.openpyxl_readonly_adapter import (
+                OpenpyxlReadonlyAdapter,
+            )
+
+            adapter = OpenpyxlReadonlyAdapter()
+        else:
+            adapter = OpenpyxlAdapter()
+        coords = [(6, 1), (2, 2), (0, 0), (4, 3), (3, 3), (20, 20), (2, 2)]
+        wb = adapter.open_workbook(sparse_xlsx)
+        try:
+            values = adapter.read_cells(wb, "S", coords)
+            assert adapter.read_cells(wb, "S", []) == []
+        finally:
+            adapter.close_workbook(wb)
+        blank = CellValue(type=CellType.BLANK)
+        number = CellValue(type=CellType.NUMBER, value=1)
+        assert values == [
+            CellValue(type=CellType.BOOLEAN, value=True),
+            number,
+            blank,
+            CellValue(type=CellType.STRING, value="x"),
+            blank,
+            blank,
+            number,
+        ]
+
+    def test_calamine_range_read_pads_past_used_range(self, sparse_xlsx: Path) -> None:
+        if not HAS_CALAMINE:
+            pytest.skip("python-calamine not installed")
+        from excelbench.harness.adapters.calamine_adapter import CalamineAdapter
+
+        adapter = CalamineAdapter()
+        wb = adapter.open_workbook(sparse_xlsx)
+        try:
+            raw = adapter.read_sheet_values_raw(wb, "S", "B1:D9")
+        finally:
+            adapter.close_workbook(wb)
+        assert len(raw) == 9
+        assert all(len(row) == 3 for row in raw)
+        # The used range starts at B3; rows above it are padded, not shifted.
+        assert raw[0] == raw[1] == [None, None, None]
+        assert raw[2][1] == 1.0
+        assert raw[4][2] == "x"
+        assert raw[6][0] is True
+        assert raw[-1] == [None, None, None]
+
+    def test_calamine_range_read_honours_sheet_start(self, tmp_path: Path) -> None:
+        if not HAS_CALAMINE:
+            pytest.skip("python-calamine not installed")
+        from excelbench.harness.adapters.calamine_adapter import CalamineAdapter
+
+        wb = _openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "S"
+        ws["B2"] = 1
+        ws["C3"] = "x"
+        path = tmp_path / "offset.xlsx"
+        wb.save(path)
+
+        adapter = CalamineAdapter()
+        book = adapter.open_workbook(path)
+        try:
+            grid = adapter.read_sheet_values(book, "S", "B2:C3")
+            wide = adapter.read_sheet_values(book, "S", "A1:D4")
+            cells = adapter.read_cells(book, "S", [(1, 1), (1, 2), (2, 1), (2, 2)])
+        finally:
+            adapter.close_workbook(book)
+        blank = CellValue(type=CellType.BLANK)
+        assert grid == [
+            [CellValue(type=CellType.NUMBER, value=1), blank],
+            [blank, CellValue(type=CellType.STRING, value="x")],
+        ]
+        assert [v for row in grid for v in row] == cells
+        assert [row[1:3] for row in wide[1:3]] == grid
+        assert wide[0] == wide[3] == [blank] * 4
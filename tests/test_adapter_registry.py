@@ -74,6 +74,27 @@ class TestAdapterExtensions:
         a = OpenpyxlAdapter()
         assert not a.supports_read_path(Path("test.csv"))
 
+    def test_read_extensions_are_class_level_frozensets(self) -> None:
+        for adapter in get_all_adapters():
+            exts = adapter.supported_read_extensions
+            assert isinstance(exts, frozenset)
+            assert exts is type(adapter).supported_read_extensions
+            assert all(ext == ext.lower() and ext.startswith(".") for ext in exts)
+
+    def test_suffix_is_computed_once_per_path(self) -> None:
+        from excelbench.harness.adapters.base import _suffix_of
+
+        path = Path("suite/tier1/suffix_probe_unique.XLSX")
+        before = _suffix_of.cache_info().misses
+        for adapter in get_all_adapters():
+            adapter.supports_read_path(path)
+            adapter.supports_read_path(path)
+        assert _suffix_of.cache_info().misses == before + 1
+
+    def test_adapters_are_slotted(self) -> None:
+        for adapter in get_all_adapters():
+            assert not hasattr(adapter, "__dict__"), type(adapter).__name__
+
     def test_output_extensions(self) -> None:
         for adapter in get_all_adapters():
             ext = adapter.output_extension
@@ -98,3 +119,22 @@ class TestAllExports:
             # Base classes always in __all__; optional adapters only if import succeeded
             if cls_name in ("OpenpyxlAdapter",):
                 assert cls_name in adapters.__all__
+
+    def test_single_base_class_object(self) -> None:
+        """All adapters must share one ExcelAdapter class object (no duplicate base module)."""
+        import sys
+
+        import excelbench.harness.adapters.base as base_module
+
+        assert sys.modules["excelbench.harness.adapters.base"] is base_module
+        assert ExcelAdapter is base_module.ExcelAdapter
+        assert ReadOnlyAdapter is base_module.ReadOnlyAdapter
+        assert WriteOnlyAdapter is base_module.WriteOnlyAdapter
+        base_modules = {
+            name
+            for name, mod in sys.modules.items()
+            if mod is not None and getattr(mod, "ExcelAdapter", ExcelAdapter) is not ExcelAdapter
+        }
+        assert not base_modules
+        for adapter in get_all_adapters():
+            assert ExcelAdapter in type(adapter).__mro__
@@ -9,9 +9,11 @@ Targets uncovered branches in:
 
 from __future__ import annotations
 
+import zipfile
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -329,6 +331,33 @@ class TestXlsxwriterCreateFormatBorder:
 
 
 class TestXlsxwriterSaveCellTypes:
+    def test_registered_shared_strings_come_first(
+        self, xlsxw: XlsxwriterAdapter, opxl: OpenpyxlAdapter, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "sst.xlsx"
+        wb = xlsxw.create_workbook()
+        xlsxw.register_shared_strings(wb, ["beta", "alpha", "beta"])
+        for sheet, text in (("S1", "alpha"), ("S2", "beta"), ("S3", "alpha")):
+            xlsxw.add_sheet(wb, sheet)
+            xlsxw.write_cell_value(wb, sheet, "A1", CellValue(type=CellType.STRING, value=text))
+        xlsxw.save_workbook(wb, path)
+
+        with zipfile.ZipFile(path) as zf:
+            sst = zf.read("xl/sharedStrings.xml").decode()
+        assert 'count="3" uniqueCount="2"' in sst
+        assert sst.index("beta") < sst.index("alpha")
+        rb = opxl.open_workbook(path)
+        assert opxl.read_cell_value(rb, "S3", "A1").value == "alpha"
+        assert opxl.read_cell_value(rb, "S2", "A1").value == "beta"
+        opxl.close_workbook(rb)
+
+    def test_shared_string_seeding_skips_unknown_table_layout(
+        self, xlsxw: XlsxwriterAdapter
+    ) -> None:
+        wb = MagicMock(spec=["str_table"])
+        wb.str_table = object()  # no string_table / unique_count attributes
+        xlsxw._seed_shared_strings(wb, {"shared_strings": {"alpha": None}})
+
     def test_boolean_value(
         self, xlsxw: XlsxwriterAdapter, opxl: OpenpyxlAdapter, tmp_path: Path
     ) -> None:
@@ -475,6 +504,83 @@ class TestXlsxwriterSaveCellTypes:
         assert fmt.bold is True
         opxl.close_workbook(wb2)
 
+    def test_write_cells_bulk(
+        self, xlsxw: XlsxwriterAdapter, opxl: OpenpyxlAdapter, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "bulk.xlsx"
+        wb = xlsxw.create_workbook()
+        xlsxw.add_sheet(wb, "S1")
+        xlsxw.write_cells_bulk(
+            wb,
+            "S1",
+            ["A1", "A2"],
+            [
+                CellValue(type=CellType.STRING, value="x"),
+                CellValue(type=CellType.DATE, value=date(2024, 1, 1)),
+            ],
+            formats=[CellFormat(bold=True), CellFormat(number_format="yyyy-mm-dd")],
+            borders=[BorderInfo(top=BorderEdge(style=BorderStyle.THIN)), None],
+        )
+        xlsxw.save_workbook(wb, path)
+
+        wb2 = opxl.open_workbook(path)
+        assert opxl.read_cell_value(wb2, "S1", "A1").value == "x"
+        assert opxl.read_cell_format(wb2, "S1", "A1").bold is True
+        border = opxl.read_cell_border(wb2, "S1", "A1")
+        assert border.top is not None and border.top.style == BorderStyle.THIN
+        assert opxl.read_cell_value(wb2, "S1", "A2").type == CellType.DATE
+        opxl.close_workbook(wb2)
+
+    def test_integer_coordinate_roundtrip(
+        self, xlsxw: XlsxwriterAdapter, opxl: OpenpyxlAdapter, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "rc.xlsx"
+        wb = xlsxw.create_workbook()
+        xlsxw.add_sheet(wb, "S1")
+        xlsxw.write_cell_value_rc(wb, "S1", 2, 1, CellValue(type=CellType.NUMBER, value=7))
+        xlsxw.save_workbook(wb, path)
+
+        wb2 = opxl.open_workbook(path)
+        assert opxl.read_cell_value_rc(wb2, "S1", 2, 1) == opxl.read_cell_value(wb2, "S1", "B3")
+        assert opxl.read_cell_value(wb2, "S1", "B3").value == 7
+        assert opxl.read_cell_format_rc(wb2, "S1", 2, 1) == opxl.read_cell_format(wb2, "S1", "B3")
+        assert opxl.read_cell_border_rc(wb2, "S1", 2, 1) == opxl.read_cell_border(wb2, "S1", "B3")
+        opxl.close_workbook(wb2)
+
+    def test_write_rows_and_column_widths(
+        self, xlsxw: XlsxwriterAdapter, opxl: OpenpyxlAdapter, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "rows.xlsx"
+        wb = xlsxw.create_workbook()
+        xlsxw.add_sheet(wb, "S1")
+        xlsxw.write_rows(
+            wb,
+            "S1",
+            1,
+            1,
+            [
+                [
+                    CellValue(type=CellType.STRING, value="a"),
+                    CellValue(type=CellType.NUMBER, value=2),
+                ],
+                [CellValue(type=CellType.DATE, value=date(2024, 1, 1))],
+            ],
+        )
+        xlsxw.write_column_widths(wb, "S1", {1: 20.0})
+        xlsxw.save_workbook(wb, path)
+
+        wb2 = opxl.open_workbook(path)
+        assert opxl.read_cell_value(wb2, "S1", "B2").value == "a"
+        assert opxl.read_cell_value(wb2, "S1", "C2").value == 2
+        assert opxl.read_cell_value(wb2, "S1", "B3").type == CellType.DATE
+        assert opxl.read_column_width(wb2, "S1", "B") == pytest.approx(20.0, abs=1)
+        opxl.close_workbook(wb2)
+
+    def test_write_cells_bulk_length_mismatch(self, xlsxw: XlsxwriterAdapter) -> None:
+        wb = xlsxw.create_workbook()
+        with pytest.raises(ValueError, match="same length"):
+            xlsxw.write_cells_bulk(wb, "S1", ["A1", "A2"], [CellValue(type=CellType.BLANK)])
+
 
 # ═════════════════════════════════════════════════
 # XlsxWriter: save_workbook() — split panes
@@ -12,7 +12,7 @@ Targets:
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime
 from pathlib import Path
 from types import ModuleType
 from typing import Any, cast
@@ -36,7 +36,9 @@ from excelbench.harness.adapters.pyexcel_adapter import (
 )
 from excelbench.harness.adapters.xlsxwriter_adapter import XlsxwriterAdapter
 from excelbench.models import (
+    BorderEdge,
     BorderInfo,
+    BorderStyle,
     CellFormat,
     CellType,
     CellValue,
@@ -946,12 +948,27 @@ class TestCalamineVersion:
         """Lines 28-29: _get_version exception → 'unknown'."""
         from excelbench.harness.adapters.calamine_adapter import _get_version
 
-        with patch(
-            "importlib.metadata.version",
-            side_effect=Exception("no metadata"),
-        ):
-            result = _get_version()
-            assert result == "unknown"
+        _get_version.cache_clear()
+        try:
+            with patch(
+                "importlib.metadata.version",
+                side_effect=Exception("no metadata"),
+            ):
+                result = _get_version()
+                assert result == "unknown"
+                assert _get_version() == "unknown"
+        finally:
+            _get_version.cache_clear()
+
+    def test_version_lookup_is_memoized(self) -> None:
+        from excelbench.harness.adapters.calamine_adapter import _get_version
+
+        _get_version.cache_clear()
+        with patch("importlib.metadata.version", return_value="9.9") as lookup:
+            assert _get_version() == "9.9"
+            assert _get_version() == "9.9"
+        _get_version.cache_clear()
+        assert lookup.call_count == 1
 
 
 class TestPyexcelVersion:
@@ -961,12 +978,16 @@ class TestPyexcelVersion:
         """Lines 28-29: _get_version exception → 'unknown'."""
         from excelbench.harness.adapters.pyexcel_adapter import _get_version
 
-        with patch(
-            "importlib.metadata.version",
-            side_effect=Exception("no metadata"),
-        ):
-            result = _get_version()
-            assert result == "unknown"
+        _get_version.cache_clear()
+        try:
+            with patch(
+                "importlib.metadata.version",
+                side_effect=Exception("no metadata"),
+            ):
+                result = _get_version()
+                assert result == "unknown"
+        finally:
+            _get_version.cache_clear()
 
 
 # ═════════════════════════════════════════════════
@@ -1335,6 +1356,7 @@ class TestCalamineMockedCellTypes:
         mock_wb = MagicMock()
         mock_sheet = MagicMock()
         mock_sheet.to_python.return_value = [[None]]
+        mock_sheet.start = (0, 0)
         mock_wb.get_sheet_by_name.return_value = mock_sheet
         v = calamine.read_cell_value(mock_wb, "S1", "A1")
         assert v.type == CellType.BLANK
@@ -1346,11 +1368,23 @@ class TestCalamineMockedCellTypes:
         mock_wb = MagicMock()
         mock_sheet = MagicMock()
         mock_sheet.to_python.return_value = [[dt(2024, 3, 15, 0, 0, 0)]]
+        mock_sheet.start = (0, 0)
         mock_wb.get_sheet_by_name.return_value = mock_sheet
         v = calamine.read_cell_value(mock_wb, "S1", "A1")
         assert v.type == CellType.DATE
         assert v.value == date(2024, 3, 15)
 
+    def test_datetime_with_microseconds_is_not_midnight(self, calamine: CalamineAdapter) -> None:
+        from datetime import datetime as dt
+
+        mock_wb = MagicMock()
+        mock_wb.get_sheet_by_name.return_value.start = (0, 0)
+        mock_wb.get_sheet_by_name.return_value.to_python.return_value = [
+            [dt(2024, 3, 15, 0, 0, 0, 1)]
+        ]
+        v = calamine.read_cell_value(mock_wb, "S1", "A1")
+        assert v.type == CellType.DATETIME
+
     def test_time_value(self, calamine: CalamineAdapter) -> None:
         """Line 130: time object → DATETIME."""
         from datetime import time as t
@@ -1358,15 +1392,36 @@ class TestCalamineMockedCellTypes:
         mock_wb = MagicMock()
         mock_sheet = MagicMock()
         mock_sheet.to_python.return_value = [[t(14, 30, 0)]]
+        mock_sheet.start = (0, 0)
         mock_wb.get_sheet_by_name.return_value = mock_sheet
         v = calamine.read_cell_value(mock_wb, "S1", "A1")
         assert v.type == CellType.DATETIME
+        assert v.value.date() == date.today()
+        assert v.value.time() == t(14, 30, 0)
+
+    def test_time_values_share_one_date_per_pass(self, calamine: CalamineAdapter) -> None:
+        """A bulk read anchors every time cell on the date read at its start."""
+        from datetime import time as t
+
+        mock_wb = MagicMock()
+        mock_sheet = MagicMock()
+        mock_sheet.to_python.return_value = [[t(9, 0), t(17, 30)], [t(23, 59), None]]
+        mock_sheet.start = (0, 0)
+        mock_wb.get_sheet_by_name.return_value = mock_sheet
+        grid = calamine.read_sheet_values(mock_wb, "S1")
+        dates = {cv.value.date() for row in grid for cv in row if cv.type == CellType.DATETIME}
+        assert len(dates) == 1
+        block = calamine.read_sheet_cells_soa(mock_wb, "S1")
+        assert len({stamp[:10] for stamp in block["str"][:3]}) == 1
+        cells = calamine.read_cells(mock_wb, "S1", [(0, 0), (0, 1)])
+        assert cells[0].value.date() == cells[1].value.date()
 
     def test_error_string_na(self, calamine: CalamineAdapter) -> None:
         """Line 135: #N/A error string."""
         mock_wb = MagicMock()
         mock_sheet = MagicMock()
         mock_sheet.to_python.return_value = [["#N/A"]]
+        mock_sheet.start = (0, 0)
         mock_wb.get_sheet_by_name.return_value = mock_sheet
         v = calamine.read_cell_value(mock_wb, "S1", "A1")
         assert v.type == CellType.ERROR
@@ -1377,16 +1432,29 @@ class TestCalamineMockedCellTypes:
         mock_wb = MagicMock()
         mock_sheet = MagicMock()
         mock_sheet.to_python.return_value = [["#VALUE!"]]
+        mock_sheet.start = (0, 0)
         mock_wb.get_sheet_by_name.return_value = mock_sheet
         v = calamine.read_cell_value(mock_wb, "S1", "A1")
         assert v.type == CellType.ERROR
         assert v.value == "#VALUE!"
 
+    def test_error_literals_without_bang(self, calamine: CalamineAdapter) -> None:
+        """#NAME? and #GETTING_DATA are errors; other '#' text stays a string."""
+        mock_wb = MagicMock()
+        mock_wb.get_sheet_by_name.return_value.start = (0, 0)
+        mock_wb.get_sheet_by_name.return_value.to_python.return_value = [
+            ["#NAME?", "#GETTING_DATA", "#hashtag", "#"]
+        ]
+        refs = ("A1", "B1", "C1", "D1")
+        got = [calamine.read_cell_value(mock_wb, "S1", ref).type for ref in refs]
+        assert got == [CellType.ERROR, CellType.ERROR, CellType.STRING, CellType.STRING]
+
     def test_formula_string(self, calamine: CalamineAdapter) -> None:
         """Line 142: string starting with '='."""
         mock_wb = MagicMock()
         mock_sheet = MagicMock()
         mock_sheet.to_python.return_value = [["=SUM(1,2)"]]
+        mock_sheet.start = (0, 0)
         mock_wb.get_sheet_by_name.return_value = mock_sheet
         v = calamine.read_cell_value(mock_wb, "S1", "A1")
         assert v.type == CellType.FORMULA
@@ -1397,11 +1465,130 @@ class TestCalamineMockedCellTypes:
         mock_wb = MagicMock()
         mock_sheet = MagicMock()
         mock_sheet.to_python.return_value = [[complex(1, 2)]]
+        mock_sheet.start = (0, 0)
         mock_wb.get_sheet_by_name.return_value = mock_sheet
         v = calamine.read_cell_value(mock_wb, "S1", "A1")
         assert v.type == CellType.STRING
         assert "(1+2j)" in str(v.value)
 
+    def test_builtin_subclasses_use_isinstance_fallback(self, calamine: CalamineAdapter) -> None:
+        """Values whose exact type is not in the dispatch table still classify."""
+        from datetime import datetime as dt
+
+        class Num(int):
+            pass
+
+        class Text(str):
+            pass
+
+        class Stamp(dt):
+            pass
+
+        mock_wb = MagicMock()
+        mock_wb.get_sheet_by_name.return_value.start = (0, 0)
+        mock_wb.get_sheet_by_name.return_value.to_python.return_value = [
+            [Num(3), Text("#DIV/0!"), Text(""), Stamp(2024, 1, 2)]
+        ]
+        got = [calamine.read_cell_value(mock_wb, "S1", ref) for ref in ("A1", "B1", "C1", "D1")]
+        assert [v.type for v in got] == [
+            CellType.NUMBER,
+            CellType.ERROR,
+            CellType.BLANK,
+            CellType.DATE,
+        ]
+
+    def test_bulk_read_matches_per_cell(self, calamine: CalamineAdapter) -> None:
+        """The batched grid conversion agrees with read_cell_value()."""
+        from datetime import datetime as dt
+
+        grid = [[None, 1, 2.5, True], ["", "x", "#REF!", dt(2024, 1, 2, 3, 4)]]
+        mock_wb = MagicMock()
+        mock_wb.get_sheet_by_name.return_value.start = (0, 0)
+        mock_wb.get_sheet_by_name.return_value.to_python.return_value = grid
+        bulk = calamine.read_sheet_values(mock_wb, "S1")
+        per_cell = [
+            [calamine.read_cell_value(mock_wb, "S1", f"{col}{row}") for col in "ABCD"]
+            for row in (1, 2)
+        ]
+        assert bulk == per_cell
+
+    def test_range_reads_slice_one_conversion(self, calamine: CalamineAdapter) -> None:
+        """read_range_values reuses the cached grid for every range."""
+        mock_wb = MagicMock()
+        mock_sheet = MagicMock()
+        mock_sheet.to_python.return_value = [[1, 2, 3], [4, 5, 6]]
+        mock_sheet.start = (0, 0)
+        mock_wb.get_sheet_by_name.return_value = mock_sheet
+        top = calamine.read_range_values(mock_wb, "S1", "B1:C1")
+        tail = calamine.read_range_values(mock_wb, "S1", "C2:D3")
+        assert [[v.value for v in row] for row in top] == [[2, 3]]
+        assert [[v.type for v in row] for row in tail] == [
+            [CellType.NUMBER, CellType.BLANK],
+            [CellType.BLANK, CellType.BLANK],
+        ]
+        assert mock_sheet.to_python.call_count == 1
+
+    def test_range_reads_match_cells_on_offset_sheet(self, calamine: CalamineAdapter) -> None:
+        """Range reads agree with read_cells/read_used_range when data starts at C2."""
+        mock_wb = MagicMock()
+        mock_sheet = MagicMock()
+        mock_sheet.to_python.return_value = [[1, 2], ["", "x"]]
+        mock_sheet.start = (1, 2)
+        mock_wb.get_sheet_by_name.return_value = mock_sheet
+        grid = calamine.read_range_values(mock_wb, "S1", "B1:E4")
+        coords = [(r, c) for r in range(4) for c in range(1, 5)]
+        assert [v for row in grid for v in row] == calamine.read_cells(mock_wb, "S1", coords)
+        used, bounds = calamine.read_used_range(mock_wb, "S1")
+        assert bounds == (1, 2, 2, 3)
+        assert calamine.read_range_values(mock_wb, "S1", "C2:D3") == used
+        assert mock_sheet.to_python.call_count == 1
+
+    def test_cell_reads_offset_by_sheet_start(self, calamine: CalamineAdapter) -> None:
+        """to_python() trims leading blanks, so refs are shifted by sheet.start."""
+        mock_wb = MagicMock()
+        mock_sheet = MagicMock()
+        mock_sheet.to_python.return_value = [[1, ""], ["", "x"]]
+        mock_sheet.start = (1, 1)
+        mock_wb.get_sheet_by_name.return_value = mock_sheet
+        refs = ("A1", "B2", "C2", "C3", "D4")
+        got = [calamine.read_cell_value(mock_wb, "S1", ref) for ref in refs]
+        assert [v.value for v in got] == [None, 1, None, "x", None]
+        assert got[1:4] == calamine.read_cells(mock_wb, "S1", [(1, 1), (1, 2), (2, 2)])
+
+    def test_empty_sheet_reads_blank(self, calamine: CalamineAdapter) -> None:
+        mock_wb = MagicMock()
+        mock_wb.get_sheet_by_name.return_value.start = None
+        mock_wb.get_sheet_by_name.return_value.to_python.return_value = []
+        assert calamine.read_cell_value(mock_wb, "S1", "A1").type == CellType.BLANK
+
+    def test_blank_results_are_shared(self, calamine: CalamineAdapter) -> None:
+        """Blank cells and the format/border stubs reuse module constants."""
+        mock_wb = MagicMock()
+        mock_wb.get_sheet_by_name.return_value.start = (0, 0)
+        mock_wb.get_sheet_by_name.return_value.to_python.return_value = [[None, ""]]
+        first = calamine.read_cell_value(mock_wb, "S1", "A1")
+        assert first.type == CellType.BLANK
+        assert calamine.read_cell_value(mock_wb, "S1", "B1") is first
+        assert calamine.read_cell_value(mock_wb, "S1", "Z99") is first
+        fmt = calamine.read_cell_format(mock_wb, "S1", "A1")
+        assert calamine.read_cell_format(mock_wb, "S1", "B1") is fmt
+
+    def test_sheet_converted_once_until_close(self, calamine: CalamineAdapter) -> None:
+        """Repeated reads reuse one to_python() grid; close drops it."""
+        mock_wb = MagicMock()
+        mock_sheet = MagicMock()
+        mock_sheet.to_python.return_value = [[1, 2], [3, 4]]
+        mock_sheet.start = (0, 0)
+        mock_wb.get_sheet_by_name.return_value = mock_sheet
+        assert calamine.read_cell_value(mock_wb, "S1", "A1").value == 1
+        assert calamine.read_cell_value(mock_wb, "S1", "B2").value == 4
+        assert calamine.read_sheet_values_raw(mock_wb, "S1") == [[1, 2], [3, 4]]
+        assert mock_sheet.to_python.call_count == 1
+
+        calamine.close_workbook(mock_wb)
+        calamine.read_cell_value(mock_wb, "S1", "A1")
+        assert mock_sheet.to_python.call_count == 2
+
 
 # ═════════════════════════════════════════════════
 # Pyexcel: forced cell type paths via mocking
@@ -1442,6 +1629,12 @@ class TestPyexcelMockedCellTypes:
         assert v.type == CellType.FORMULA
         assert v.formula == "=SUM(A1:A10)"
 
+    def test_getting_data_is_error(self, pyexcel_adapter: PyexcelAdapter) -> None:
+        """#GETTING_DATA has no trailing '!' but is still an error code."""
+        wb = self._make_mock_wb("#GETTING_DATA")
+        v = pyexcel_adapter.read_cell_value(wb, "S1", "A1")
+        assert v == CellValue(type=CellType.ERROR, value="#GETTING_DATA")
+
     def test_fallback_type(self, pyexcel_adapter: PyexcelAdapter) -> None:
         """Line 134: non-standard type fallback."""
         wb = self._make_mock_wb(complex(3, 4))
@@ -1687,6 +1880,95 @@ class TestOpenpyxlMockedEdges:
         assert v.type == CellType.DATE
         assert v.value == date(2024, 7, 4)
 
+    def test_exact_and_subclassed_scalars(self, opxl: OpenpyxlAdapter) -> None:
+        """The type() fast path and the isinstance fallback agree."""
+
+        class Num(int):
+            pass
+
+        class Stamp(datetime):
+            pass
+
+        expected: list[tuple[Any, CellType]] = [
+            (3, CellType.NUMBER),
+            (Num(3), CellType.NUMBER),
+            (True, CellType.BOOLEAN),
+            ("plain", CellType.STRING),
+            ("#N/A", CellType.ERROR),
+            (datetime(2024, 1, 2), CellType.DATE),
+            (datetime(2024, 1, 2, 0, 0, 0, 1), CellType.DATETIME),
+            (Stamp(2024, 1, 2), CellType.DATE),
+            (Stamp(2024, 1, 2, 9), CellType.DATETIME),
+        ]
+        for value, cell_type in expected:
+            cell = MagicMock()
+            cell.value = value
+            cell.data_type = "n"
+            ws = MagicMock()
+            ws.__getitem__ = MagicMock(return_value=cell)
+            wb = MagicMock()
+            wb.__getitem__ = MagicMock(return_value=ws)
+            assert opxl.read_cell_value(wb, "S1", "A1").type == cell_type, value
+
+    def test_color_to_hex_fast_path_matches_duck_typed(self) -> None:
+        """openpyxl Color objects and look-alike objects convert the same way."""
+        from openpyxl.styles.colors import Color
+
+        from excelbench.harness.adapters.openpyxl_adapter import _openpyxl_color_to_hex
+
+        cases: list[tuple[Color, str | None]] = [
+            (Color(rgb="FF112233"), "#112233"),
+            (Color(rgb="112233"), "#112233"),
+            (Color(indexed=5), "#FFFF00"),
+            (Color(indexed=999), None),
+            (Color(theme=1), None),
+        ]
+        for color, expected in cases:
+            assert _openpyxl_color_to_hex(color) == expected
+            duck = MagicMock(spec=["rgb", "indexed"])
+            duck.rgb = color.rgb if color.type == "rgb" else None
+            duck.indexed = color.indexed if color.type == "indexed" else None
+            assert _openpyxl_color_to_hex(duck) == expected
+
+    def test_cell_format_memo_tracks_restyles(self, opxl: OpenpyxlAdapter) -> None:
+        """Cached formats are keyed by style ids, so restyling a cell is seen."""
+        from openpyxl.styles import Font
+
+        from excelbench.harness.adapters.openpyxl_adapter import _convert_cell_format
+
+        wb = _openpyxl.Workbook()
+        ws = wb.active
+        assert ws is not None
+        ws.title = "S1"
+        for ref in ("A1", "B2"):
+            ws[ref].font = Font(bold=True, color="FF0000")
+
+        first = opxl.read_cell_format(wb, "S1", "A1")
+        assert first == _convert_cell_format(ws["A1"])
+        assert opxl.read_cell_format(wb, "S1", "B2") is first
+
+        ws["B2"].font = Font(italic=True)
+        restyled = opxl.read_cell_format(wb, "S1", "B2")
+        assert restyled.italic is True and restyled.bold is None
+        assert opxl.read_cell_format(wb, "S1", "A1") is first
+
+    def test_write_path_shares_color_objects(self, opxl: OpenpyxlAdapter) -> None:
+        """Repeated colors reuse one Color/PatternFill/Side and still round-trip."""
+        wb = opxl.create_workbook()
+        opxl.add_sheet(wb, "S1")
+        fmt = CellFormat(font_color="#FF0000", bg_color="#00FF00")
+        edge = BorderEdge(style=BorderStyle.THIN, color="#0000FF")
+        for ref in ("A1", "B2"):
+            opxl.write_cell_format(wb, "S1", ref, fmt)
+            opxl.write_cell_border(wb, "S1", ref, BorderInfo(top=edge))
+
+        ws = wb["S1"]
+        assert ws["A1"].fill.fgColor is ws["B2"].fill.fgColor
+        assert ws["A1"].border.top.color is ws["B2"].border.top.color
+        read = opxl.read_cell_format(wb, "S1", "B2")
+        assert (read.font_color, read.bg_color) == ("#FF0000", "#00FF00")
+        assert opxl.read_cell_border(wb, "S1", "B2").top == edge
+
     def test_formula_without_equals(self, opxl: OpenpyxlAdapter) -> None:
         """Line 133: formula str without '=' prefix → prepend '='."""
         wb = MagicMock()
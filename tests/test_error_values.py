@@ -0,0 +1,17 @@
+"""Tests for the shared Excel error-string detection."""
+
+from __future__ import annotations
+
+import pytest
+
+from excelbench.harness.adapters.error_values import ERROR_LITERALS, is_error_string
+
+
+@pytest.mark.parametrize("value", sorted(ERROR_LITERALS) + ["#SPILL!", "#CALC!"])
+def test_error_codes(value: str) -> None:
+    assert is_error_string(value)
+
+
+@pytest.mark.parametrize("value", ["", "#", "#hashtag", "N/A", "=A1", "100%!"])
+def test_plain_strings(value: str) -> None:
+    assert not is_error_string(value)
@@ -14,6 +14,7 @@ from excelbench.models import (
     CellFormat,
     CellType,
     CellValue,
+    OpenOptions,
 )
 
 
@@ -130,6 +131,21 @@ class TestPandasReadCellValue:
         assert cv.type in (CellType.ERROR, CellType.STRING, CellType.BLANK)
         pdxl.close_workbook(wb)
 
+    def test_getting_data_string_is_error(
+        self, pdxl: PandasAdapter, opxl: OpenpyxlAdapter, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "getting_data.xlsx"
+        wb = opxl.create_workbook()
+        opxl.add_sheet(wb, "S1")
+        opxl.write_cell_value(
+            wb, "S1", "A1", CellValue(type=CellType.STRING, value="#GETTING_DATA")
+        )
+        opxl.save_workbook(wb, path)
+        wb = pdxl.open_workbook(path)
+        cv = pdxl.read_cell_value(wb, "S1", "A1")
+        pdxl.close_workbook(wb)
+        assert cv == CellValue(type=CellType.ERROR, value="#GETTING_DATA")
+
     def test_blank_out_of_bounds(
         self, pdxl: PandasAdapter, opxl: OpenpyxlAdapter, tmp_path: Path
     ) -> None:
@@ -170,6 +186,22 @@ class TestPandasReadCellValue:
 # ═════════════════════════════════════════════════════════════════════════
 
 
+class TestPandasOpenOptions:
+    def test_sheets_limits_loaded_frames(
+        self, pdxl: PandasAdapter, opxl: OpenpyxlAdapter, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "two_sheets.xlsx"
+        wb = opxl.create_workbook()
+        opxl.add_sheet(wb, "S1")
+        opxl.add_sheet(wb, "S2")
+        opxl.write_cell_value(wb, "S2", "A1", CellValue(type=CellType.STRING, value="only"))
+        opxl.save_workbook(wb, path)
+
+        book = pdxl.open_workbook(path, OpenOptions(sheets=frozenset({"S2"})))
+        assert pdxl.get_sheet_names(book) == ["S2"]
+        assert pdxl.read_cell_value(book, "S2", "A1").value == "only"
+
+
 class TestPandasReadStubs:
     """Tier-2 reads all return empty."""
 
@@ -1,6 +1,8 @@
 from datetime import UTC, datetime
 from pathlib import Path
+from unittest.mock import MagicMock
 
+import pytest
 from openpyxl import Workbook
 from openpyxl.styles import Border, PatternFill, Side
 
@@ -11,7 +13,14 @@ from excelbench.harness.adapters.tablib_adapter import TablibAdapter
 from excelbench.models import Importance, Manifest
 from excelbench.models import TestCase as BenchCase
 from excelbench.models import TestFile as BenchFile
-from excelbench.perf.runner import run_perf
+from excelbench.perf.runner import (
+    STREAMING_WRITE_MIN_CELLS,
+    _fixture_shared_strings,
+    _run_workload_write,
+    _use_streaming_write,
+    _workload_open_options,
+    run_perf,
+)
 
 
 def test_perf_workload_cell_values_records_op_count(tmp_path: Path) -> None:
@@ -652,3 +661,146 @@ def test_perf_workload_standardizes_size_and_phase_attribution(tmp_path: Path) -
     assert read_phase is not None and read_phase["parse"] > 0
     assert write_phase is not None and write_phase["write"] > 0
     assert write_phase["verify"] == 0.0
+
+
+def test_perf_workload_bulk_write_streaming(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    (suite / "tier0").mkdir(parents=True, exist_ok=True)
+
+    workload = {
+        "scenario": "bulk_write_stream",
+        "op": "bulk_write_grid",
+        "operations": ["write"],
+        "sheet": "S1",
+        "range": "B2:C3",
+        "streaming": True,
+    }
+    manifest = Manifest(
+        generated_at=datetime.now(UTC),
+        excel_version="test",
+        generator_version="test",
+        file_format="xlsx",
+        files=[
+            BenchFile(
+                path="tier0/does_not_matter.xlsx",
+                feature="bulk_write_stream",
+                tier=0,
+                file_format="xlsx",
+                test_cases=[
+                    BenchCase(
+                        id="bulk_write_stream",
+                        label="Throughput: streaming bulk write",
+                        row=1,
+                        expected={"workload": workload},
+                        importance=Importance.BASIC,
+                    )
+                ],
+            )
+        ],
+    )
+    write_manifest(manifest, suite / "manifest.json")
+
+    results = run_perf(suite, adapters=[OpenpyxlAdapter()], warmup=0, iters=1, breakdown=True)
+
+    write = results.results[0].perf["write"]
+    assert write is not None
+    assert write.op_count == 4
+    assert write.breakdown_ms is not None and "save" in write.breakdown_ms
+
+
+def test_use_streaming_write_thresholds() -> None:
+    adapter = OpenpyxlAdapter()
+    grid = {"op": "bulk_write_grid"}
+    assert _use_streaming_write(adapter, grid, STREAMING_WRITE_MIN_CELLS) is True
+    assert _use_streaming_write(adapter, grid, STREAMING_WRITE_MIN_CELLS - 1) is False
+    assert _use_streaming_write(adapter, {**grid, "streaming": False}, 10**9) is False
+    assert _use_streaming_write(PandasAdapter(), grid, 10**9) is False
+    with pytest.raises(ValueError, match="Streaming write not supported"):
+        _use_streaming_write(adapter, {"op": "cell_value", "streaming": True}, 1)
+
+
+def test_workload_open_options_skip_styles_for_value_reads() -> None:
+    values = _workload_open_options({"op": "bulk_sheet_values", "sheet": "Data"})
+    assert values.sheets == frozenset({"Data"})
+    assert values.load_styles is False
+    assert _workload_open_options({}).load_styles is False
+    assert _workload_open_options({"op": "bg_color"}).load_styles is True
+
+
+def test_workload_open_options_stream_only_whole_sheet_reads() -> None:
+    assert _workload_open_options({"op": "bulk_sheet_values"}).read_only is True
+    assert _workload_open_options({"op": "bulk_sheet_values_raw"}).read_only is True
+    assert _workload_open_options({"op": "cell_value"}).read_only is False
+    assert _workload_open_options({"op": "bg_color"}).read_only is False
+
+
+def test_perf_workload_save_to_memory(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    (suite / "tier0").mkdir(parents=True, exist_ok=True)
+
+    workload = {
+        "scenario": "cell_values_in_memory",
+        "op": "cell_value",
+        "operations": ["write"],
+        "sheet": "S1",
+        "range": "A1:B5",
+        "save_to": "memory",
+    }
+    manifest = Manifest(
+        generated_at=datetime.now(UTC),
+        excel_version="test",
+        generator_version="test",
+        file_format="xlsx",
+        files=[
+            BenchFile(
+                path="tier0/does_not_matter.xlsx",
+                feature="cell_values_in_memory",
+                tier=0,
+                file_format="xlsx",
+                test_cases=[
+                    BenchCase(
+                        id="cell_values_in_memory",
+                        label="Throughput: in-memory save",
+                        row=1,
+                        expected={"workload": workload},
+                        importance=Importance.BASIC,
+                    )
+                ],
+            )
+        ],
+    )
+    write_manifest(manifest, suite / "manifest.json")
+
+    results = run_perf(suite, adapters=[OpenpyxlAdapter()], warmup=0, iters=1, breakdown=True)
+
+    write = results.results[0].perf["write"]
+    assert results.results[0].notes is None
+    assert write is not None and write.op_count == 10
+    assert write.breakdown_ms is not None and "save" in write.breakdown_ms
+
+
+@pytest.mark.parametrize(
+    ("op", "label"), [("bg_color", "Color"), ("alignment", "Align"), ("border", "Border")]
+)
+def test_string_write_workloads_register_their_label(op: str, label: str) -> None:
+    adapter = MagicMock()
+    adapter.bind_writers.return_value = (MagicMock(), MagicMock(), MagicMock())
+    _run_workload_write(adapter=adapter, workbook="wb", workload={"op": op}, cells=["A1", "A2"])
+    adapter.register_shared_strings.assert_called_once_with("wb", (label,))
+
+
+def test_fixture_shared_strings_lists_plain_string_cases() -> None:
+    def case(case_id: str, expected: dict[str, object]) -> BenchCase:
+        return BenchCase(id=case_id, label=case_id, row=1, expected=expected)
+
+    cases = [
+        case("s", {"type": "string", "value": "alpha"}),
+        case("implicit", {"value": "beta"}),
+        case("empty", {"type": "string", "value": ""}),
+        case("n", {"type": "number", "value": 1}),
+        case("e", {"type": "error", "value": "#N/A"}),
+    ]
+    values = BenchFile(path="x.xlsx", feature="cell_values", tier=0, test_cases=cases)
+    other = BenchFile(path="y.xlsx", feature="alignment", tier=0, test_cases=cases)
+    assert _fixture_shared_strings(values) == ["alpha", "beta"]
+    assert _fixture_shared_strings(other) == []
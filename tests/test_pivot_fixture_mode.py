@@ -1,6 +1,6 @@
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from openpyxl import Workbook
 from pytest import MonkeyPatch
@@ -16,6 +16,7 @@ from excelbench.models import (
     Importance,
     LibraryInfo,
     Manifest,
+    OpenOptions,
 )
 from excelbench.models import (
     TestCase as BenchCase,
@@ -40,11 +41,9 @@ class StubPivotAdapter(ReadOnlyAdapter):
             capabilities={"read"},
         )
 
-    @property
-    def supported_read_extensions(self) -> set[str]:
-        return {".xlsx"}
+    supported_read_extensions: ClassVar[frozenset[str]] = frozenset({".xlsx"})
 
-    def open_workbook(self, path: Path) -> JSONDict:
+    def open_workbook(self, path: Path, opts: OpenOptions = OpenOptions()) -> JSONDict:
         return {"path": str(path)}
 
     def close_workbook(self, workbook: Any) -> None:
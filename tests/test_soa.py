@@ -0,0 +1,248 @@
+"""Tests for the structure-of-arrays bulk read helpers."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from excelbench.harness.adapters.openpyxl_adapter import OpenpyxlAdapter
+from excelbench.harness.adapters.soa import (
+    SOA_BOOL,
+    SOA_DATE,
+    SOA_EMPTY,
+    SOA_ERR,
+    SOA_FORMULA,
+    SOA_NUM,
+    SOA_STR,
+    cells_to_soa,
+    range_origin,
+    raw_to_soa,
+    soa_mismatch_indices,
+)
+from excelbench.models import (
+    CellType,
+    CellValue,
+    DiagnosticCategory,
+    OpenOptions,
+    OperationType,
+)
+
+
+def _grid() -> list[list[CellValue]]:
+    return [
+        [CellValue(type=CellType.NUMBER, value=1.5), CellValue(type=CellType.STRING, value="x")],
+        [CellValue(type=CellType.BOOLEAN, value=True), CellValue(type=CellType.BLANK)],
+        [
+            CellValue(type=CellType.ERROR, value="#DIV/0!"),
+            CellValue(type=CellType.FORMULA, value="=A1", formula="=A1"),
+        ],
+        [CellValue(type=CellType.DATE, value=date(2024, 1, 2)), CellValue(type=CellType.BLANK)],
+    ]
+
+
+def test_cells_to_soa_encodes_columns() -> None:
+    block = cells_to_soa(_grid(), origin=(4, 1))
+    assert block["dtype"].tolist() == [
+        SOA_NUM,
+        SOA_STR,
+        SOA_BOOL,
+        SOA_EMPTY,
+        SOA_ERR,
+        SOA_FORMULA,
+        SOA_DATE,
+        SOA_EMPTY,
+    ]
+    assert block["num"][0] == 1.5
+    assert block["num"][2] == 1.0
+    assert block["str"][1] == "x"
+    assert block["str"][4] == "#DIV/0!"
+    assert block["str"][6] == "2024-01-02"
+    assert block["formula"][5] == "=A1"
+    assert block["row"].tolist() == [4, 4, 5, 5, 6, 6, 7, 7]
+    assert block["col"].tolist() == [1, 2, 1, 2, 1, 2, 1, 2]
+
+
+def test_soa_mismatch_indices() -> None:
+    expected = cells_to_soa(_grid())
+    changed = _grid()
+    changed[0][0] = CellValue(type=CellType.NUMBER, value=2.0)
+    changed[1][1] = CellValue(type=CellType.STRING, value="")
+    actual = cells_to_soa(changed)
+    assert soa_mismatch_indices(expected, actual).tolist() == [0, 3]
+    assert soa_mismatch_indices(expected, cells_to_soa(_grid())).tolist() == []
+
+
+def test_soa_mismatch_indices_rejects_size_mismatch() -> None:
+    with pytest.raises(ValueError, match="differ in size"):
+        soa_mismatch_indices(cells_to_soa(_grid()), cells_to_soa(_grid()[:1]))
+
+
+@pytest.mark.parametrize(
+    ("cell_range", "origin"),
+    [(None, (0, 0)), ("B3", (2, 1)), ("$C$5:A2", (1, 0)), ("A1:D4", (0, 0))],
+)
+def test_range_origin(cell_range: str | None, origin: tuple[int, int]) -> None:
+    assert range_origin(cell_range) == origin
+
+
+def test_adapter_soa_read_and_diagnostics(tmp_path: Path) -> None:
+    adapter = OpenpyxlAdapter()
+    wb = adapter.create_workbook()
+    adapter.add_sheet(wb, "S")
+    adapter.write_cell_value(wb, "S", "B2", CellValue(type=CellType.NUMBER, value=3))
+    adapter.write_cell_value(wb, "S", "C2", CellValue(type=CellType.STRING, value="hi"))
+    path = tmp_path / "soa.xlsx"
+    adapter.save_workbook(wb, path)
+
+    wb = adapter.open_workbook(path)
+    try:
+        actual = adapter.read_sheet_cells_soa(wb, "S", "B2:C2")
+    finally:
+        adapter.close_workbook(wb)
+
+    assert actual["dtype"].tolist() == [SOA_NUM, SOA_STR]
+    expected = cells_to_soa(
+        [[CellValue(type=CellType.NUMBER, value=3), CellValue(type=CellType.STRING, value="ho")]],
+        origin=(1, 1),
+    )
+    diags = adapter.build_soa_mismatch_diagnostics(
+        feature="cell_values",
+        operation=OperationType.READ,
+        test_case_id="soa",
+        expected=expected,
+        actual=actual,
+        sheet="S",
+    )
+    assert len(diags) == 1
+    assert diags[0].category == DiagnosticCategory.DATA_MISMATCH
+    assert diags[0].location.cell == "C2"
+
+
+def test_cells_to_soa_shares_strings_through_pool() -> None:
+    pool: dict[str, str] = {}
+    a = "".join(["sha", "red"])
+    b = "".join(["sh", "ared"])
+    assert a is not b
+    left = cells_to_soa([[CellValue(type=CellType.STRING, value=a)]], pool=pool)
+    right = cells_to_soa(
+        [[CellValue(type=CellType.STRING, value=b), CellValue(type=CellType.STRING, value=a)]],
+        pool=pool,
+    )
+    assert left["str"][0] is right["str"][0] is right["str"][1]
+    assert pool == {"shared": "shared"}
+
+
+def test_raw_to_soa_matches_converted_grid() -> None:
+    raw = [[1.5, "x", None], [True, "", 7], ["#DIV/0!", "=A1", date(2024, 1, 2)]]
+
+    def convert(v: object) -> CellValue:
+        if v is None or v == "":
+            return CellValue(type=CellType.BLANK)
+        if isinstance(v, bool):
+            return CellValue(type=CellType.BOOLEAN, value=v)
+        if isinstance(v, (int, float)):
+            return CellValue(type=CellType.NUMBER, value=v)
+        if isinstance(v, date):
+            return CellValue(type=CellType.DATE, value=v)
+        assert isinstance(v, str)
+        if v.startswith("#"):
+            return CellValue(type=CellType.ERROR, value=v)
+        if v.startswith("="):
+            return CellValue(type=CellType.FORMULA, value=v, formula=v)
+        return CellValue(type=CellType.STRING, value=v)
+
+    expected = cells_to_soa([[convert(v) for v in row] for row in raw], origin=(2, 3))
+    actual = raw_to_soa(raw, convert, origin=(2, 3))
+    assert soa_mismatch_indices(expected, actual).tolist() == []
+    for key in ("dtype", "row", "col"):
+        assert actual[key].dtype == expected[key].dtype
+        assert actual[key].tolist() == expected[key].tolist()
+
+
+def test_calamine_soa_matches_wrapped_read(tmp_path: Path) -> None:
+    pytest.importorskip("python_calamine")
+    from excelbench.harness.adapters.calamine_adapter import CalamineAdapter
+
+    writer = OpenpyxlAdapter()
+    wb = writer.create_workbook()
+    writer.add_sheet(wb, "S")
+    writer.write_cell_value(wb, "S", "A1", CellValue(type=CellType.NUMBER, value=3))
+    writer.write_cell_value(wb, "S", "B1", CellValue(type=CellType.STRING, value="hi"))
+    writer.write_cell_value(wb, "S", "A2", CellValue(type=CellType.BOOLEAN, value=True))
+    path = tmp_path / "soa.xlsx"
+    writer.save_workbook(wb, path)
+
+    adapter = CalamineAdapter()
+    book = adapter.open_workbook(path)
+    try:
+        fast = adapter.read_sheet_cells_soa(book, "S", "A1:C3")
+        wrapped = cells_to_soa(adapter.read_sheet_values(book, "S", "A1:C3"))
+    finally:
+        adapter.close_workbook(book)
+    assert fast["dtype"].tolist() == [SOA_NUM, SOA_STR, SOA_EMPTY, SOA_BOOL] + [SOA_EMPTY] * 5
+    assert soa_mismatch_indices(wrapped, fast).tolist() == []
+
+
+@pytest.mark.parametrize("cell_range", [None, "B2:C3", "A1:D4"])
+def test_calamine_soa_coordinates_on_offset_sheet(tmp_path: Path, cell_range: str | None) -> None:
+    pytest.importorskip("python_calamine")
+    from excelbench.harness.adapters.calamine_adapter import CalamineAdapter
+
+    writer = OpenpyxlAdapter()
+    wb = writer.create_workbook()
+    writer.add_sheet(wb, "S")
+    writer.write_cell_value(wb, "S", "B2", CellValue(type=CellType.NUMBER, value=1))
+    writer.write_cell_value(wb, "S", "C3", CellValue(type=CellType.STRING, value="x"))
+    path = tmp_path / "offset.xlsx"
+    writer.save_workbook(wb, path)
+
+    adapter = CalamineAdapter()
+    book = adapter.open_workbook(path)
+    try:
+        soa = adapter.read_sheet_cells_soa(book, "S", cell_range)
+    finally:
+        adapter.close_workbook(book)
+    filled = {
+        (int(r), int(c)): int(d)
+        for r, c, d in zip(soa["row"], soa["col"], soa["dtype"])
+        if d != SOA_EMPTY
+    }
+    assert filled == {(1, 1): SOA_NUM, (2, 2): SOA_STR}
+
+
+@pytest.mark.parametrize("read_only", [False, True])
+@pytest.mark.parametrize("cell_range", [None, "B1:D3"])
+def test_openpyxl_soa_matches_wrapped_read(
+    tmp_path: Path, read_only: bool, cell_range: str | None
+) -> None:
+    adapter = OpenpyxlAdapter()
+    wb = adapter.create_workbook()
+    adapter.add_sheet(wb, "S")
+    cells = {
+        "A1": CellValue(type=CellType.NUMBER, value=3),
+        "B1": CellValue(type=CellType.STRING, value="hi"),
+        "C2": CellValue(type=CellType.BOOLEAN, value=True),
+        "B3": CellValue(type=CellType.FORMULA, value="=A1*2", formula="=A1*2"),
+        "D3": CellValue(type=CellType.DATE, value=date(2024, 1, 2)),
+        "C3": CellValue(type=CellType.ERROR, value="#N/A"),
+    }
+    for ref, value in cells.items():
+        adapter.write_cell_value(wb, "S", ref, value)
+    path = tmp_path / "soa_openpyxl.xlsx"
+    adapter.save_workbook(wb, path)
+
+    book = adapter.open_workbook(path, OpenOptions(read_only=read_only))
+    try:
+        fast = adapter.read_sheet_cells_soa(book, "S", cell_range)
+        wrapped = cells_to_soa(
+            adapter.read_sheet_values(book, "S", cell_range), range_origin(cell_range)
+        )
+    finally:
+        adapter.close_workbook(book)
+    assert len(fast["dtype"]) == (12 if cell_range is None else 9)
+    assert SOA_FORMULA in fast["dtype"].tolist()
+    assert soa_mismatch_indices(wrapped, fast).tolist() == []
+    assert fast["row"].tolist() == wrapped["row"].tolist()
+    assert fast["col"].tolist() == wrapped["col"].tolist()
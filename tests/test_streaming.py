@@ -0,0 +1,70 @@
+"""Tests for row-streaming writers."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+
+from excelbench.harness.adapters.openpyxl_adapter import OpenpyxlAdapter
+from excelbench.harness.adapters.pandas_adapter import PandasAdapter
+from excelbench.harness.adapters.xlsxwriter_adapter import XlsxwriterAdapter
+from excelbench.harness.adapters.xlsxwriter_constmem_adapter import XlsxwriterConstmemAdapter
+from excelbench.models import CellType, CellValue
+
+_STREAMING_ADAPTERS = [OpenpyxlAdapter, XlsxwriterAdapter, XlsxwriterConstmemAdapter]
+
+
+@pytest.mark.parametrize("adapter_cls", _STREAMING_ADAPTERS)
+def test_streaming_write_round_trip(
+    adapter_cls: type[OpenpyxlAdapter | XlsxwriterAdapter], tmp_path: Path
+) -> None:
+    adapter = adapter_cls()
+    assert adapter.can_stream_write() is True
+    path = tmp_path / "stream.xlsx"
+
+    with adapter.begin_streaming_write(path) as writer:
+        writer.add_sheet("Data")
+        writer.append_row(["a", 1, True])
+        writer.append_row([None, 2.5])
+        writer.append_row(
+            [
+                CellValue(type=CellType.DATE, value=date(2024, 1, 15)),
+                CellValue(type=CellType.FORMULA, value="=B1+B2", formula="=B1+B2"),
+            ]
+        )
+        writer.add_sheet("Second")
+        writer.append_row(["x"])
+
+    wb = load_workbook(path)
+    try:
+        assert wb.sheetnames == ["Data", "Second"]
+        ws = wb["Data"]
+        assert [c.value for c in ws[1]] == ["a", 1, True]
+        assert ws["A2"].value is None
+        assert ws["B2"].value == 2.5
+        assert ws["A3"].value.date() == date(2024, 1, 15)
+        assert ws["B3"].value == "=B1+B2"
+        assert wb["Second"]["A1"].value == "x"
+    finally:
+        wb.close()
+
+
+@pytest.mark.parametrize("adapter_cls", _STREAMING_ADAPTERS)
+def test_append_row_requires_sheet(
+    adapter_cls: type[OpenpyxlAdapter | XlsxwriterAdapter], tmp_path: Path
+) -> None:
+    writer = adapter_cls().begin_streaming_write(tmp_path / "s.xlsx")
+    with pytest.raises(ValueError, match="add_sheet"):
+        writer.append_row([1])
+    writer.add_sheet("S")
+    writer.close()
+
+
+def test_non_streaming_adapter_rejects_begin(tmp_path: Path) -> None:
+    adapter = PandasAdapter()
+    assert adapter.can_stream_write() is False
+    with pytest.raises(NotImplementedError, match="streaming"):
+        adapter.begin_streaming_write(tmp_path / "s.xlsx")
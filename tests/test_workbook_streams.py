@@ -0,0 +1,57 @@
+"""Tests for saving workbooks to, and opening them from, binary streams."""
+
+from __future__ import annotations
+
+import io
+from typing import Any
+
+import pytest
+
+from excelbench.harness.adapters.calamine_adapter import CalamineAdapter
+from excelbench.harness.adapters.openpyxl_adapter import OpenpyxlAdapter
+from excelbench.harness.adapters.pandas_adapter import PandasAdapter
+from excelbench.harness.adapters.xlsxwriter_adapter import XlsxwriterAdapter
+from excelbench.harness.adapters.xlsxwriter_constmem_adapter import XlsxwriterConstmemAdapter
+from excelbench.models import CellType, CellValue
+
+
+@pytest.mark.parametrize(
+    "adapter_cls",
+    [OpenpyxlAdapter, XlsxwriterAdapter, XlsxwriterConstmemAdapter, PandasAdapter],
+)
+def test_save_workbook_to_stream_round_trips(adapter_cls: Any) -> None:
+    writer = adapter_cls()
+    wb = writer.create_workbook()
+    writer.add_sheet(wb, "S1")
+    writer.write_cell_value(wb, "S1", "A1", CellValue(type=CellType.STRING, value="hi"))
+    writer.write_cell_value(wb, "S1", "B2", CellValue(type=CellType.NUMBER, value=3))
+    buf = io.BytesIO()
+
+    writer.save_workbook_to_stream(wb, buf)
+
+    assert buf.getvalue()[:4] == b"PK\x03\x04"
+    buf.seek(0)
+    reader = OpenpyxlAdapter()
+    rb = reader.open_workbook_from_stream(buf)
+    try:
+        assert reader.read_cell_value(rb, "S1", "A1").value == "hi"
+        assert reader.read_cell_value(rb, "S1", "B2").value == 3
+    finally:
+        reader.close_workbook(rb)
+
+
+def test_default_open_workbook_from_stream_spills_to_disk() -> None:
+    writer = OpenpyxlAdapter()
+    wb = writer.create_workbook()
+    writer.add_sheet(wb, "S1")
+    writer.write_cell_value(wb, "S1", "A1", CellValue(type=CellType.NUMBER, value=7))
+    buf = io.BytesIO()
+    writer.save_workbook_to_stream(wb, buf)
+    buf.seek(0)
+
+    reader = CalamineAdapter()
+    rb = reader.open_workbook_from_stream(buf)
+    try:
+        assert reader.read_cell_value(rb, "S1", "A1") == CellValue(type=CellType.NUMBER, value=7.0)
+    finally:
+        reader.close_workbook(rb)
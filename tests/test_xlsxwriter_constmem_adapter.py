@@ -42,7 +42,7 @@ class TestConstmemInfo:
         assert cm.info.version != "unknown"
 
     def test_capabilities(self, cm: XlsxwriterConstmemAdapter) -> None:
-        assert cm.info.capabilities == {"write"}
+        assert cm.info.capabilities == {"write", "stream_write"}
 
     def test_is_write_only(self, cm: XlsxwriterConstmemAdapter) -> None:
         assert cm.can_write()